@@ -5,13 +5,26 @@ from .job_analyzer import (
     analyze_jobs,
     get_score_breakdown,
     get_skill_gaps,
+    score_detailed,
+    ScoreResult,
     filter_candidates,
     enable_ml_scoring,
     is_ml_available,
     analyze_job_with_ml,
     record_score_feedback,
 )
+from .candidate_pool import CandidatePool
+from .columnar import filter_mask, filter_indices, language_scores
+from .normalized_cv import NormalizedCV, normalize_cv
+from .parallel import score_candidates_parallel
+from .ranking import rank_candidates, top_sectors
+from .subscore_cache import SubscoreCache
+from .score_matrix import score_matrix, score_breakdown_tensor
+from .personality_batch import PersonalityBatch, analyze_personality_batch
+from .personality_cache import PersonalityCache
 from .personality_analyzer import (
+    PersonalityReport,
+    personality_report,
     analyze_personality,
     get_personality_percentages,
     get_big_five_profile,
@@ -23,13 +36,32 @@ __all__ = [
     "analyze_jobs",
     "get_score_breakdown",
     "get_skill_gaps",
+    "score_detailed",
+    "ScoreResult",
     "filter_candidates",
     "enable_ml_scoring",
     "is_ml_available",
     "analyze_job_with_ml",
     "record_score_feedback",
+    "CandidatePool",
+    "filter_mask",
+    "filter_indices",
+    "language_scores",
+    "rank_candidates",
+    "top_sectors",
+    "score_candidates_parallel",
+    "NormalizedCV",
+    "normalize_cv",
+    "score_matrix",
+    "score_breakdown_tensor",
+    "SubscoreCache",
+    "PersonalityReport",
+    "personality_report",
     "analyze_personality",
     "get_personality_percentages",
     "get_big_five_profile",
     "get_career_suggestions",
+    "PersonalityBatch",
+    "analyze_personality_batch",
+    "PersonalityCache",
 ]
@@ -0,0 +1,196 @@
+"""
+Indexed candidate pool for fast filtering.
+
+filter_candidates() re-reads every CV on every call. A CandidatePool does that
+work once when the CVs are loaded and answers filter queries from indexes:
+
+- skills and languages: token -> candidate-id posting lists
+- nationality and sex: value -> candidate ids
+- age and total experience: sorted arrays searched with bisect
+
+Each filter becomes a set of candidate ids, and the filters are intersected.
+Results are the same as filter_candidates (including its substring matching),
+in the original order.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Optional
+
+from ..cv.dates import parse_date, tenure_years
+from .normalized_cv import _gather_skills_text, _safe_lower, _safe_str
+
+_LANGUAGE_FIELDS = ("MotherLanguage", "ModernLanguage1", "ModernLanguage2")
+
+_TOKEN_RE = re.compile(r"\S+")
+
+
+class CandidatePool:
+    """Loaded CVs with indexes for the filter criteria."""
+
+    def __init__(self, persons: list, today: Optional[date] = None):
+        """
+        Index a list of candidates.
+
+        Args:
+            persons: List of person dictionaries
+            today: Reference date for ages and ongoing jobs (default: today)
+        """
+        self.persons = list(persons)
+        today = today or date.today()
+
+        self._nationalities = {}
+        self._sexes = {}
+        skills_texts = []
+        language_texts = []
+        ages = []
+        experience = []
+
+        for index, person in enumerate(self.persons):
+            nationality = _safe_lower(person.get("Nationality", ""))
+            self._nationalities.setdefault(nationality, []).append(index)
+            sex = _safe_str(person.get("Sex", "")).upper()
+            self._sexes.setdefault(sex, []).append(index)
+
+            skills_texts.append(_gather_skills_text(person))
+            language_texts.append(
+                " ".join(
+                    _safe_lower(person.get(field, "")) for field in _LANGUAGE_FIELDS
+                )
+            )
+
+            birth_date = parse_date(person.get("DateOfBirth", ""))
+            if birth_date:
+                ages.append(((today - birth_date).days // 365, index))
+
+            total_years = 0.0
+            for i in range(1, 4):
+                dates = _safe_str(person.get(f"Dates{i}", ""))
+                total_years += tenure_years(dates, today)
+            experience.append((total_years, index))
+
+        self._skills = _TextIndex(skills_texts)
+        self._languages = _TextIndex(language_texts)
+
+        # Candidates without a parseable birth date pass any age filter
+        self._no_age = set(range(len(self.persons))) - {i for _, i in ages}
+        ages.sort()
+        self._ages = [age for age, _ in ages]
+        self._age_ids = [index for _, index in ages]
+        experience.sort()
+        self._experience = [years for years, _ in experience]
+        self._experience_ids = [index for _, index in experience]
+
+    def __len__(self) -> int:
+        return len(self.persons)
+
+    def filter(self, criteria: dict) -> list:
+        """
+        Select the candidates matching the criteria.
+
+        Args:
+            criteria: Filter criteria, as for filter_candidates
+
+        Returns:
+            Matching persons, in pool order
+        """
+        if not criteria:
+            return list(self.persons)
+
+        selections = []
+
+        if criteria.get("nationality"):
+            required = criteria["nationality"].lower().strip()
+            if required:
+                selections.append(
+                    {
+                        index
+                        for nationality, ids in self._nationalities.items()
+                        if required in nationality
+                        for index in ids
+                    }
+                )
+
+        if criteria.get("sex"):
+            required = criteria["sex"].upper().strip()
+            if required:
+                selections.append(set(self._sexes.get(required, ())))
+
+        if criteria.get("age_min") or criteria.get("age_max"):
+            low, high = 0, len(self._ages)
+            try:
+                if criteria.get("age_min"):
+                    low = bisect_left(self._ages, int(criteria["age_min"]))
+            except ValueError:
+                pass
+            try:
+                if criteria.get("age_max"):
+                    high = bisect_right(self._ages, int(criteria["age_max"]))
+            except ValueError:
+                pass
+            selections.append(self._no_age.union(self._age_ids[low:high]))
+
+        if criteria.get("experience_years"):
+            try:
+                min_years = float(criteria["experience_years"])
+            except ValueError:
+                pass
+            else:
+                low = bisect_left(self._experience, min_years)
+                selections.append(set(self._experience_ids[low:]))
+
+        for key, index in (("skills", self._skills), ("languages", self._languages)):
+            if criteria.get(key):
+                for term in criteria[key].split(","):
+                    term = term.strip().lower()
+                    if term:
+                        selections.append(index.containing(term))
+
+        if not selections:
+            return list(self.persons)
+
+        selections.sort(key=len)
+        selected = selections[0].intersection(*selections[1:])
+        return [self.persons[index] for index in sorted(selected)]
+
+
+class _TextIndex:
+    """Posting lists over the whitespace-separated tokens of some texts."""
+
+    def __init__(self, texts: list):
+        self._texts = texts
+        self._postings = {}
+        for index, text in enumerate(texts):
+            for token in set(_TOKEN_RE.findall(text)):
+                self._postings.setdefault(token, []).append(index)
+        self._cache = {}
+
+    def containing(self, term: str) -> set:
+        """Ids of the texts that contain term as a substring."""
+        ids = self._cache.get(term)
+        if ids is None:
+            ids = self._containing(term)
+            self._cache[term] = ids
+        return ids
+
+    def _containing(self, term: str) -> set:
+        pieces = _TOKEN_RE.findall(term)
+        if not pieces:
+            return {i for i, text in enumerate(self._texts) if term in text}
+
+        # A piece without whitespace can only occur inside a single token
+        ids = None
+        for piece in pieces:
+            piece_ids = {
+                index
+                for token, postings in self._postings.items()
+                if piece in token
+                for index in postings
+            }
+            ids = piece_ids if ids is None else ids & piece_ids
+
+        if pieces == [term]:
+            return ids
+        # Multi-word terms: check the phrase itself on the remaining texts
+        return {index for index in ids if term in self._texts[index]}
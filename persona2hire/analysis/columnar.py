@@ -0,0 +1,193 @@
+"""
+Filters and scores computed from a columnar CV corpus.
+
+These read only the columns they need from a ColumnarCorpus (see
+cv/columnar.py) and work on whole columns: categorical fields are evaluated
+once per distinct value and broadcast through their codes. Results equal
+filter_candidates and the languages component of get_score_breakdown for the
+same CVs.
+
+Requires numpy.
+"""
+
+from datetime import date
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+from ..cv.columnar import ColumnarCorpus
+from ..cv.dates import parse_date, tenure_years_array
+from .job_analyzer import (
+    _RAW_MAXIMUMS,
+    WEIGHTS,
+    _get_language_tier,
+    _get_level_multiplier,
+)
+from .normalized_cv import SKILLS_FIELDS, _safe_lower
+
+_LANGUAGE_FIELDS = ("MotherLanguage", "ModernLanguage1", "ModernLanguage2")
+
+
+def filter_mask(
+    corpus: ColumnarCorpus, criteria: dict, today: Optional[date] = None
+) -> "np.ndarray":
+    """
+    Evaluate filter criteria over a columnar corpus.
+
+    Args:
+        corpus: Columnar corpus
+        criteria: Filter criteria, as for filter_candidates
+        today: Reference date for ages and ongoing jobs (default: today)
+
+    Returns:
+        Boolean array, True for the CVs filter_candidates would keep
+    """
+    mask = np.ones(len(corpus), dtype=bool)
+    if not criteria:
+        return mask
+    today = today or date.today()
+
+    if criteria.get("nationality"):
+        required = criteria["nationality"].lower().strip()
+        if required:
+            mask &= corpus.column("Nationality").mask(
+                lambda value: required in _safe_lower(value)
+            )
+
+    if criteria.get("age_min") or criteria.get("age_max"):
+        mask &= _age_mask(corpus, criteria, today)
+
+    if criteria.get("sex"):
+        required = criteria["sex"].upper().strip()
+        if required:
+            mask &= corpus.column("Sex").mask(
+                lambda value: required == value.upper().strip()
+            )
+
+    if criteria.get("experience_years"):
+        try:
+            min_years = float(criteria["experience_years"])
+        except ValueError:
+            pass
+        else:
+            total_years = np.zeros(len(corpus))
+            for i in range(1, 4):
+                dates = corpus.column(f"Dates{i}").to_list()
+                total_years += tenure_years_array(dates, today)
+            mask &= total_years >= min_years
+
+    if criteria.get("skills"):
+        required = [
+            s.strip().lower() for s in criteria["skills"].split(",") if s.strip()
+        ]
+        if required:
+            columns = [corpus.column(field).to_list() for field in SKILLS_FIELDS]
+            texts = [
+                "".join(" " + _safe_lower(value) for value in values)
+                for values in zip(*columns)
+            ]
+            mask &= _contains_all(texts, required)
+
+    if criteria.get("languages"):
+        required = [
+            s.strip().lower() for s in criteria["languages"].split(",") if s.strip()
+        ]
+        if required:
+            columns = [
+                corpus.column(field).map(_safe_lower, dtype=object).tolist()
+                for field in _LANGUAGE_FIELDS
+            ]
+            texts = [" ".join(values) for values in zip(*columns)]
+            mask &= _contains_all(texts, required)
+
+    return mask
+
+
+def filter_indices(
+    corpus: ColumnarCorpus, criteria: dict, today: Optional[date] = None
+) -> "np.ndarray":
+    """
+    Find the positions of the CVs matching filter criteria.
+
+    Args:
+        corpus: Columnar corpus
+        criteria: Filter criteria, as for filter_candidates
+        today: Reference date for ages and ongoing jobs (default: today)
+
+    Returns:
+        Sorted integer array of matching positions
+    """
+    return np.flatnonzero(filter_mask(corpus, criteria, today))
+
+
+def language_scores(
+    corpus: ColumnarCorpus, weights: Optional[dict] = None
+) -> "np.ndarray":
+    """
+    Score the languages category of every CV.
+
+    Reads only the five language columns, each evaluated once per distinct
+    value.
+
+    Args:
+        corpus: Columnar corpus
+        weights: Category weights (default: WEIGHTS)
+
+    Returns:
+        float64 array equal to get_score_breakdown(...)["languages"]
+    """
+    # Same operations, in the same order, as _language_raw
+    raw = np.zeros(len(corpus))
+    raw += corpus.column("MotherLanguage").map(_tier, dtype=np.int64) * 1.0
+    for i in range(1, 3):
+        language = corpus.column(f"ModernLanguage{i}")
+        tiers = language.map(_tier, dtype=np.int64)
+        multipliers = corpus.column(f"Level{i}").map(_level_multiplier, dtype=float)
+        points = tiers * multipliers * 0.5
+        present = language.mask(lambda value: bool(_safe_lower(value)))
+        raw += np.where(present, points, 0.0)
+
+    max_score = (weights or WEIGHTS)["languages"]
+    return np.minimum(max_score, (raw / _RAW_MAXIMUMS["languages"]) * max_score)
+
+
+def _age_mask(corpus: ColumnarCorpus, criteria: dict, today: date) -> "np.ndarray":
+    """Age filter; CVs without a parseable birth date always pass."""
+    birth_dates = corpus.column("DateOfBirth").to_list()
+    ages = {}
+    for value in set(birth_dates):
+        birth_date = parse_date(value)
+        ages[value] = (today - birth_date).days // 365 if birth_date else None
+    known = np.array([ages[value] is not None for value in birth_dates], dtype=bool)
+    age = np.array([ages[value] or 0 for value in birth_dates], dtype=np.int64)
+
+    mask = np.ones(len(corpus), dtype=bool)
+    if criteria.get("age_min"):
+        try:
+            mask &= age >= int(criteria["age_min"])
+        except ValueError:
+            pass
+    if criteria.get("age_max"):
+        try:
+            mask &= age <= int(criteria["age_max"])
+        except ValueError:
+            pass
+    return mask | ~known
+
+
+def _contains_all(texts: list, terms: list) -> "np.ndarray":
+    """Which texts contain every term as a substring."""
+    return np.array([all(term in text for term in terms) for text in texts], dtype=bool)
+
+
+def _tier(value: str) -> int:
+    """Language tier of a raw field value."""
+    return _get_language_tier(_safe_lower(value))
+
+
+def _level_multiplier(value: str) -> float:
+    """Level multiplier of a raw field value."""
+    return _get_level_multiplier(_safe_lower(value))
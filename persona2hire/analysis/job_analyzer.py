@@ -17,13 +17,25 @@ can refine scores based on learned patterns.
 Limitations: Exact keyword matching only, no recency weighting, unverified claims.
 """
 
+from dataclasses import dataclass
 from datetime import date
 from typing import Optional
 
 from ..data.job_sectors import JobSectors
+from .keyword_matcher import sector_matcher
+from .normalized_cv import (
+    NormalizedCV,
+    normalize_cv,
+    raw_cv,
+    _gather_skills_text,
+    _get_qualification_level,
+    _get_seniority_level,
+    _safe_lower,
+    _safe_str,
+)
+from ..cv.dates import parse_date as _parse_date
+from ..cv.dates import tenure_years as _calculate_time_worked
 from ..data.constants import (
-    Functions,
-    Qualifications,
     Languages,
     LanguageLevels,
     Top50Universities,
@@ -43,6 +55,9 @@ WEIGHTS = {
     "additional": 5,  # Max 5 points for publications, awards, etc.
 }
 
+# Full raw points of the categories normalized against a point scale
+_RAW_MAXIMUMS = {"education": 25.0, "work_experience": 30.0, "languages": 12.0}
+
 # Bonus for personality match (added on top of base 100)
 PERSONALITY_BONUS = 5  # Max 5 bonus points for matching personality type
 
@@ -94,13 +109,16 @@ def is_ml_available() -> bool:
 
 
 def analyze_job(
-    person: dict, sector: str, personality_type: str = None, use_ml: bool = None
+    person: dict | NormalizedCV,
+    sector: str,
+    personality_type: str = None,
+    use_ml: bool = None,
 ) -> float:
     """
     Analyze a person's fit for a specific job sector.
 
     Args:
-        person: Dictionary containing CV data
+        person: Dictionary containing CV data (or a NormalizedCV)
         sector: Job sector key from JobSectors
         personality_type: Optional pre-calculated MBTI type (for efficiency)
         use_ml: Whether to use ML adjustment (None = use global setting)
@@ -111,24 +129,174 @@ def analyze_job(
     if sector not in JobSectors:
         return 0.0
 
-    # Calculate normalized scores for each category
-    education_score = _calculate_education_score(person, sector)
-    work_score = _calculate_work_score(person, sector)
-    skills_score = _calculate_skills_score(person, sector)
-    language_score = _calculate_language_score(person)
-    soft_skills_score = _calculate_soft_skills_score(person)
-    additional_score = _calculate_additional_score(person)
-
-    # Sum all scores (each is already weighted)
-    total_score = (
-        education_score
-        + work_score
-        + skills_score
-        + language_score
-        + soft_skills_score
-        + additional_score
+    cv = normalize_cv(person)
+    return _score_profile(_build_profile(cv), cv, sector, personality_type, use_ml)
+
+
+@dataclass(frozen=True)
+class ScoreResult:
+    """
+    Full result of scoring one person for one sector.
+
+    Category values are the weighted scores of get_score_breakdown; total
+    is the same score as analyze_job.
+    """
+
+    sector: str
+    total: float
+    education: float
+    work_experience: float
+    skills: float
+    languages: float
+    soft_skills: float
+    additional: float
+    personality_bonus: float
+    ml_adjustment: float  # Points added (or removed) by the ML model
+    matched_skills: tuple
+    missing_required: tuple
+    missing_extra: tuple
+
+    def as_breakdown(self) -> dict:
+        """Get the scores in the get_score_breakdown format."""
+        return {
+            "education": self.education,
+            "work_experience": self.work_experience,
+            "skills": self.skills,
+            "languages": self.languages,
+            "soft_skills": self.soft_skills,
+            "additional": self.additional,
+            "personality_bonus": self.personality_bonus,
+            "max_education": WEIGHTS["education"],
+            "max_work_experience": WEIGHTS["work_experience"],
+            "max_skills": WEIGHTS["skills"],
+            "max_languages": WEIGHTS["languages"],
+            "max_soft_skills": WEIGHTS["soft_skills"],
+            "max_additional": WEIGHTS["additional"],
+            "max_personality_bonus": PERSONALITY_BONUS,
+        }
+
+    def skill_gaps(self) -> dict:
+        """Get the skill gaps in the get_skill_gaps format."""
+        return {
+            "missing_required": list(self.missing_required),
+            "missing_extra": list(self.missing_extra),
+            "matched": list(self.matched_skills),
+        }
+
+
+def score_detailed(
+    person: dict | NormalizedCV,
+    sector: str,
+    personality_type: str = None,
+    use_ml: bool = None,
+) -> Optional[ScoreResult]:
+    """
+    Score a person for a sector, keeping every intermediate result.
+
+    One pass replaces analyze_job, get_score_breakdown and get_skill_gaps.
+
+    Args:
+        person: Dictionary containing CV data (or a NormalizedCV)
+        sector: Job sector key from JobSectors
+        personality_type: Optional pre-calculated MBTI type (for efficiency)
+        use_ml: Whether to use ML adjustment (None = use global setting)
+
+    Returns:
+        ScoreResult, or None if the sector is unknown
+    """
+    if sector not in JobSectors:
+        return None
+
+    cv = normalize_cv(person)
+    profile = _build_profile(cv)
+    hits = _skill_hits(profile.skills_text, sector)
+
+    education = _education_score(profile, sector)
+    work_experience = _work_score(profile, sector)
+    skills = _weighted_score("skills", _skills_raw(profile, sector, hits))
+
+    # Same summation order as _rule_score
+    rule_score = (
+        education
+        + work_experience
+        + skills
+        + profile.language_score
+        + profile.soft_skills_score
+        + profile.additional_score
+    )
+    personality_bonus, ml_adjustment, total_score = _finish_parts(
+        rule_score, cv, sector, personality_type, use_ml
+    )
+    matched, missing_required, missing_extra = _skill_gaps(sector, hits)
+
+    return ScoreResult(
+        sector=sector,
+        total=round(total_score, 1),
+        education=education,
+        work_experience=work_experience,
+        skills=skills,
+        languages=profile.language_score,
+        soft_skills=profile.soft_skills_score,
+        additional=profile.additional_score,
+        personality_bonus=personality_bonus,
+        ml_adjustment=ml_adjustment,
+        matched_skills=tuple(matched),
+        missing_required=tuple(missing_required),
+        missing_extra=tuple(missing_extra),
+    )
+
+
+def _score_profile(
+    profile: "_CVProfile",
+    person: NormalizedCV,
+    sector: str,
+    personality_type: str = None,
+    use_ml: bool = None,
+) -> float:
+    """
+    Score a pre-built CV profile against one sector.
+
+    Only the keyword-dependent categories are computed here; everything
+    else comes from the profile.
+    """
+    total_score = _rule_score(profile, sector)
+    return _finish_score(total_score, person, sector, personality_type, use_ml)
+
+
+def _rule_score(profile: "_CVProfile", sector: str) -> float:
+    """Sum of the six weighted categories (no bonus, ML or rounding)."""
+    return (
+        _education_score(profile, sector)
+        + _work_score(profile, sector)
+        + _skills_score(profile, sector)
+        + profile.language_score
+        + profile.soft_skills_score
+        + profile.additional_score
     )
 
+
+def _finish_score(
+    total_score: float,
+    person: dict | NormalizedCV,
+    sector: str,
+    personality_type: str = None,
+    use_ml: bool = None,
+) -> float:
+    """Add the personality bonus and ML adjustment to a rule score, then round."""
+    _, _, total_score = _finish_parts(
+        total_score, person, sector, personality_type, use_ml
+    )
+    return round(total_score, 1)
+
+
+def _finish_parts(
+    total_score: float,
+    person: dict | NormalizedCV,
+    sector: str,
+    personality_type: str = None,
+    use_ml: bool = None,
+) -> tuple:
+    """Get (personality bonus, ML adjustment, unrounded final score)."""
     # Add personality match bonus (innovative feature)
     if personality_type is None:
         personality_type = person.get("PersonalityTypeMB", "")
@@ -136,11 +304,19 @@ def analyze_job(
     total_score += personality_bonus
 
     # Apply ML adjustment if enabled
-    should_use_ml = use_ml if use_ml is not None else _ml_enabled
-    if should_use_ml and is_ml_available():
-        total_score = _apply_ml_adjustment(person, sector, total_score)
+    ml_adjustment = 0.0
+    if _should_use_ml(use_ml):
+        adjusted_score = _apply_ml_adjustment(person, sector, total_score)
+        ml_adjustment = adjusted_score - total_score
+        total_score = adjusted_score
 
-    return round(total_score, 1)
+    return personality_bonus, ml_adjustment, total_score
+
+
+def _should_use_ml(use_ml: bool = None) -> bool:
+    """Resolve the use_ml argument against the global setting."""
+    should_use_ml = use_ml if use_ml is not None else _ml_enabled
+    return should_use_ml and is_ml_available()
 
 
 def _apply_ml_adjustment(person: dict, sector: str, base_score: float) -> float:
@@ -228,7 +404,7 @@ def record_score_feedback(
 
     try:
         pipeline.record_feedback(
-            cv_data=person,
+            cv_data=raw_cv(person),
             sector=sector,
             predicted_score=predicted_score,
             actual_score=actual_score,
@@ -238,19 +414,22 @@ def record_score_feedback(
         pass
 
 
-def analyze_jobs(person: dict) -> list:
+def analyze_jobs(person: dict | NormalizedCV) -> list:
     """
     Analyze a person's fit for all job sectors.
 
     Args:
-        person: Dictionary containing CV data
+        person: Dictionary containing CV data (or a NormalizedCV)
 
     Returns:
         List of (sector, score) tuples sorted by score descending
     """
+    # The sector-independent part of the CV is only analyzed once
+    cv = normalize_cv(person)
+    profile = _build_profile(cv)
     job_list = []
     for sector in JobSectors:
-        score = analyze_job(person, sector)
+        score = _score_profile(profile, cv, sector)
         job_list.append((sector, score))
     job_list.sort(key=lambda x: x[1], reverse=True)
     return job_list
@@ -340,15 +519,7 @@ def filter_candidates(persons: list, criteria: dict) -> list:
                 s.strip().lower() for s in criteria["skills"].split(",") if s.strip()
             ]
             if required_skills:
-                person_skills = ""
-                for field in [
-                    "CommunicationSkills",
-                    "OrganizationalManagerialSkills",
-                    "JobRelatedSkills",
-                    "ComputerSkills",
-                    "OtherSkills",
-                ]:
-                    person_skills += " " + _safe_lower(person.get(field, ""))
+                person_skills = _gather_skills_text(person)
 
                 if not all(skill in person_skills for skill in required_skills):
                     include = False
@@ -372,12 +543,12 @@ def filter_candidates(persons: list, criteria: dict) -> list:
     return filtered
 
 
-def get_score_breakdown(person: dict, sector: str) -> dict:
+def get_score_breakdown(person: dict | NormalizedCV, sector: str) -> dict:
     """
     Get a detailed breakdown of the scoring for a person-sector match.
 
     Args:
-        person: Dictionary containing CV data
+        person: Dictionary containing CV data (or a NormalizedCV)
         sector: Job sector key from JobSectors
 
     Returns:
@@ -386,32 +557,15 @@ def get_score_breakdown(person: dict, sector: str) -> dict:
     if sector not in JobSectors:
         return {}
 
-    personality_type = person.get("PersonalityTypeMB", "")
-
-    return {
-        "education": _calculate_education_score(person, sector),
-        "work_experience": _calculate_work_score(person, sector),
-        "skills": _calculate_skills_score(person, sector),
-        "languages": _calculate_language_score(person),
-        "soft_skills": _calculate_soft_skills_score(person),
-        "additional": _calculate_additional_score(person),
-        "personality_bonus": _calculate_personality_bonus(personality_type, sector),
-        "max_education": WEIGHTS["education"],
-        "max_work_experience": WEIGHTS["work_experience"],
-        "max_skills": WEIGHTS["skills"],
-        "max_languages": WEIGHTS["languages"],
-        "max_soft_skills": WEIGHTS["soft_skills"],
-        "max_additional": WEIGHTS["additional"],
-        "max_personality_bonus": PERSONALITY_BONUS,
-    }
+    return score_detailed(person, sector, use_ml=False).as_breakdown()
 
 
-def get_skill_gaps(person: dict, sector: str) -> dict:
+def get_skill_gaps(person: dict | NormalizedCV, sector: str) -> dict:
     """
     Identify missing skills for a job sector (skill gap analysis).
 
     Args:
-        person: Dictionary containing CV data
+        person: Dictionary containing CV data (or a NormalizedCV)
         sector: Job sector key from JobSectors
 
     Returns:
@@ -420,42 +574,44 @@ def get_skill_gaps(person: dict, sector: str) -> dict:
     if sector not in JobSectors:
         return {"missing_required": [], "missing_extra": [], "matched": []}
 
-    sector_data = JobSectors[sector]
-    required_skills = sector_data.get("Skills", [])
-    extra_skills = sector_data.get("ExtraSkills", [])
+    hits = _skill_hits(normalize_cv(person).skills_text, sector)
+    matched, missing_required, missing_extra = _skill_gaps(sector, hits)
+    return {
+        "missing_required": missing_required,
+        "missing_extra": missing_extra,
+        "matched": matched,
+    }
+
+
+def _skill_hits(skills_text: str, sector: str) -> tuple:
+    """Get the (required, extra) sector skills found in the skills text."""
+    required_hits = sector_matcher(sector, "Skills").find(skills_text)
+    extra_hits = sector_matcher(sector, "ExtraSkills").find(skills_text)
+    return required_hits, extra_hits
 
-    # Gather person's skills
-    person_skills_text = ""
-    for field in [
-        "CommunicationSkills",
-        "OrganizationalManagerialSkills",
-        "JobRelatedSkills",
-        "ComputerSkills",
-        "OtherSkills",
-    ]:
-        person_skills_text += " " + _safe_lower(person.get(field, ""))
+
+def _skill_gaps(sector: str, hits: tuple) -> tuple:
+    """Split a sector's skill lists into (matched, missing required, missing extra)."""
+    sector_data = JobSectors[sector]
+    required_hits, extra_hits = hits
 
     missing_required = []
     missing_extra = []
     matched = []
 
-    for skill in required_skills:
-        if skill.lower() in person_skills_text:
+    for skill in sector_data.get("Skills", []):
+        if skill.lower() in required_hits:
             matched.append(skill)
         else:
             missing_required.append(skill)
 
-    for skill in extra_skills:
-        if skill.lower() in person_skills_text:
+    for skill in sector_data.get("ExtraSkills", []):
+        if skill.lower() in extra_hits:
             matched.append(skill)
         else:
             missing_extra.append(skill)
 
-    return {
-        "missing_required": missing_required,
-        "missing_extra": missing_extra,
-        "matched": matched,
-    }
+    return matched, missing_required, missing_extra
 
 
 def _calculate_personality_bonus(personality_type: str, sector: str) -> float:
@@ -483,7 +639,85 @@ def _calculate_personality_bonus(personality_type: str, sector: str) -> float:
     return 0.0
 
 
-def _calculate_education_score(person: dict, sector: str) -> float:
+def _weighted_score(category: str, raw, weights: dict = None) -> float:
+    """
+    Scale a raw category value (from the _*_raw functions) to its score.
+
+    Args:
+        category: Category key from WEIGHTS
+        raw: Unweighted category value
+        weights: Category weights (default: WEIGHTS)
+
+    Returns:
+        Score from 0 to the category's weight
+    """
+    max_score = (weights or WEIGHTS)[category]
+    if category == "skills":
+        ratio, bonus = raw
+        return min(max_score, ratio * max_score + bonus)
+    if category == "soft_skills":
+        return raw * max_score
+    if category == "additional":
+        return min(max_score, raw)
+    # Normalize raw points to the weight
+    return min(max_score, (raw / _RAW_MAXIMUMS[category]) * max_score)
+
+
+@dataclass
+class _CVProfile:
+    """
+    Sector-independent view of a CV.
+
+    Built once per person; the per-sector scorers only run keyword matching
+    against the prepared texts.
+    """
+
+    # Education
+    qualifications: str
+    subjects: str
+    masters_text: str
+    qualification_points: float
+    university_bonus: float
+    # Work experience
+    work_texts: tuple
+    years_points: float
+    seniority_points: float
+    # Skills
+    skills_text: str
+    driving_bonus: float
+    # Sector-independent categories (already weighted)
+    language_score: float
+    soft_skills_score: float
+    additional_score: float
+
+
+def _build_profile(cv: NormalizedCV) -> _CVProfile:
+    """Compute everything that does not depend on the sector."""
+    # Driving license bonus
+    driving = cv.text("DrivingLicense")
+    driving_bonus = 1.0 if driving and driving not in ["no", "none", "n/a"] else 0.0
+
+    return _CVProfile(
+        qualifications=cv.text("QualificationsAwarded"),
+        subjects=cv.text("SubjectsStudied"),
+        masters_text=f"{cv.text('Master1')} {cv.text('Master2')}",
+        # Qualification level (0-10 points, scaled from 0-6 levels)
+        qualification_points=(cv.qualification_level / 6.0) * 10,
+        university_bonus=_get_university_bonus(cv.text("College/University")),
+        work_texts=tuple(entry.text for entry in cv.work),
+        # Years of experience (cap at 10+ years = max points)
+        years_points=min(12.0, cv.tenure_years * 1.2),
+        # Seniority level (0-6 scale mapped to 0-8 points)
+        seniority_points=(cv.seniority / 6.0) * 8,
+        skills_text=cv.skills_text,
+        driving_bonus=driving_bonus,
+        language_score=_calculate_language_score(cv),
+        soft_skills_score=_calculate_soft_skills_score(cv),
+        additional_score=_calculate_additional_score(cv),
+    )
+
+
+def _education_score(profile: _CVProfile, sector: str) -> float:
     """
     Calculate education-related score (0 to WEIGHTS['education']).
 
@@ -492,58 +726,32 @@ def _calculate_education_score(person: dict, sector: str) -> float:
     - Subject/field match: 0-10 points
     - University prestige: 0-5 points
     """
-    max_score = WEIGHTS["education"]
-    raw_score = 0.0
-
-    sector_data = JobSectors[sector]
-    education_keywords = sector_data.get("School/College", [])
-    education_keywords_lower = [kw.lower() for kw in education_keywords]
-
-    # Qualification level (0-10 points, scaled from 0-6 levels)
-    qualifications = _safe_lower(person.get("QualificationsAwarded", ""))
-    qual_level = _get_qualification_level(qualifications)
-
-    # Also check for Master's degrees
-    master1 = _safe_lower(person.get("Master1", ""))
-    master2 = _safe_lower(person.get("Master2", ""))
-    if master1 or master2:
-        qual_level = max(qual_level, 5)  # At least Master's level
+    return _weighted_score("education", _education_raw(profile, sector))
 
-    raw_score += (qual_level / 6.0) * 10
 
-    # Subject/field match (0-10 points)
-    field_match_score = 0.0
+def _education_raw(profile: _CVProfile, sector: str) -> float:
+    """Unweighted education points (0-25)."""
+    education_matcher = sector_matcher(sector, "School/College")
 
-    # Check subjects studied
-    subjects = _safe_lower(person.get("SubjectsStudied", ""))
-    matched_subjects = set()
-    for kw in education_keywords_lower:
-        if kw in subjects and kw not in matched_subjects:
-            field_match_score += 2
-            matched_subjects.add(kw)
-
-    # Check qualifications text for field keywords
-    for kw in education_keywords_lower:
-        if kw in qualifications and kw not in matched_subjects:
-            field_match_score += 1.5
-            matched_subjects.add(kw)
-
-    # Check master's degrees for field keywords
-    masters_text = f"{master1} {master2}"
-    for kw in education_keywords_lower:
-        if kw in masters_text and kw not in matched_subjects:
-            field_match_score += 2
-            matched_subjects.add(kw)
-
-    raw_score += min(10.0, field_match_score)
-
-    # University prestige (0-5 points)
-    college = _safe_lower(person.get("College/University", ""))
-    university_bonus = _get_university_bonus(college)
-    raw_score += university_bonus
+    # Subject/field match (0-10 points). Each keyword counts once, for the
+    # first field it appears in: subjects (+2), qualifications (+1.5),
+    # master's degrees (+2)
+    subject_hits = education_matcher.find(profile.subjects)
+    qualification_hits = education_matcher.find(profile.qualifications) - subject_hits
+    masters_hits = (
+        education_matcher.find(profile.masters_text)
+        - subject_hits
+        - qualification_hits
+    )
+    field_match_score = (
+        2 * len(subject_hits) + 1.5 * len(qualification_hits) + 2 * len(masters_hits)
+    )
 
-    # Normalize to max weight
-    return min(max_score, (raw_score / 25.0) * max_score)
+    return (
+        profile.qualification_points
+        + min(10.0, field_match_score)
+        + profile.university_bonus
+    )
 
 
 def _get_university_bonus(college_text: str) -> float:
@@ -568,22 +776,7 @@ def _get_university_bonus(college_text: str) -> float:
     return 0.0
 
 
-def _get_qualification_level(qualifications_text: str) -> int:
-    """Get the highest qualification level from text (0-6)."""
-    max_level = 0
-
-    if not qualifications_text:
-        return max_level
-
-    for level, keywords in Qualifications.items():
-        for keyword in keywords:
-            if keyword.lower() in qualifications_text:
-                max_level = max(max_level, level)
-
-    return max_level
-
-
-def _calculate_work_score(person: dict, sector: str) -> float:
+def _work_score(profile: _CVProfile, sector: str) -> float:
     """
     Calculate work experience score (0 to WEIGHTS['work_experience']).
 
@@ -592,233 +785,53 @@ def _calculate_work_score(person: dict, sector: str) -> float:
     - Seniority level: 0-8 points
     - Sector relevance: 0-10 points
     """
-    max_score = WEIGHTS["work_experience"]
-    raw_score = 0.0
-
-    sector_data = JobSectors[sector]
-    work_keywords = sector_data.get("WorkExperience", [])
-    work_keywords_lower = [kw.lower() for kw in work_keywords]
-
-    total_years = 0.0
-    max_seniority = 0
-    relevance_score = 0.0
-    matched_keywords = set()
-
-    # Process each workplace (1-3)
-    for i in range(1, 4):
-        workplace = _safe_str(person.get(f"Workplace{i}", ""))
-        dates = _safe_str(person.get(f"Dates{i}", ""))
-        occupation = _safe_str(person.get(f"Occupation{i}", ""))
-        activities = _safe_str(person.get(f"MainActivities{i}", ""))
-
-        if not workplace:
-            continue
-
-        # Calculate time worked
-        years_worked = _calculate_time_worked(dates)
-        total_years += years_worked
-
-        # Get seniority level
-        seniority = _get_seniority_level(occupation)
-        max_seniority = max(max_seniority, seniority)
-
-        # Check for keyword matches (relevance)
-        all_text = f"{workplace} {occupation} {activities}".lower()
-        for kw in work_keywords_lower:
-            if kw in all_text and kw not in matched_keywords:
-                relevance_score += 2.5
-                matched_keywords.add(kw)
-
-    # Years of experience (cap at 10+ years = max points)
-    years_points = min(12.0, total_years * 1.2)
-    raw_score += years_points
-
-    # Seniority level (0-6 scale mapped to 0-8 points)
-    raw_score += (max_seniority / 6.0) * 8
-
-    # Sector relevance (capped at 10)
-    raw_score += min(10.0, relevance_score)
+    return _weighted_score("work_experience", _work_raw(profile, sector))
 
-    # Normalize to max weight
-    return min(max_score, (raw_score / 30.0) * max_score)
 
+def _work_raw(profile: _CVProfile, sector: str) -> float:
+    """Unweighted work experience points (0-30)."""
+    work_matcher = sector_matcher(sector, "WorkExperience")
 
-def _calculate_time_worked(dates_str: str) -> float:
-    """Calculate years worked from date range string."""
-    if not dates_str or "-" not in dates_str:
-        return 0.0
-
-    try:
-        parts = dates_str.split("-")
-        if len(parts) != 2:
-            return 0.0
-
-        date_start = parts[0].strip()
-        date_finish = parts[1].strip()
-
-        # Parse start date
-        start_date = _parse_date(date_start)
-        if not start_date:
-            return 0.0
-
-        # Parse end date
-        if date_finish.lower() in ["current", "present", "now", "ongoing", ""]:
-            end_date = date.today()
-        else:
-            end_date = _parse_date(date_finish)
-            if not end_date:
-                end_date = date.today()
+    # Keyword matches across all workplaces (relevance)
+    matched_keywords = set()
+    for text in profile.work_texts:
+        matched_keywords |= work_matcher.find(text)
 
-        years = (end_date - start_date).days / 365.25
-        return max(0.0, years)
-    except (ValueError, IndexError, AttributeError):
-        return 0.0
+    # Sector relevance (2.5 per distinct keyword, capped at 10)
+    return (
+        profile.years_points
+        + profile.seniority_points
+        + min(10.0, 2.5 * len(matched_keywords))
+    )
 
 
-def _parse_date(date_str: str) -> Optional[date]:
+def _calculate_language_score(cv: NormalizedCV) -> float:
     """
-    Parse a date string in various formats.
-
-    Supported formats:
-    - DD.MM.YYYY (European)
-    - MM/DD/YYYY (US)
-    - YYYY-MM-DD (ISO)
-    - DD/MM/YYYY
-    - Month YYYY (e.g., "January 2020")
-    - YYYY (year only)
+    Calculate language proficiency score (0 to WEIGHTS['languages']).
     """
-    if not date_str:
-        return None
-
-    date_str = date_str.strip()
-
-    # Month name to number mapping
-    months = {
-        "january": 1,
-        "jan": 1,
-        "february": 2,
-        "feb": 2,
-        "march": 3,
-        "mar": 3,
-        "april": 4,
-        "apr": 4,
-        "may": 5,
-        "june": 6,
-        "jun": 6,
-        "july": 7,
-        "jul": 7,
-        "august": 8,
-        "aug": 8,
-        "september": 9,
-        "sep": 9,
-        "sept": 9,
-        "october": 10,
-        "oct": 10,
-        "november": 11,
-        "nov": 11,
-        "december": 12,
-        "dec": 12,
-    }
-
-    # Try DD.MM.YYYY
-    try:
-        parts = date_str.split(".")
-        if len(parts) >= 3:
-            day = int(parts[0])
-            month = int(parts[1])
-            year = int(parts[2])
-            return date(year, month, day)
-    except (ValueError, IndexError):
-        pass
-
-    # Try MM/DD/YYYY or DD/MM/YYYY
-    try:
-        parts = date_str.split("/")
-        if len(parts) >= 3:
-            first = int(parts[0])
-            second = int(parts[1])
-            year = int(parts[2])
-            # Assume MM/DD/YYYY if first <= 12, else DD/MM/YYYY
-            if first <= 12:
-                return date(year, first, second)
-            else:
-                return date(year, second, first)
-    except (ValueError, IndexError):
-        pass
-
-    # Try YYYY-MM-DD (ISO format)
-    try:
-        parts = date_str.split("-")
-        if len(parts) >= 3 and len(parts[0]) == 4:
-            year = int(parts[0])
-            month = int(parts[1])
-            day = int(parts[2])
-            return date(year, month, day)
-    except (ValueError, IndexError):
-        pass
-
-    # Try "Month YYYY" format
-    try:
-        words = date_str.lower().split()
-        if len(words) >= 2:
-            month_name = words[0]
-            year = int(words[-1])
-            if month_name in months:
-                return date(year, months[month_name], 1)
-    except (ValueError, IndexError):
-        pass
-
-    # Try year only
-    try:
-        year = int(date_str)
-        if 1900 <= year <= 2100:
-            return date(year, 1, 1)
-    except ValueError:
-        pass
+    return _weighted_score("languages", _language_raw(cv))
 
-    return None
 
-
-def _get_seniority_level(occupation_text: str) -> int:
-    """Get seniority level from occupation text (0-6)."""
-    if not occupation_text:
-        return 0
-
-    occupation_lower = occupation_text.lower()
-    max_level = 0
-
-    for level, keywords in Functions.items():
-        for keyword in keywords:
-            if keyword.lower() in occupation_lower:
-                max_level = max(max_level, level)
-
-    return max_level
-
-
-def _calculate_language_score(person: dict) -> float:
-    """
-    Calculate language proficiency score (0 to WEIGHTS['languages']).
-    """
-    max_score = WEIGHTS["languages"]
+def _language_raw(cv: NormalizedCV) -> float:
+    """Unweighted language points (about 0-12)."""
     raw_score = 0.0
 
     # Mother language (3 points if it's a global language)
-    mother_language = _safe_lower(person.get("MotherLanguage", ""))
+    mother_language = cv.text("MotherLanguage")
     mother_tier = _get_language_tier(mother_language)
     raw_score += mother_tier * 1.0
 
     # Additional languages
     for i in range(1, 3):
-        language = _safe_lower(person.get(f"ModernLanguage{i}", ""))
-        level = _safe_lower(person.get(f"Level{i}", ""))
+        language = cv.text(f"ModernLanguage{i}")
+        level = cv.text(f"Level{i}")
 
         if language:
             lang_tier = _get_language_tier(language)
             level_multiplier = _get_level_multiplier(level)
             raw_score += lang_tier * level_multiplier * 0.5
 
-    # Normalize to max weight (max raw = ~12 if trilingual with top languages)
-    return min(max_score, (raw_score / 12.0) * max_score)
+    return raw_score
 
 
 def _get_language_tier(language: str) -> int:
@@ -865,64 +878,49 @@ def _get_level_multiplier(level: str) -> float:
     return 0.3  # Default
 
 
-def _calculate_skills_score(person: dict, sector: str) -> float:
+def _skills_score(profile: _CVProfile, sector: str) -> float:
     """
     Calculate skills matching score (0 to WEIGHTS['skills']).
     """
-    max_score = WEIGHTS["skills"]
+    return _weighted_score("skills", _skills_raw(profile, sector))
 
-    sector_data = JobSectors[sector]
-    required_skills = sector_data.get("Skills", [])
-    extra_skills = sector_data.get("ExtraSkills", [])
-
-    # Gather all person's skills
-    person_skills_text = ""
-    for field in [
-        "CommunicationSkills",
-        "OrganizationalManagerialSkills",
-        "JobRelatedSkills",
-        "ComputerSkills",
-        "OtherSkills",
-    ]:
-        person_skills_text += " " + _safe_lower(person.get(field, ""))
 
-    # Count unique matched skills
-    matched_required = 0
-    matched_extra = 0
+def _skills_raw(profile: _CVProfile, sector: str, hits: tuple = None) -> tuple:
+    """
+    Unweighted skills value: (match ratio 0-1, driving license bonus).
 
-    for skill in required_skills:
-        if skill.lower() in person_skills_text:
-            matched_required += 1
+    hits are the (required, extra) matches from _skill_hits, if known.
+    """
+    required_matcher = sector_matcher(sector, "Skills")
+    extra_matcher = sector_matcher(sector, "ExtraSkills")
 
-    for skill in extra_skills:
-        if skill.lower() in person_skills_text:
-            matched_extra += 1
+    # Count matched skills
+    required_hits, extra_hits = hits or _skill_hits(profile.skills_text, sector)
+    matched_required = required_matcher.count(required_hits)
+    matched_extra = extra_matcher.count(extra_hits)
 
     # Score calculation
     # Required skills are worth more
-    total_required = max(1, len(required_skills))
-    total_extra = max(1, len(extra_skills))
+    total_required = max(1, required_matcher.size)
+    total_extra = max(1, extra_matcher.size)
 
     required_ratio = matched_required / total_required
     extra_ratio = matched_extra / total_extra
 
-    # 70% weight to required, 30% to extra skills
-    raw_score = (required_ratio * 0.7 + extra_ratio * 0.3) * max_score
-
-    # Driving license bonus (if sector seems to need it)
-    driving = _safe_lower(person.get("DrivingLicense", ""))
-    if driving and driving not in ["no", "none", "n/a"]:
-        raw_score += 1.0
-
-    return min(max_score, raw_score)
+    # 70% weight to required, 30% to extra skills; driving license bonus
+    # (if sector seems to need it) on top
+    return required_ratio * 0.7 + extra_ratio * 0.3, profile.driving_bonus
 
 
-def _calculate_soft_skills_score(person: dict) -> float:
+def _calculate_soft_skills_score(cv: NormalizedCV) -> float:
     """
     Calculate soft skills score (0 to WEIGHTS['soft_skills']).
     """
-    max_score = WEIGHTS["soft_skills"]
+    return _weighted_score("soft_skills", _soft_skills_raw(cv))
 
+
+def _soft_skills_raw(cv: NormalizedCV) -> float:
+    """Unweighted soft skills value: share of categories matched (0-1)."""
     # Gather text to analyze
     all_text = ""
     for field in [
@@ -933,7 +931,7 @@ def _calculate_soft_skills_score(person: dict) -> float:
         "MainActivities2",
         "MainActivities3",
     ]:
-        all_text += " " + _safe_lower(person.get(field, ""))
+        all_text += " " + cv.text(field)
 
     # Count soft skill category matches
     categories_matched = 0
@@ -945,66 +943,53 @@ def _calculate_soft_skills_score(person: dict) -> float:
 
     # Each category matched is worth some points
     total_categories = len(SoftSkills)
-    ratio = categories_matched / max(1, total_categories)
-
-    return ratio * max_score
+    return categories_matched / max(1, total_categories)
 
 
-def _calculate_additional_score(person: dict) -> float:
+def _calculate_additional_score(cv: NormalizedCV) -> float:
     """
     Calculate additional information score (0 to WEIGHTS['additional']).
 
     Awards, publications, projects, etc.
     """
-    max_score = WEIGHTS["additional"]
+    return _weighted_score("additional", _additional_raw(cv))
+
+
+def _additional_raw(cv: NormalizedCV) -> float:
+    """Unweighted additional points."""
     raw_score = 0.0
 
     # Publications (high value)
-    publications = _safe_str(person.get("Publications", ""))
+    publications = cv.text("Publications")
     if publications:
         pub_count = min(3, publications.count(",") + 1)
         raw_score += pub_count * 0.5
 
     # Honours and Awards (high value)
-    awards = _safe_str(person.get("HonoursAndAwards", ""))
+    awards = cv.text("HonoursAndAwards")
     if awards:
         award_count = min(3, awards.count(",") + 1)
         raw_score += award_count * 0.6
 
     # Projects
-    projects = _safe_str(person.get("Projects", ""))
+    projects = cv.text("Projects")
     if projects:
         proj_count = min(3, projects.count(",") + 1)
         raw_score += proj_count * 0.3
 
     # Presentations
-    presentations = _safe_str(person.get("Presentations", ""))
+    presentations = cv.text("Presentations")
     if presentations:
         raw_score += 0.4
 
     # Conferences
-    conferences = _safe_str(person.get("Conferences", ""))
+    conferences = cv.text("Conferences")
     if conferences:
         raw_score += 0.3
 
     # Memberships
-    memberships = _safe_str(person.get("Memberships", ""))
+    memberships = cv.text("Memberships")
     if memberships:
         raw_score += 0.4
 
-    return min(max_score, raw_score)
-
-
-# Utility functions
-
-
-def _safe_str(value) -> str:
-    """Safely convert value to string."""
-    if value is None:
-        return ""
-    return str(value).strip()
-
-
-def _safe_lower(value) -> str:
-    """Safely convert value to lowercase string."""
-    return _safe_str(value).lower()
+    return raw_score
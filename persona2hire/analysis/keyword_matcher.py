@@ -0,0 +1,150 @@
+"""
+Compiled keyword matching for sector scoring.
+
+The scorers check whether sector keywords occur as substrings of lowercased
+CV text (``kw in text``). A KeywordMatcher is built once per keyword list:
+keywords are lowercased and de-duplicated up front, and each call scans the
+text once, returning the set of matched keywords.
+
+Two strategies give identical results:
+- Small lists: a C-level ``filter`` over ``text.__contains__``, which beats any
+  pure-Python automaton for the ~20-60 keywords a sector field holds.
+- Large lists (e.g. all sectors combined, university names): one trie-shaped
+  regex run as a lookahead, so every start position is tried once. At each
+  position the regex reports the longest keyword; every keyword contained in
+  it is then implied, which recovers overlapping matches exactly.
+
+Matchers are cached on the keyword tuple, so editing a sector's keyword list
+simply compiles a new matcher on the next call.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable
+
+from ..data.job_sectors import JobSectors
+
+
+# Keyword count at which the trie regex outruns per-keyword scans. Measured on
+# CV fields: ~150 keywords for long skills text, far fewer for short fields
+# such as qualifications, occupations or university names.
+REGEX_THRESHOLD = 64
+
+
+class KeywordMatcher:
+    """Match a fixed list of keywords against lowercased text."""
+
+    __slots__ = ("keywords", "size", "_counts", "_pattern", "_implied", "_always")
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Compile a matcher.
+
+        Args:
+            keywords: Keywords to match (case-insensitive)
+        """
+        counts = {}
+        for kw in keywords:
+            kw = kw.lower()
+            counts[kw] = counts.get(kw, 0) + 1
+
+        self.keywords = tuple(counts)
+        self.size = sum(counts.values())
+        # Only kept when the source list repeats a keyword
+        self._counts = counts if self.size != len(counts) else None
+        # An empty keyword is a substring of every text
+        self._always = frozenset(kw for kw in self.keywords if not kw)
+        self._pattern = None
+        self._implied = {}
+
+        if len(self.keywords) >= REGEX_THRESHOLD:
+            words = [kw for kw in self.keywords if kw]
+            self._pattern = re.compile("(?=(" + _trie_pattern(words) + "))")
+            self._implied = {
+                word: frozenset(other for other in words if other in word)
+                for word in words
+            }
+
+    def find(self, text: str) -> frozenset:
+        """
+        Find all keywords that occur in the text.
+
+        Args:
+            text: Lowercased text to scan
+
+        Returns:
+            Frozenset of matched (lowercased) keywords
+        """
+        if not text:
+            return self._always
+
+        if self._pattern is None:
+            return frozenset(filter(text.__contains__, self.keywords))
+
+        matched = set(self._always)
+        for match in self._pattern.finditer(text):
+            matched |= self._implied[match.group(1)]
+        return frozenset(matched)
+
+    def count(self, matched: frozenset) -> int:
+        """Count matches the way a loop over the original list would (with repeats)."""
+        if self._counts is None:
+            return len(matched)
+        return sum(self._counts[kw] for kw in matched)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+
+@lru_cache(maxsize=1024)
+def compile_keywords(keywords: tuple) -> KeywordMatcher:
+    """
+    Get a cached matcher for a keyword tuple.
+
+    Args:
+        keywords: Tuple of keywords
+
+    Returns:
+        Compiled KeywordMatcher
+    """
+    return KeywordMatcher(keywords)
+
+
+def sector_matcher(sector: str, field: str) -> KeywordMatcher:
+    """
+    Get the compiled matcher for one keyword list of a job sector.
+
+    Args:
+        sector: Job sector key from JobSectors
+        field: Keyword list name (e.g. 'Skills', 'WorkExperience')
+
+    Returns:
+        Compiled KeywordMatcher (empty if the sector or field is unknown)
+    """
+    return compile_keywords(tuple(JobSectors.get(sector, {}).get(field, ())))
+
+
+def _trie_pattern(words: list[str]) -> str:
+    """Build a regex alternation shaped like a trie, longest match first."""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [
+            re.escape(char) + build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        body = "(?:" + "|".join(branches) + ")"
+        # Greedy optional keeps the longer keyword when a shorter one ends here
+        return body + "?" if "" in node else body
+
+    return build(trie)
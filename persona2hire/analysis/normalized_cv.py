@@ -0,0 +1,239 @@
+"""
+Normalized view of a CV, shared by all analyzers.
+
+A raw CV dict is re-lowercased, re-joined and re-parsed by every scorer that
+reads it. NormalizedCV does that work once: lowercased field texts, the
+joined skills text, word tokens, parsed work date ranges, tenure,
+qualification level and seniority. Every analyzer accepts either a raw dict
+or a NormalizedCV, so batch runs can normalize each CV once and reuse it.
+
+NormalizedCV behaves like a read-only mapping over the raw values (get,
+[], in), so code that only reads fields keeps working unchanged.
+"""
+
+import hashlib
+from datetime import date
+from typing import NamedTuple, Optional
+
+from ..cv.dates import is_ongoing, parse_date_range
+from ..data.constants import Functions, Qualifications
+
+
+SKILLS_FIELDS = [
+    "CommunicationSkills",
+    "OrganizationalManagerialSkills",
+    "JobRelatedSkills",
+    "ComputerSkills",
+    "OtherSkills",
+]
+
+
+class WorkEntry(NamedTuple):
+    """One filled-in workplace of a CV."""
+
+    number: int  # 1-3
+    workplace: str
+    dates: str
+    occupation: str
+    text: str  # Lowercased "workplace occupation activities"
+    start: Optional[date]
+    end: Optional[date]  # Today for ongoing and unparseable ends
+    years: float
+    ongoing: bool  # Ends in "current", "present", ...
+
+
+class NormalizedCV:
+    """CV data normalized once for analysis."""
+
+    __slots__ = (
+        "raw",
+        "texts",
+        "skills_text",
+        "description_words",
+        "skills_words",
+        "hobbies",
+        "work",
+        "tenure_years",
+        "qualification_level",
+        "seniority",
+    )
+
+    def __init__(self, person: dict):
+        """
+        Normalize CV data.
+
+        Args:
+            person: Dictionary containing CV data
+        """
+        self.raw = person
+        self.texts = {key: _safe_lower(value) for key, value in person.items()}
+
+        # Skills fields, each preceded by a space
+        self.skills_text = _gather_skills_text(person)
+
+        # Word tokens (commas count as separators)
+        description = self.text("ShortDescription")
+        self.description_words = _split_words(description)
+        self.skills_words = _split_words(self.skills_text)
+        self.hobbies = _split_hobbies(self.text("Hobbies"))
+
+        # Work experience: only entries with a workplace count
+        today = date.today()
+        work = []
+        for i in range(1, 4):
+            workplace = _safe_str(person.get(f"Workplace{i}", ""))
+            if not workplace:
+                continue
+            dates = _safe_str(person.get(f"Dates{i}", ""))
+            occupation = _safe_str(person.get(f"Occupation{i}", ""))
+            activities = _safe_str(person.get(f"MainActivities{i}", ""))
+            date_range = parse_date_range(dates)
+            start, end = date_range if date_range else (None, None)
+            if start is not None and end is None:
+                end = today  # Ongoing
+            work.append(
+                WorkEntry(
+                    number=i,
+                    workplace=workplace,
+                    dates=dates,
+                    occupation=occupation,
+                    text=f"{workplace} {occupation} {activities}".lower(),
+                    start=start,
+                    end=end,
+                    years=_years_between(start, end),
+                    ongoing=is_ongoing(dates),
+                )
+            )
+        self.work = tuple(work)
+
+        total_years = 0.0
+        for entry in self.work:
+            total_years += entry.years
+        self.tenure_years = total_years
+        self.seniority = max(
+            (_get_seniority_level(entry.occupation) for entry in self.work), default=0
+        )
+
+        # Highest qualification; any master's degree counts as at least level 5
+        self.qualification_level = _get_qualification_level(
+            self.text("QualificationsAwarded")
+        )
+        if self.text("Master1") or self.text("Master2"):
+            self.qualification_level = max(self.qualification_level, 5)
+
+    def text(self, key: str) -> str:
+        """Get a field as a stripped, lowercased string ('' if missing)."""
+        return self.texts.get(key, "")
+
+    def get(self, key: str, default=None):
+        """Get a raw field value, like dict.get."""
+        return self.raw.get(key, default)
+
+    def __getitem__(self, key: str):
+        return self.raw[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.raw
+
+
+def normalize_cv(person) -> NormalizedCV:
+    """
+    Get the normalized view of a CV.
+
+    Args:
+        person: CV data dictionary or an already normalized CV
+
+    Returns:
+        NormalizedCV (the argument itself if it is already normalized)
+    """
+    if isinstance(person, NormalizedCV):
+        return person
+    return NormalizedCV(person)
+
+
+def raw_cv(person) -> dict:
+    """Get the raw CV dictionary behind a dict or NormalizedCV."""
+    if isinstance(person, NormalizedCV):
+        return person.raw
+    return person
+
+
+def content_hash(person, fields: tuple) -> bytes:
+    """
+    Hash the values of some CV fields, for content-addressed caches.
+
+    Args:
+        person: CV data dictionary (or NormalizedCV)
+        fields: Fields to hash, in order
+
+    Returns:
+        16-byte blake2b digest
+    """
+    person = raw_cv(person)
+    content = "\0".join(_safe_str(person.get(field, "")) for field in fields)
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+def _gather_skills_text(person) -> str:
+    """Concatenate the lowercased skills fields (each preceded by a space)."""
+    return "".join(" " + _safe_lower(person.get(field, "")) for field in SKILLS_FIELDS)
+
+
+def _split_words(text: str) -> list:
+    """Split text into word tokens (commas count as separators)."""
+    return text.replace(",", " ").split()
+
+
+def _split_hobbies(text: str) -> list:
+    """Split a hobbies field into its comma-separated items."""
+    return [h.strip() for h in text.split(",") if h.strip()]
+
+
+def _get_qualification_level(qualifications_text: str) -> int:
+    """Get the highest qualification level from text (0-6)."""
+    max_level = 0
+
+    if not qualifications_text:
+        return max_level
+
+    for level, keywords in Qualifications.items():
+        for keyword in keywords:
+            if keyword.lower() in qualifications_text:
+                max_level = max(max_level, level)
+
+    return max_level
+
+
+def _get_seniority_level(occupation_text: str) -> int:
+    """Get seniority level from occupation text (0-6)."""
+    if not occupation_text:
+        return 0
+
+    occupation_lower = occupation_text.lower()
+    max_level = 0
+
+    for level, keywords in Functions.items():
+        for keyword in keywords:
+            if keyword.lower() in occupation_lower:
+                max_level = max(max_level, level)
+
+    return max_level
+
+
+def _years_between(start: Optional[date], end: Optional[date]) -> float:
+    """Years between two dates (0 if either is missing or end is earlier)."""
+    if start is None or end is None:
+        return 0.0
+    return max(0.0, (end - start).days / 365.25)
+
+
+def _safe_str(value) -> str:
+    """Safely convert value to string."""
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def _safe_lower(value) -> str:
+    """Safely convert value to lowercase string."""
+    return _safe_str(value).lower()
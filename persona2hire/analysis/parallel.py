@@ -0,0 +1,119 @@
+"""
+Multi-process batch scoring.
+
+Scores many candidates against many sectors with a ProcessPoolExecutor.
+Candidates are split into chunks, each worker profiles a CV once and scores
+it for every requested sector, and results are reassembled in input order.
+
+Workers compile the sector keyword matchers once, in the pool initializer,
+instead of on their first task. Small inputs are scored in-process (the pool
+start-up would cost more than it saves). If the pool cannot be started or a
+worker dies, the affected chunks are re-scored in-process.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from ..data.job_sectors import JobSectors
+from . import job_analyzer
+from .job_analyzer import _build_profile, _score_profile
+from .keyword_matcher import sector_matcher
+from .normalized_cv import normalize_cv, raw_cv
+
+
+# Below this many candidates, scoring runs in the calling process
+MIN_PARALLEL_CANDIDATES = 200
+
+# Keyword lists compiled by each worker on start-up
+_SECTOR_FIELDS = ("School/College", "WorkExperience", "Skills", "ExtraSkills")
+
+
+def score_candidates_parallel(
+    persons: list,
+    sectors: Optional[list] = None,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    use_ml: bool = None,
+) -> list:
+    """
+    Score every person against every sector using several processes.
+
+    Args:
+        persons: List of person dictionaries (or NormalizedCV objects)
+        sectors: Sector keys (default: all sectors in JobSectors)
+        workers: Number of worker processes (default: CPU count)
+        chunksize: Candidates per task (default: about 4 tasks per worker)
+        use_ml: Whether to use ML adjustment (None = use global setting)
+
+    Returns:
+        List with one list of scores per person (one score per sector, in
+        the given order), equal to analyze_job(person, sector)
+    """
+    if sectors is None:
+        sectors = list(JobSectors)
+    if use_ml is None:
+        # Workers do not share this process's global setting
+        use_ml = job_analyzer._ml_enabled
+
+    persons = [raw_cv(person) for person in persons]
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(persons) < MIN_PARALLEL_CANDIDATES:
+        return _score_chunk(persons, sectors, use_ml)
+
+    if chunksize is None:
+        chunksize = max(1, len(persons) // (workers * 4))
+    chunks = [
+        persons[start : start + chunksize]
+        for start in range(0, len(persons), chunksize)
+    ]
+
+    results = [None] * len(chunks)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(sectors,),
+        ) as executor:
+            futures = [
+                executor.submit(_score_chunk, chunk, sectors, use_ml)
+                for chunk in chunks
+            ]
+            for i, future in enumerate(futures):
+                try:
+                    results[i] = future.result()
+                except Exception:
+                    pass  # Re-scored below
+    except (OSError, RuntimeError):
+        pass  # Pool unavailable (e.g. no process support); score in-process
+
+    scores = []
+    for chunk, chunk_scores in zip(chunks, results):
+        if chunk_scores is None:
+            chunk_scores = _score_chunk(chunk, sectors, use_ml)
+        scores.extend(chunk_scores)
+    return scores
+
+
+def _init_worker(sectors: list):
+    """Compile the keyword matchers of the sectors a worker will score."""
+    for sector in sectors:
+        for field in _SECTOR_FIELDS:
+            sector_matcher(sector, field)
+
+
+def _score_chunk(persons: list, sectors: list, use_ml: bool) -> list:
+    """Score a chunk of persons against all sectors (profiling each once)."""
+    scores = []
+    for person in persons:
+        cv = normalize_cv(person)
+        profile = _build_profile(cv)
+        scores.append(
+            [
+                _score_profile(profile, cv, sector, use_ml=use_ml)
+                if sector in JobSectors
+                else 0.0
+                for sector in sectors
+            ]
+        )
+    return scores
@@ -11,6 +11,8 @@ MBTI Analysis (16 types):
 
 Process: Tokenize text → match against curated word lists → accumulate scores
 for each dimension → highest score wins. Hobbies also map to indicators.
+personality_report gives the type, percentages, Big Five profile and career
+suggestions from one tokenization of the CV.
 
 Big Five (OCEAN): Openness, Conscientiousness, Extroversion, Agreeableness,
 Neuroticism. Scored -100 to +100 based on high/low indicator matches.
@@ -22,141 +24,114 @@ Limitations: Text-based inference is imprecise, not a valid psych assessment.
 Limited signal from short descriptions. Western/English word associations only.
 """
 
-from ..data.personality import Domains, Hobbies, PersonalityTypes, BigFive
+from dataclasses import dataclass
 
+from ..data.personality import BigFive, PersonalityTypes
+from .keyword_matcher import compile_keywords
+from .normalized_cv import NormalizedCV, normalize_cv
+from .trait_lexicon import HobbyMatcher, TraitLexicon, hobby_matcher, trait_lexicon
 
-def analyze_personality(person: dict) -> str:
+# MBTI dimensions as (first letter, second letter); ties go to the first
+_DIMENSIONS = (("I", "E"), ("S", "N"), ("T", "F"), ("J", "P"))
+
+
+@dataclass(frozen=True)
+class PersonalityReport:
+    """Full personality analysis of one person."""
+
+    mbti_type: str  # Same as analyze_personality
+    percentages: dict  # Same as get_personality_percentages
+    big_five: dict  # Same as get_big_five_profile
+    careers: list  # Same as get_career_suggestions(mbti_type)
+
+
+def personality_report(person: dict | NormalizedCV) -> PersonalityReport:
+    """
+    Analyze a person's personality in one pass over their CV text.
+
+    The CV is tokenized once and the trait scores of the description and
+    hobbies are shared by the type and the percentages.
+
+    Args:
+        person: Dictionary containing CV data (or a NormalizedCV)
+
+    Returns:
+        PersonalityReport with the MBTI type, percentages, Big Five profile
+        and career suggestions
+    """
+    cv = normalize_cv(person)
+    lexicon = trait_lexicon()
+
+    scores = _text_trait_scores(cv, lexicon)
+    percentages = _percentages(_dimension_scores(scores))
+
+    # The type also counts the skills, at half weight
+    scores = dict(scores)
+    _score_from_words(scores, cv.skills_words, lexicon, weight=0.5)
+    personality_type = _personality_type(_dimension_scores(scores))
+
+    return PersonalityReport(
+        mbti_type=personality_type,
+        percentages=percentages,
+        big_five=get_big_five_profile(cv),
+        careers=get_career_suggestions(personality_type),
+    )
+
+
+def analyze_personality(person: dict | NormalizedCV) -> str:
     """
     Analyze a person's personality type based on their CV data.
 
     Args:
-        person: Dictionary containing CV data
+        person: Dictionary containing CV data (or a NormalizedCV)
 
     Returns:
         4-letter MBTI personality type (e.g., "INTJ", "ENFP")
     """
-    # Create a fresh copy of domains to avoid state issues
-    domains = _get_fresh_domains()
-
-    # Analyze description words
-    description = person.get("ShortDescription", "").lower()
-    description_words = [
-        w.strip() for w in description.replace(",", " ").split() if w.strip()
-    ]
-    _score_from_words(domains, description_words)
-
-    # Analyze hobbies
-    hobbies_text = person.get("Hobbies", "").lower()
-    hobbies_list = [h.strip() for h in hobbies_text.split(",") if h.strip()]
-    _score_from_hobbies(domains, hobbies_list)
-
-    # Analyze skills for personality indicators
-    skills_text = _gather_skills_text(person)
-    skills_words = [
-        w.strip() for w in skills_text.replace(",", " ").split() if w.strip()
-    ]
-    _score_from_words(domains, skills_words, weight=0.5)
-
-    # Calculate domain scores
-    scores = {
-        "I": _sum_domain_scores(domains, "I"),
-        "E": _sum_domain_scores(domains, "E"),
-        "S": _sum_domain_scores(domains, "S"),
-        "N": _sum_domain_scores(domains, "N"),
-        "T": _sum_domain_scores(domains, "T"),
-        "F": _sum_domain_scores(domains, "F"),
-        "J": _sum_domain_scores(domains, "J"),
-        "P": _sum_domain_scores(domains, "P"),
-    }
-
-    # Determine personality type
-    personality_type = ""
-    personality_type += "I" if scores["I"] >= scores["E"] else "E"
-    personality_type += "S" if scores["S"] >= scores["N"] else "N"
-    personality_type += "T" if scores["T"] >= scores["F"] else "F"
-    personality_type += "J" if scores["J"] >= scores["P"] else "P"
-
-    return personality_type
-
-
-def get_personality_percentages(person: dict) -> dict:
+    cv = normalize_cv(person)
+    lexicon = trait_lexicon()
+
+    # Description and hobbies, then skills for personality indicators
+    scores = _text_trait_scores(cv, lexicon)
+    _score_from_words(scores, cv.skills_words, lexicon, weight=0.5)
+
+    return _personality_type(_dimension_scores(scores))
+
+
+def get_personality_percentages(person: dict | NormalizedCV) -> dict:
     """
     Get detailed percentage breakdown of personality dimensions.
 
     Args:
-        person: Dictionary containing CV data
+        person: Dictionary containing CV data (or a NormalizedCV)
 
     Returns:
         Dictionary with percentages for each MBTI dimension
     """
-    # Create fresh domains
-    domains = _get_fresh_domains()
-
-    # Analyze all text
-    description = person.get("ShortDescription", "").lower()
-    description_words = [
-        w.strip() for w in description.replace(",", " ").split() if w.strip()
-    ]
-    _score_from_words(domains, description_words)
-
-    hobbies_text = person.get("Hobbies", "").lower()
-    hobbies_list = [h.strip() for h in hobbies_text.split(",") if h.strip()]
-    _score_from_hobbies(domains, hobbies_list)
-
-    # Calculate scores
-    scores = {
-        "I": _sum_domain_scores(domains, "I"),
-        "E": _sum_domain_scores(domains, "E"),
-        "S": _sum_domain_scores(domains, "S"),
-        "N": _sum_domain_scores(domains, "N"),
-        "T": _sum_domain_scores(domains, "T"),
-        "F": _sum_domain_scores(domains, "F"),
-        "J": _sum_domain_scores(domains, "J"),
-        "P": _sum_domain_scores(domains, "P"),
-    }
-
-    # Calculate percentages (add 1 to avoid division by zero)
-    ie_total = scores["I"] + scores["E"] + 1
-    sn_total = scores["S"] + scores["N"] + 1
-    tf_total = scores["T"] + scores["F"] + 1
-    jp_total = scores["J"] + scores["P"] + 1
-
-    return {
-        "I": round(scores["I"] / ie_total * 100, 1),
-        "E": round(scores["E"] / ie_total * 100, 1),
-        "S": round(scores["S"] / sn_total * 100, 1),
-        "N": round(scores["N"] / sn_total * 100, 1),
-        "T": round(scores["T"] / tf_total * 100, 1),
-        "F": round(scores["F"] / tf_total * 100, 1),
-        "J": round(scores["J"] / jp_total * 100, 1),
-        "P": round(scores["P"] / jp_total * 100, 1),
-    }
-
-
-def get_big_five_profile(person: dict) -> dict:
+    cv = normalize_cv(person)
+    return _percentages(_dimension_scores(_text_trait_scores(cv, trait_lexicon())))
+
+
+def get_big_five_profile(person: dict | NormalizedCV) -> dict:
     """
     Analyze Big Five (OCEAN) personality traits.
 
     Args:
-        person: Dictionary containing CV data
+        person: Dictionary containing CV data (or a NormalizedCV)
 
     Returns:
         Dictionary with scores for each Big Five trait
     """
-    description = person.get("ShortDescription", "").lower()
-    hobbies = person.get("Hobbies", "").lower()
-    skills = _gather_skills_text(person)
+    cv = normalize_cv(person)
+    description = cv.text("ShortDescription")
+    hobbies = cv.text("Hobbies")
 
-    all_text = f"{description} {hobbies} {skills}"
+    all_text = f"{description} {hobbies} {cv.skills_text}"
 
     profile = {}
     for trait, levels in BigFive.items():
-        high_matches = sum(
-            1 for word in levels.get("high", []) if word.lower() in all_text
-        )
-        low_matches = sum(
-            1 for word in levels.get("low", []) if word.lower() in all_text
-        )
+        high_matches = _count_matches(levels.get("high", ()), all_text)
+        low_matches = _count_matches(levels.get("low", ()), all_text)
 
         # Calculate score (-100 to +100 scale)
         total = high_matches + low_matches + 1  # Avoid division by zero
@@ -181,98 +156,59 @@ def get_career_suggestions(personality_type: str) -> list:
     return []
 
 
-def _get_fresh_domains() -> dict:
-    """Create a fresh copy of domains with reset scores."""
-    domains = {}
-    for domain_key, domain_data in Domains.items():
-        domains[domain_key] = {}
-        for trait_key, trait_data in domain_data.items():
-            if trait_key == "SCORE":
-                domains[domain_key][trait_key] = 0
-            elif isinstance(trait_data, dict):
-                domains[domain_key][trait_key] = {
-                    "words": trait_data.get("words", []).copy(),
-                    "score": 0,
-                }
-    return domains
-
-
-def _gather_skills_text(person: dict) -> str:
-    """Gather all skills text from person data."""
-    skills_fields = [
-        "CommunicationSkills",
-        "OrganizationalManagerialSkills",
-        "JobRelatedSkills",
-        "ComputerSkills",
-        "OtherSkills",
-    ]
-    return " ".join(person.get(field, "") for field in skills_fields).lower()
-
-
-def _score_from_words(domains: dict, words: list, weight: float = 1.0):
-    """Score personality based on word matches."""
+def _text_trait_scores(cv: NormalizedCV, lexicon: TraitLexicon) -> dict:
+    """Trait scores, keyed by (domain, trait), from the description and hobbies."""
+    scores = dict.fromkeys(lexicon.traits, 0)
+    _score_from_words(scores, cv.description_words, lexicon)
+    _score_from_hobbies(scores, cv.hobbies, hobby_matcher())
+    return scores
+
+
+def _dimension_scores(scores: dict) -> dict:
+    """Sum the trait scores of each domain, in trait order."""
+    totals = {letter: 0 for dimension in _DIMENSIONS for letter in dimension}
+    for (domain_key, _), score in scores.items():
+        totals[domain_key] = totals.get(domain_key, 0) + score
+    return totals
+
+
+def _personality_type(scores: dict) -> str:
+    """Pick the stronger letter of each dimension."""
+    return "".join(
+        first if scores[first] >= scores[second] else second
+        for first, second in _DIMENSIONS
+    )
+
+
+def _percentages(scores: dict) -> dict:
+    """Share of each letter within its dimension."""
+    percentages = {}
+    for first, second in _DIMENSIONS:
+        # Add 1 to avoid division by zero
+        total = scores[first] + scores[second] + 1
+        percentages[first] = round(scores[first] / total * 100, 1)
+        percentages[second] = round(scores[second] / total * 100, 1)
+    return percentages
+
+
+def _count_matches(words, text: str) -> int:
+    """Count the words (repeats included) that occur in the text."""
+    matcher = compile_keywords(tuple(words))
+    return matcher.count(matcher.find(text))
+
+
+def _score_from_words(
+    scores: dict, words: list, lexicon: TraitLexicon, weight: float = 1.0
+):
+    """Score personality based on word matches (see trait_lexicon.py)."""
+    lookup = lexicon.lookup
     for word in words:
-        word_clean = word.strip().lower()
-        if not word_clean:
-            continue
-
-        for domain_key in domains:
-            for trait_key, trait_data in domains[domain_key].items():
-                if trait_key != "SCORE" and isinstance(trait_data, dict):
-                    trait_words = trait_data.get("words", [])
-                    for trait_word in trait_words:
-                        if (
-                            word_clean == trait_word.lower()
-                            or trait_word.lower() in word_clean
-                        ):
-                            domains[domain_key][trait_key]["score"] += weight
-                            break
-
-
-def _score_from_hobbies(domains: dict, hobbies_list: list):
-    """Score personality based on hobby matches."""
-    hobby_words = Hobbies.get("words", [])
-    hobby_domains = Hobbies.get("domain", [])
-    hobby_traits = Hobbies.get("trait", [])
-
-    for hobby in hobbies_list:
-        hobby_clean = hobby.strip().lower()
-        if not hobby_clean:
-            continue
-
-        # Find matching hobby in the list
-        for i, hobby_word in enumerate(hobby_words):
-            if hobby_word.lower() in hobby_clean or hobby_clean in hobby_word.lower():
-                # Get the domain and trait for this hobby
-                if i < len(hobby_domains) and i < len(hobby_traits):
-                    domain = hobby_domains[i]
-                    trait = hobby_traits[i]
-
-                    # Add score to the corresponding domain/trait
-                    if domain in domains and trait in domains[domain]:
-                        if isinstance(domains[domain][trait], dict):
-                            domains[domain][trait]["score"] += 1
-                break
-
-    # Also check sports
-    sports = Hobbies.get("sports", [])
-    for hobby in hobbies_list:
-        hobby_clean = hobby.strip().lower()
-        for sport in sports:
-            if sport.lower() in hobby_clean:
-                # Sports tend to indicate E, S, and P traits
-                if "E" in domains and "energetic" in domains["E"]:
-                    domains["E"]["energetic"]["score"] += 0.5
-                if "S" in domains and "practical" in domains["S"]:
-                    domains["S"]["practical"]["score"] += 0.5
-                break
-
-
-def _sum_domain_scores(domains: dict, domain_key: str) -> float:
-    """Sum all trait scores for a domain."""
-    total = 0
-    if domain_key in domains:
-        for trait_key, trait_data in domains[domain_key].items():
-            if trait_key != "SCORE" and isinstance(trait_data, dict):
-                total += trait_data.get("score", 0)
-    return total
+        for trait in lookup(word.strip().lower()):
+            scores[trait] += weight
+
+
+def _score_from_hobbies(scores: dict, hobbies_list: list, matcher: HobbyMatcher):
+    """Score personality based on hobby and sports matches."""
+    for trait, points in matcher.hits(hobbies_list):
+        if trait in scores:
+            scores[trait] += points
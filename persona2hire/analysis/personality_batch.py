@@ -0,0 +1,262 @@
+"""
+Vectorized personality analysis of many CVs.
+
+Builds a sparse candidate x term frequency matrix over the description
+words, skills words and hobbies of every CV, and multiplies it by a
+term x MBTI letter weight matrix. The weights come from Domains and Hobbies
+(through the compiled trait lexicon and hobby matcher) and are kept in a
+term table per lexicon: every lexicon word has a row from the start, other
+tokens and hobbies get one the first time any batch sees them, and a batch
+only gathers the rows of its hits. Big Five counts come from a candidate x
+keyword presence matrix over the BigFive word lists.
+
+Terms are an exact vocabulary of the tokens seen rather than hashed
+buckets, so no two tokens share a row and the results equal
+analyze_personality and get_big_five_profile for every CV. All trait
+weights are halves and whole numbers, so the sums are exact in any order.
+
+Requires numpy.
+"""
+
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+from ..data.personality import BigFive
+from .keyword_matcher import compile_keywords
+from .normalized_cv import (
+    NormalizedCV,
+    _gather_skills_text,
+    _safe_lower,
+    _split_hobbies,
+    _split_words,
+)
+from .personality_analyzer import _DIMENSIONS
+from .sparse_hits import SparseHits
+from .trait_lexicon import TOKEN_CACHE_SIZE, hobby_matcher, trait_lexicon
+
+
+# Column order of PersonalityBatch.scores
+MBTI_LETTERS = tuple(letter for dimension in _DIMENSIONS for letter in dimension)
+
+# Column order of PersonalityBatch.big_five
+BIG_FIVE_TRAITS = tuple(BigFive)
+
+# Distinct terms a term table may hold before a batch starts it afresh
+TERM_TABLE_SIZE = TOKEN_CACHE_SIZE
+
+
+@dataclass(frozen=True)
+class PersonalityBatch:
+    """Personality analysis of many CVs, one row per CV."""
+
+    types: list  # MBTI type per CV, as analyze_personality
+    scores: "np.ndarray"  # (n, 8) letter scores, columns MBTI_LETTERS
+    big_five: "np.ndarray"  # (n, 5) Big Five scores, columns BIG_FIVE_TRAITS
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def big_five_profile(self, index: int) -> dict:
+        """Big Five profile of one CV, as get_big_five_profile."""
+        return dict(zip(BIG_FIVE_TRAITS, self.big_five[index].tolist()))
+
+
+def analyze_personality_batch(persons: list) -> PersonalityBatch:
+    """
+    Analyze the personality of many people at once.
+
+    Args:
+        persons: List of person dictionaries (or NormalizedCV objects)
+
+    Returns:
+        PersonalityBatch with the MBTI type and Big Five profile of each
+        person
+    """
+    if np is None:
+        raise ImportError(
+            "analyze_personality_batch requires numpy (pip install numpy)"
+        )
+
+    n = len(persons)
+    terms = _term_table(trait_lexicon(), hobby_matcher())
+    big_five = _BigFiveVocabulary()
+
+    term_hits = SparseHits()
+    big_five_hits = SparseHits()
+    with terms.lock:
+        if len(terms) > TERM_TABLE_SIZE:
+            terms.clear()
+        for i, person in enumerate(persons):
+            description, hobbies, skills_text = _personality_texts(person)
+            term_hits.add(i, terms.word_rows(_split_words(description)), 1.0)
+            term_hits.add(i, terms.hobby_rows(_split_hobbies(hobbies)), 1.0)
+            term_hits.add(i, terms.word_rows(_split_words(skills_text)), 0.5)
+
+            all_text = f"{description} {hobbies} {skills_text}"
+            matched = big_five.matcher.find(all_text)
+            big_five_hits.add(i, big_five.columns(matched), 1.0)
+
+        # Letter scores: the hit rows gathered from the term table
+        scores = term_hits.dot(terms.weights(), n)
+
+    columns = []
+    for first, second in _DIMENSIONS:
+        stronger = (
+            scores[:, MBTI_LETTERS.index(first)]
+            >= scores[:, MBTI_LETTERS.index(second)]
+        )
+        columns.append(np.where(stronger, first, second).tolist())
+    types = ["".join(letters) for letters in zip(*columns)] if n else []
+
+    # Big Five: (high - low) / (high + low + 1), as get_big_five_profile
+    high = big_five_hits.dot(big_five.incidence["high"], n)
+    low = big_five_hits.dot(big_five.incidence["low"], n)
+    profile = ((high - low) / (high + low + 1)) * 100
+    profile = np.array(
+        [[round(score, 1) for score in row] for row in profile.tolist()]
+    ).reshape(n, len(BIG_FIVE_TRAITS))
+
+    return PersonalityBatch(types=types, scores=scores, big_five=profile)
+
+
+def _personality_texts(person) -> tuple:
+    """
+    Lowercased description, hobbies and skills text of a CV.
+
+    Dictionaries are not fully normalized: only these fields are read, the
+    same way NormalizedCV reads them.
+    """
+    if isinstance(person, NormalizedCV):
+        return (
+            person.text("ShortDescription"),
+            person.text("Hobbies"),
+            person.skills_text,
+        )
+    return (
+        _safe_lower(person.get("ShortDescription", "")),
+        _safe_lower(person.get("Hobbies", "")),
+        _gather_skills_text(person),
+    )
+
+
+class _TermTable:
+    """
+    Word tokens and hobbies of one lexicon, with their MBTI letter weights.
+
+    Rows are only ever added (until clear), so the row of a term stays valid
+    across batches. Callers hold lock while they add rows and use weights.
+    """
+
+    def __init__(self, lexicon, hobbies):
+        self.lexicon = lexicon
+        self.hobbies = hobbies
+        self.lock = threading.Lock()
+        # Letter column of each (domain, trait) pair that scores a letter
+        self._letters = {
+            trait: MBTI_LETTERS.index(trait[0])
+            for trait in lexicon.traits
+            if trait[0] in MBTI_LETTERS
+        }
+        self.clear()
+
+    def clear(self):
+        """Drop every row except those of the lexicon words."""
+        self.index = {}
+        # Nonzero weights of rows not yet in the matrix, in coordinate form
+        self._rows = []
+        self._cols = []
+        self._points = []
+        self._matrix = np.zeros((0, len(MBTI_LETTERS)))
+        self._built = 0
+        self.word_rows(list(self.lexicon.exact))
+
+    def word_rows(self, words: list) -> list:
+        """Rows of word tokens (repeats kept, blanks dropped)."""
+        rows = []
+        for word in words:
+            token = word.strip().lower()
+            if not token:
+                continue
+            row = self.index.get(("word", token))
+            if row is None:
+                traits = self.lexicon.lookup(token)
+                row = self._add(("word", token), ((trait, 1) for trait in traits))
+            rows.append(row)
+        return rows
+
+    def hobby_rows(self, hobbies: list) -> list:
+        """Rows of hobby phrases (repeats kept)."""
+        rows = []
+        for hobby in hobbies:
+            term = ("hobby", hobby.strip().lower())
+            row = self.index.get(term)
+            if row is None:
+                row = self._add(term, self.hobbies.lookup(term[1]))
+            rows.append(row)
+        return rows
+
+    def _add(self, term: tuple, hits) -> int:
+        row = len(self.index)
+        self.index[term] = row
+        for trait, points in hits:
+            letter = self._letters.get(trait)
+            if letter is not None:
+                self._rows.append(row)
+                self._cols.append(letter)
+                self._points.append(points)
+        return row
+
+    def weights(self) -> "np.ndarray":
+        """Term x letter weight matrix, letter columns in MBTI_LETTERS order."""
+        size = len(self.index)
+        if size > self._built:
+            if size > len(self._matrix):
+                # Grow geometrically, so a new term costs amortized O(1)
+                matrix = np.zeros((max(size, 2 * len(self._matrix)), len(MBTI_LETTERS)))
+                matrix[: self._built] = self._matrix[: self._built]
+                self._matrix = matrix
+            if self._rows:
+                np.add.at(self._matrix, (self._rows, self._cols), self._points)
+            self._rows, self._cols, self._points = [], [], []
+            self._built = size
+        return self._matrix[:size]
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+@lru_cache(maxsize=16)
+def _term_table(lexicon, hobbies) -> _TermTable:
+    """Get the term table of a lexicon and hobby matcher."""
+    return _TermTable(lexicon, hobbies)
+
+
+class _BigFiveVocabulary:
+    """Every BigFive word, with trait incidence matrices for high and low."""
+
+    def __init__(self):
+        vocabulary = {}
+        for levels in BigFive.values():
+            for level in ("high", "low"):
+                for word in levels.get(level, []):
+                    vocabulary.setdefault(word.lower(), len(vocabulary))
+
+        self.index = vocabulary
+        self.matcher = compile_keywords(tuple(vocabulary))
+        # incidence[level][k, t]: how often keyword k is listed for trait t
+        self.incidence = {}
+        for level in ("high", "low"):
+            incidence = np.zeros((len(vocabulary), len(BIG_FIVE_TRAITS)))
+            for t, levels in enumerate(BigFive.values()):
+                for word in levels.get(level, []):
+                    incidence[vocabulary[word.lower()], t] += 1
+            self.incidence[level] = incidence
+
+    def columns(self, matched: frozenset) -> list:
+        return [self.index[kw] for kw in matched]
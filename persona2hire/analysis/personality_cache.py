@@ -0,0 +1,262 @@
+"""
+Content-addressed cache of MBTI personality types.
+
+A personality type depends only on a CV's description, hobbies and the five
+skills fields, and on the word lists in Domains and Hobbies. Types are
+cached under a blake2b hash of those fields, so the same text always maps to
+the same entry whatever the file, name or other fields of the CV, and an
+edited CV simply gets a new entry.
+
+Keys also start with a hash of the word lists (the lexicon version), so
+editing Domains or Hobbies makes every entry a miss, in memory as well as in
+a saved file. The version is only rehashed when a word list is replaced or
+changes length (a cheap identity check, as in subscore_cache); after
+editing a list in place without changing its length, call
+invalidate_lexicon().
+
+The cache is bounded: beyond maxsize entries the least recently used are
+dropped. It can be saved to a JSON file; only the entries of the current
+lexicon version are saved and loaded.
+
+Types read through the cache equal analyze_personality.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Optional
+
+from ..data.personality import Domains, Hobbies
+from .normalized_cv import SKILLS_FIELDS, content_hash
+from .personality_analyzer import analyze_personality
+from .personality_batch import analyze_personality_batch
+
+
+DEFAULT_PERSONALITY_CACHE_PATH = "data/cache/personality_cache.json"
+
+# Entries kept in memory (and saved)
+DEFAULT_MAXSIZE = 100_000
+
+# CV fields the personality type reads
+PERSONALITY_FIELDS = ("ShortDescription", "Hobbies") + tuple(SKILLS_FIELDS)
+
+# Misses analyzed with analyze_personality_batch (fewer are analyzed one by one)
+_BATCH_MIN = 16
+
+_CACHE_FORMAT = "persona2hire-personality-cache"
+
+
+class PersonalityCache:
+    """MBTI types cached by CV content, with an LRU bound."""
+
+    def __init__(self, path: Optional[str] = None, maxsize: int = DEFAULT_MAXSIZE):
+        """
+        Create a cache, loading the saved entries if there are any.
+
+        Args:
+            path: JSON file to load from and save to (None: memory only)
+            maxsize: Largest number of entries kept
+        """
+        self.path = path
+        self.maxsize = maxsize
+        self._fingerprint = None
+        self._prefix = b""
+        self._current_version()  # Sets version and _prefix
+        self._types = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def invalidate_lexicon(self):
+        """Hash the word lists again on the next read."""
+        self._fingerprint = None
+
+    def clear(self):
+        """Drop all cached types and reset the counters."""
+        self._types.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """Hit and miss counts, and the number of entries."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._types),
+            "maxsize": self.maxsize,
+        }
+
+    def personality_type(self, person) -> str:
+        """
+        Get the MBTI type of one person.
+
+        Args:
+            person: Person dictionary (or NormalizedCV)
+
+        Returns:
+            4-letter MBTI type, as analyze_personality
+        """
+        self._current_version()
+        key = self._key(person)
+        personality_type = self._get(key)
+        if personality_type is None:
+            self.misses += 1
+            personality_type = analyze_personality(person)
+            self._put(key, personality_type)
+        return personality_type
+
+    def personality_types(self, persons: list) -> list:
+        """
+        Get the MBTI types of many persons.
+
+        Misses are analyzed together (with analyze_personality_batch when
+        numpy is available), each distinct content once.
+
+        Args:
+            persons: List of person dictionaries (or NormalizedCV objects)
+
+        Returns:
+            One MBTI type per person
+        """
+        self._current_version()
+        keys = [self._key(person) for person in persons]
+        types = [self._get(key) for key in keys]
+
+        # First person of each missing content
+        missing = {}
+        for index, (key, personality_type) in enumerate(zip(keys, types)):
+            if personality_type is None and key not in missing:
+                missing[key] = index
+        if missing:
+            self.misses += len(missing)
+            analyzed = _analyze([persons[index] for index in missing.values()])
+            found = dict(zip(missing, analyzed))
+            for key, personality_type in found.items():
+                self._put(key, personality_type)
+            types = [
+                found[key] if personality_type is None else personality_type
+                for key, personality_type in zip(keys, types)
+            ]
+        return types
+
+    def put(self, person, personality_type: str):
+        """
+        Store a type that is already known (e.g. from personality_report).
+
+        Args:
+            person: Person dictionary (or NormalizedCV)
+            personality_type: Its MBTI type, as analyze_personality
+        """
+        self._current_version()
+        self._put(self._key(person), personality_type)
+
+    def save(self):
+        """
+        Save the entries to the cache file (nothing to do without a path).
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        if self.path is None:
+            return
+        version = self._current_version()
+        data = {
+            "format": _CACHE_FORMAT,
+            "version": version,
+            # Least recently used first
+            "types": {
+                key.hex(): value
+                for key, value in self._types.items()
+                if key.startswith(self._prefix)
+            },
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temp_path, self.path)
+
+    def _load(self):
+        """Load a saved file; unreadable files and other versions are ignored."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("format") != _CACHE_FORMAT:
+            return
+        if data.get("version") != self.version:
+            return
+        for key, personality_type in data.get("types", {}).items():
+            try:
+                key = bytes.fromhex(key)
+            except ValueError:
+                continue
+            if key.startswith(self._prefix):
+                self._put(key, personality_type)
+
+    def _current_version(self) -> str:
+        """Lexicon version, rehashed only if the word lists changed."""
+        fingerprint = _lexicon_fingerprint()
+        if fingerprint != self._fingerprint:
+            self._fingerprint = fingerprint
+            self.version = lexicon_version()
+            self._prefix = bytes.fromhex(self.version)
+        return self.version
+
+    def _key(self, person) -> bytes:
+        """Key of a person under the version last read by _current_version."""
+        return self._prefix + content_hash(person, PERSONALITY_FIELDS)
+
+    def _get(self, key: bytes) -> Optional[str]:
+        """Look up a type, marking it as recently used."""
+        personality_type = self._types.get(key)
+        if personality_type is not None:
+            self._types.move_to_end(key)
+            self.hits += 1
+        return personality_type
+
+    def _put(self, key: bytes, personality_type: str):
+        """Store a type, dropping the least recently used beyond maxsize."""
+        self._types[key] = personality_type
+        self._types.move_to_end(key)
+        while len(self._types) > self.maxsize:
+            self._types.popitem(last=False)
+
+
+def lexicon_version() -> str:
+    """Hash the word lists the personality type reads."""
+    data = repr((Domains, Hobbies))
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _lexicon_fingerprint() -> tuple:
+    """
+    The word lists the type reads, with their lengths.
+
+    Fingerprints compare equal cheaply while every list is the same object
+    (tuple comparison checks identity first).
+    """
+    lists = [Domains, Hobbies]
+    for domain_data in Domains.values():
+        lists.append(domain_data)
+        for trait_data in domain_data.values():
+            if isinstance(trait_data, dict):
+                lists.append(trait_data.get("words", ()))
+    lists.extend(Hobbies.values())
+    return tuple((item, len(item)) for item in lists)
+
+
+def _analyze(persons: list) -> list:
+    """Analyze the types of persons, in a batch when it pays off."""
+    if len(persons) >= _BATCH_MIN:
+        try:
+            return analyze_personality_batch(persons).types
+        except ImportError:
+            pass
+    return [analyze_personality(person) for person in persons]
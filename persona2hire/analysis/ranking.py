@@ -0,0 +1,230 @@
+"""
+Top-K ranking of candidates and sectors.
+
+Showing the best 10 of many candidates does not need every full score.
+Ranking runs in two passes:
+
+1. A cheap pre-pass computes an upper bound on every final score: the
+   sector-independent categories exactly, the keyword-matched parts of
+   education, work experience and skills at their maximum, the
+   personality bonus at its maximum (or exact, if the type is already
+   known) and, when ML is enabled, the largest adjustment the model may
+   apply (+30%, capped at 100).
+2. Candidates are visited in descending bound order while a bounded heap
+   keeps the best K. A candidate whose bound can still beat the current
+   K-th score first gets its sector keyword matching done, which turns
+   the bound into one on the exact rule score; it is then queued again
+   under that tighter bound. The expensive final steps (personality
+   analysis, ML adjustment) only run once a tight bound is still in
+   reach, and the scan stops at the first bound that cannot be.
+
+Results equal a full stable sort by score (ties keep input order).
+"""
+
+import heapq
+from typing import Callable, Optional
+
+from ..data.job_sectors import JobSectors
+from .job_analyzer import (
+    PERSONALITY_BONUS,
+    _build_profile,
+    _calculate_personality_bonus,
+    _finish_score,
+    _rule_score,
+    _should_use_ml,
+    _weighted_score,
+)
+from .normalized_cv import NormalizedCV, normalize_cv
+
+
+# Largest ML adjustment factor (see ScoringModel.get_adjustment_factor)
+ML_MAX_FACTOR = 1.3
+
+# Guards the bound against float differences in summation order
+_BOUND_EPSILON = 1e-9
+
+
+def rank_candidates(
+    persons: list,
+    sector: str,
+    k: int = 10,
+    personality: Optional[Callable] = None,
+    use_ml: bool = None,
+) -> list:
+    """
+    Find the K best candidates for a sector.
+
+    Args:
+        persons: List of person dictionaries (or NormalizedCV objects)
+        sector: Job sector key from JobSectors
+        k: Number of candidates to return
+        personality: Optional function person -> MBTI type, called only for
+            candidates that can still reach the top K (default: each
+            person's 'PersonalityTypeMB')
+        use_ml: Whether to use ML adjustment (None = use global setting)
+
+    Returns:
+        List of (person, score) tuples, best first, with the same scores as
+        analyze_job
+    """
+    if k <= 0 or not persons:
+        return []
+    if sector not in JobSectors:
+        return [(person, 0.0) for person in persons[:k]]
+
+    ml_active = _should_use_ml(use_ml)
+
+    def bonus_bound(person) -> float:
+        if personality is None:
+            return _calculate_personality_bonus(
+                person.get("PersonalityTypeMB", ""), sector
+            )
+        return PERSONALITY_BONUS
+
+    # Pre-pass: upper bounds without any keyword matching
+    candidates = []
+    for index, person in enumerate(persons):
+        profile = _build_profile(normalize_cv(person))
+        bound = _rule_bound(profile) + bonus_bound(person)
+        candidates.append((-_upper_bound(bound, ml_active), index, profile))
+    candidates.sort()
+
+    def refine(index: int, profile) -> tuple:
+        rule_score = _rule_score(profile, sector)
+        bound = rule_score + bonus_bound(persons[index])
+        return _upper_bound(bound, ml_active), rule_score
+
+    def score(index: int, rule_score: float) -> float:
+        person = persons[index]
+        personality_type = personality(person) if personality else None
+        return _finish_score(rule_score, person, sector, personality_type, use_ml)
+
+    ranked = _top_k(candidates, k, score, refine)
+    return [(persons[index], value) for index, value in ranked]
+
+
+def top_sectors(
+    person: dict | NormalizedCV,
+    k: int = 5,
+    personality_type: str = None,
+    use_ml: bool = None,
+) -> list:
+    """
+    Find the K best job sectors for a person.
+
+    Args:
+        person: Dictionary containing CV data (or a NormalizedCV)
+        k: Number of sectors to return
+        personality_type: Optional pre-calculated MBTI type
+        use_ml: Whether to use ML adjustment (None = use global setting)
+
+    Returns:
+        List of (sector, score) tuples, best first; the same as the first K
+        entries of analyze_jobs
+    """
+    if k <= 0:
+        return []
+
+    cv = normalize_cv(person)
+    profile = _build_profile(cv)
+    if personality_type is None:
+        personality_type = cv.get("PersonalityTypeMB", "")
+    ml_active = _should_use_ml(use_ml)
+    sectors = list(JobSectors)
+
+    candidates = []
+    for index, sector in enumerate(sectors):
+        rule_score = _rule_score(profile, sector)
+        bonus = _calculate_personality_bonus(personality_type, sector)
+        bound = _upper_bound(rule_score + bonus, ml_active)
+        candidates.append((-bound, index, rule_score))
+    candidates.sort()
+
+    def score(index: int, rule_score: float) -> float:
+        return _finish_score(rule_score, cv, sectors[index], personality_type, use_ml)
+
+    ranked = _top_k(candidates, k, score)
+    return [(sectors[index], value) for index, value in ranked]
+
+
+def _rule_bound(profile) -> float:
+    """
+    Largest rule score a profile can reach in any sector.
+
+    Args:
+        profile: Sector-independent CV profile from _build_profile
+
+    Returns:
+        The rule score with every keyword-matched part at its maximum
+    """
+    # Same summation order as _rule_score, so each term only grows
+    return (
+        _weighted_score(
+            "education",
+            profile.qualification_points + 10.0 + profile.university_bonus,
+        )
+        + _weighted_score(
+            "work_experience",
+            profile.years_points + profile.seniority_points + 10.0,
+        )
+        + _weighted_score("skills", (1.0, profile.driving_bonus))
+        + profile.language_score
+        + profile.soft_skills_score
+        + profile.additional_score
+    )
+
+
+def _upper_bound(score: float, ml_active: bool) -> float:
+    """Largest rounded final score reachable from an unadjusted score."""
+    if ml_active:
+        # The adjusted score is capped at 100; a failed adjustment keeps it
+        score = max(score, min(100.0, score * ML_MAX_FACTOR))
+    return round(score + _BOUND_EPSILON, 1)
+
+
+def _top_k(
+    candidates: list, k: int, score: Callable, refine: Optional[Callable] = None
+) -> list:
+    """
+    Select the K best items from bound-sorted candidates.
+
+    Args:
+        candidates: (-bound, index, item) tuples sorted ascending
+        k: Number of items to keep
+        score: Function (index, item) -> final score
+        refine: Optional function (index, item) -> (tighter bound, new item),
+            applied once to each candidate before it is scored; score then
+            gets the new item
+
+    Returns:
+        List of (index, score) tuples, best first (ties by index)
+    """
+    # Max-heap on bounds (candidates are already in heap order); refined
+    # candidates carry a flag so that they are only refined once
+    queue = [
+        (neg_bound, index, refine is None, item)
+        for neg_bound, index, item in candidates
+    ]
+    # Min-heap on (score, -index): the root is the current K-th best
+    heap = []
+    while queue:
+        neg_bound, index, refined, item = heapq.heappop(queue)
+        if len(heap) == k:
+            worst_score, worst_neg_index = heap[0]
+            if -neg_bound < worst_score:
+                break  # Every remaining bound is lower still
+            if -neg_bound == worst_score and -index < worst_neg_index:
+                continue  # Could only tie, and ties go to earlier items
+
+        if not refined:
+            bound, item = refine(index, item)
+            heapq.heappush(queue, (-bound, index, True, item))
+            continue
+
+        entry = (score(index, item), -index)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    return [(-neg_index, value) for value, neg_index in sorted(heap, reverse=True)]
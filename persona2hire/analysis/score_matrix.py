@@ -0,0 +1,211 @@
+"""
+Vectorized candidate x sector scoring.
+
+Scores many CVs against many sectors at once with the same rules as
+analyze_job. Each CV is profiled once (sector-independent subscores, texts)
+and matched once against the union of every sector's keywords; the hits form
+a sparse candidate x keyword matrix that is combined with per-sector keyword
+incidence matrices to get the education, work and skills components for all
+sectors in a few array operations.
+
+Education field match uses per-hit weights so the "first field wins" rule of
+analyze_job is kept: 2 for subjects, 1.5 for qualifications only, 2 for
+master's degrees only.
+
+Requires numpy. ML adjustment is not applied (rule-based scores only); use
+analyze_job for ML-adjusted single scores.
+"""
+
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+from ..data.job_sectors import JobSectors
+from .job_analyzer import (
+    WEIGHTS,
+    _build_profile,
+    _calculate_personality_bonus,
+)
+from .keyword_matcher import compile_keywords
+from .normalized_cv import normalize_cv
+from .sparse_hits import SparseHits
+
+
+# Category order of the last axis of score_breakdown_tensor
+SCORE_CATEGORIES = (
+    "education",
+    "work_experience",
+    "skills",
+    "languages",
+    "soft_skills",
+    "additional",
+    "personality_bonus",
+)
+
+
+def score_matrix(
+    persons: list,
+    sectors: Optional[list] = None,
+    personality_types: Optional[list] = None,
+) -> "np.ndarray":
+    """
+    Score every person against every sector.
+
+    Args:
+        persons: List of person dictionaries (or NormalizedCV objects)
+        sectors: Sector keys (default: all sectors in JobSectors)
+        personality_types: Optional pre-calculated MBTI type per person
+            (default: each person's 'PersonalityTypeMB')
+
+    Returns:
+        Array of shape (len(persons), len(sectors)) with the same values as
+        analyze_job(person, sector, use_ml=False); unknown sectors score 0
+    """
+    tensor = score_breakdown_tensor(persons, sectors, personality_types)
+    total = tensor[:, :, 0]
+    # Same summation order as analyze_job
+    for k in range(1, len(SCORE_CATEGORIES)):
+        total = total + tensor[:, :, k]
+    return np.round(total, 1)
+
+
+def score_breakdown_tensor(
+    persons: list,
+    sectors: Optional[list] = None,
+    personality_types: Optional[list] = None,
+) -> "np.ndarray":
+    """
+    Compute the per-category scores of every person for every sector.
+
+    Args:
+        persons: List of person dictionaries (or NormalizedCV objects)
+        sectors: Sector keys (default: all sectors in JobSectors)
+        personality_types: Optional pre-calculated MBTI type per person
+
+    Returns:
+        Array of shape (len(persons), len(sectors), len(SCORE_CATEGORIES)),
+        matching get_score_breakdown category by category
+    """
+    if np is None:
+        raise ImportError("score_matrix requires numpy (pip install numpy)")
+
+    if sectors is None:
+        sectors = list(JobSectors)
+    if personality_types is None:
+        personality_types = [person.get("PersonalityTypeMB", "") for person in persons]
+
+    n = len(persons)
+    known = [sector for sector in sectors if sector in JobSectors]
+    columns = [i for i, sector in enumerate(sectors) if sector in JobSectors]
+    tensor = np.zeros((n, len(sectors), len(SCORE_CATEGORIES)))
+    if n == 0 or not known:
+        return tensor
+
+    profiles = [_build_profile(normalize_cv(person)) for person in persons]
+
+    def column(attribute: str) -> "np.ndarray":
+        return np.array([getattr(p, attribute) for p in profiles])[:, None]
+
+    education = _SectorVocabulary(known, ("School/College",))
+    work = _SectorVocabulary(known, ("WorkExperience",))
+    skills = _SectorVocabulary(known, ("Skills", "ExtraSkills"))
+
+    # Collect keyword hits as sparse (person, keyword, weight) triples
+    edu_hits = SparseHits()
+    work_hits = SparseHits()
+    skill_hits = SparseHits()
+    for i, profile in enumerate(profiles):
+        subject_hits = education.matcher.find(profile.subjects)
+        qualification_hits = (
+            education.matcher.find(profile.qualifications) - subject_hits
+        )
+        masters_hits = (
+            education.matcher.find(profile.masters_text)
+            - subject_hits
+            - qualification_hits
+        )
+        edu_hits.add(i, education.columns(subject_hits), 2.0)
+        edu_hits.add(i, education.columns(qualification_hits), 1.5)
+        edu_hits.add(i, education.columns(masters_hits), 2.0)
+
+        matched = set()
+        for text in profile.work_texts:
+            matched |= work.matcher.find(text)
+        work_hits.add(i, work.columns(matched), 1.0)
+
+        skill_hits.add(i, skills.columns(skills.matcher.find(profile.skills_text)), 1.0)
+
+    # Education
+    max_score = WEIGHTS["education"]
+    field_match = edu_hits.dot(education.presence("School/College"), n)
+    raw = column("qualification_points") + np.minimum(10.0, field_match)
+    raw = raw + column("university_bonus")
+    tensor[:, columns, 0] = np.minimum(max_score, (raw / 25.0) * max_score)
+
+    # Work experience
+    max_score = WEIGHTS["work_experience"]
+    relevance = 2.5 * work_hits.dot(work.presence("WorkExperience"), n)
+    raw = column("years_points") + column("seniority_points")
+    raw = raw + np.minimum(10.0, relevance)
+    tensor[:, columns, 1] = np.minimum(max_score, (raw / 30.0) * max_score)
+
+    # Skills
+    max_score = WEIGHTS["skills"]
+    matched_required = skill_hits.dot(skills.incidence["Skills"], n)
+    matched_extra = skill_hits.dot(skills.incidence["ExtraSkills"], n)
+    required_ratio = matched_required / skills.sizes["Skills"]
+    extra_ratio = matched_extra / skills.sizes["ExtraSkills"]
+    raw = (required_ratio * 0.7 + extra_ratio * 0.3) * max_score
+    raw = raw + column("driving_bonus")
+    tensor[:, columns, 2] = np.minimum(max_score, raw)
+
+    # Sector-independent categories
+    tensor[:, columns, 3] = column("language_score")
+    tensor[:, columns, 4] = column("soft_skills_score")
+    tensor[:, columns, 5] = column("additional_score")
+
+    # Personality bonus, looked up once per distinct type
+    bonus_rows = {}
+    for i, personality_type in enumerate(personality_types):
+        if personality_type not in bonus_rows:
+            bonus_rows[personality_type] = [
+                _calculate_personality_bonus(personality_type, sector)
+                for sector in known
+            ]
+        tensor[i, columns, 6] = bonus_rows[personality_type]
+
+    return tensor
+
+
+class _SectorVocabulary:
+    """Union of some keyword fields over sectors, with incidence matrices."""
+
+    def __init__(self, sectors: list, fields: tuple):
+        vocabulary = {}
+        for sector in sectors:
+            for field in fields:
+                for kw in JobSectors[sector].get(field, []):
+                    vocabulary.setdefault(kw.lower(), len(vocabulary))
+
+        self.index = vocabulary
+        self.matcher = compile_keywords(tuple(vocabulary))
+        # incidence[field][k, s]: how often keyword k is listed for sector s
+        self.incidence = {}
+        self.sizes = {}
+        for field in fields:
+            incidence = np.zeros((len(vocabulary), len(sectors)))
+            for s, sector in enumerate(sectors):
+                for kw in JobSectors[sector].get(field, []):
+                    incidence[vocabulary[kw.lower()], s] += 1
+            self.incidence[field] = incidence
+            self.sizes[field] = np.maximum(1, incidence.sum(axis=0))
+
+    def presence(self, field: str) -> "np.ndarray":
+        """Keyword x sector 0/1 matrix (repeated keywords count once)."""
+        return np.minimum(1.0, self.incidence[field])
+
+    def columns(self, matched: frozenset) -> list:
+        return [self.index[kw] for kw in matched]
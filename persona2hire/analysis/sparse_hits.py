@@ -0,0 +1,52 @@
+"""
+Sparse keyword hit matrices for the vectorized scorers.
+
+score_matrix and personality_batch both collect, per CV, the vocabulary
+columns a text matched. SparseHits stores those hits in coordinate form
+(row, column, weight) and multiplies them by a dense column x category
+matrix, which gives the per-CV category sums without ever building the
+dense CV x vocabulary matrix.
+
+Requires numpy.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+class SparseHits:
+    """Sparse row x column matrix in coordinate form."""
+
+    def __init__(self):
+        self.rows = []
+        self.cols = []
+        self.weights = []
+
+    def add(self, row: int, cols: list, weight: float):
+        """Add weight at each of cols in row (repeated columns add up)."""
+        self.rows.extend([row] * len(cols))
+        self.cols.extend(cols)
+        self.weights.extend([weight] * len(cols))
+
+    def dot(self, incidence: "np.ndarray", n: int) -> "np.ndarray":
+        """
+        Multiply by a dense matrix.
+
+        Args:
+            incidence: Column x category matrix (e.g. keyword x sector)
+            n: Number of rows of the result
+
+        Returns:
+            (n, categories) matrix of weighted sums per row
+        """
+        out = np.zeros((n, incidence.shape[1]))
+        if not self.rows:
+            return out
+        rows = np.array(self.rows)
+        weights = np.array(self.weights)
+        contrib = incidence[np.array(self.cols)].T * weights
+        for s in range(incidence.shape[1]):
+            out[:, s] = np.bincount(rows, weights=contrib[s], minlength=n)
+        return out
@@ -0,0 +1,302 @@
+"""
+Cache of per-category subscores for incremental rescoring.
+
+Each cell holds the unweighted value of one category for one CV (and one
+sector, for the keyword-dependent categories). Cells are keyed by:
+
+- a hash of only the CV fields that category reads, so editing a CV's
+  languages leaves its education and skills cells valid;
+- the sector (education, work experience, skills) or none (languages,
+  soft skills, additional, which are shared by all sectors);
+- a hash of the data the category reads: that sector's keyword lists in
+  JobSectors and the tables from constants. Tweaking one sector's keyword
+  list only invalidates that sector's cells.
+
+WEIGHTS are not part of the key: cached raw values are re-weighted on every
+read, so changing WEIGHTS costs no rescoring at all. Work experience cells
+also depend on today's date (ongoing jobs), so they expire daily.
+
+The cache is bounded: beyond maxsize cells the least recently used are
+dropped. The data hashes of a sector are remembered while the tables and
+keyword lists it reads are the same objects with the same lengths and the
+date is unchanged; after editing a list in place without changing its
+length, call invalidate_data().
+
+Scores read through the cache equal analyze_job and get_score_breakdown.
+"""
+
+import hashlib
+from collections import OrderedDict
+from datetime import date
+from typing import Optional
+
+from ..data import constants
+from ..data.job_sectors import JobSectors
+from .job_analyzer import (
+    _additional_raw,
+    _build_profile,
+    _education_raw,
+    _finish_score,
+    _language_raw,
+    _skills_raw,
+    _soft_skills_raw,
+    _weighted_score,
+    _work_raw,
+)
+from .normalized_cv import SKILLS_FIELDS, content_hash, normalize_cv, raw_cv
+
+
+# Cells kept in memory (about three per CV and sector, plus three per CV)
+DEFAULT_MAXSIZE = 500_000
+
+# Per category: CV fields read, JobSectors keyword lists read (None if the
+# category does not depend on the sector) and constants tables read
+_CATEGORIES = {
+    "education": (
+        (
+            "QualificationsAwarded",
+            "SubjectsStudied",
+            "Master1",
+            "Master2",
+            "College/University",
+        ),
+        ("School/College",),
+        ("Qualifications", "Top50Universities", "Top100Universities"),
+    ),
+    "work_experience": (
+        tuple(
+            f"{field}{i}"
+            for i in range(1, 4)
+            for field in ("Workplace", "Dates", "Occupation", "MainActivities")
+        ),
+        ("WorkExperience",),
+        ("Functions",),
+    ),
+    "skills": (
+        tuple(SKILLS_FIELDS) + ("DrivingLicense",),
+        ("Skills", "ExtraSkills"),
+        (),
+    ),
+    "languages": (
+        ("MotherLanguage", "ModernLanguage1", "Level1", "ModernLanguage2", "Level2"),
+        None,
+        ("Languages", "LanguageLevels"),
+    ),
+    "soft_skills": (
+        (
+            "ShortDescription",
+            "CommunicationSkills",
+            "OrganizationalManagerialSkills",
+            "MainActivities1",
+            "MainActivities2",
+            "MainActivities3",
+        ),
+        None,
+        ("SoftSkills",),
+    ),
+    "additional": (
+        (
+            "Publications",
+            "HonoursAndAwards",
+            "Projects",
+            "Presentations",
+            "Conferences",
+            "Memberships",
+        ),
+        None,
+        (),
+    ),
+}
+
+
+class SubscoreCache:
+    """Raw category values cached by CV content, sector and data version."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """
+        Create an empty cache.
+
+        Args:
+            maxsize: Largest number of cells kept
+        """
+        self.maxsize = maxsize
+        self._cells = OrderedDict()
+        self._versions = {}  # sector -> (data fingerprint, versions)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def clear(self):
+        """Drop all cached cells and data hashes, and reset the counters."""
+        self._cells.clear()
+        self._versions.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate_data(self):
+        """Hash the scoring data again on the next read (cells are kept)."""
+        self._versions.clear()
+
+    def subscores(
+        self, persons: list, sector: str, weights: Optional[dict] = None
+    ) -> list:
+        """
+        Get the weighted category scores of many persons for one sector.
+
+        Args:
+            persons: List of person dictionaries (or NormalizedCV objects)
+            sector: Job sector key from JobSectors
+            weights: Category weights (default: WEIGHTS)
+
+        Returns:
+            One dictionary per person with the six category scores, as in
+            get_score_breakdown (empty for an unknown sector)
+        """
+        if sector not in JobSectors:
+            return [{} for _ in persons]
+
+        versions = self._sector_versions(sector)
+        return [
+            {
+                category: _weighted_score(category, raw, weights)
+                for category, raw in self._raw_values(person, sector, versions).items()
+            }
+            for person in persons
+        ]
+
+    def scores(
+        self,
+        persons: list,
+        sector: str,
+        use_ml: bool = None,
+        weights: Optional[dict] = None,
+    ) -> list:
+        """
+        Score many persons for one sector.
+
+        Args:
+            persons: List of person dictionaries (or NormalizedCV objects)
+            sector: Job sector key from JobSectors
+            use_ml: Whether to use ML adjustment (None = use global setting)
+            weights: Category weights (default: WEIGHTS)
+
+        Returns:
+            One score per person; equal to analyze_job with default weights
+        """
+        if sector not in JobSectors:
+            return [0.0] * len(persons)
+
+        results = []
+        subscores = self.subscores(persons, sector, weights)
+        for person, categories in zip(persons, subscores):
+            # Same summation order as _rule_score
+            total_score = (
+                categories["education"]
+                + categories["work_experience"]
+                + categories["skills"]
+                + categories["languages"]
+                + categories["soft_skills"]
+                + categories["additional"]
+            )
+            results.append(_finish_score(total_score, person, sector, use_ml=use_ml))
+        return results
+
+    def _raw_values(self, person, sector: str, versions: dict) -> dict:
+        """Look up (or compute and store) every category's raw value."""
+        person = raw_cv(person)
+        values = {}
+        missing = []
+        for category, (fields, keyword_lists, _) in _CATEGORIES.items():
+            key = (
+                category,
+                sector if keyword_lists is not None else None,
+                content_hash(person, fields),
+                versions[category],
+            )
+            value = self._get(key)
+            if value is None:
+                missing.append((category, key))
+            values[category] = value
+
+        if missing:
+            self.misses += len(missing)
+            cv = normalize_cv(person)
+            profile = _build_profile(cv)
+            for category, key in missing:
+                value = _compute_raw(category, cv, profile, sector)
+                self._put(key, value)
+                values[category] = value
+        return values
+
+    def _sector_versions(self, sector: str) -> dict:
+        """Data hashes of a sector, rehashed only when its data changed."""
+        fingerprint = _data_fingerprint(sector)
+        memo = self._versions.get(sector)
+        if memo is None or memo[0] != fingerprint:
+            memo = (fingerprint, _data_versions(sector))
+            self._versions[sector] = memo
+        return memo[1]
+
+    def _get(self, key: tuple):
+        """Look up a cell, marking it as recently used."""
+        value = self._cells.get(key)
+        if value is not None:
+            self._cells.move_to_end(key)
+            self.hits += 1
+        return value
+
+    def _put(self, key: tuple, value):
+        """Store a cell, dropping the least recently used beyond maxsize."""
+        self._cells[key] = value
+        self._cells.move_to_end(key)
+        while len(self._cells) > self.maxsize:
+            self._cells.popitem(last=False)
+
+
+def _compute_raw(category: str, cv, profile, sector: str):
+    """Compute one category's raw value."""
+    if category == "education":
+        return _education_raw(profile, sector)
+    if category == "work_experience":
+        return _work_raw(profile, sector)
+    if category == "skills":
+        return _skills_raw(profile, sector)
+    if category == "languages":
+        return _language_raw(cv)
+    if category == "soft_skills":
+        return _soft_skills_raw(cv)
+    return _additional_raw(cv)
+
+
+def _data_fingerprint(sector: str) -> tuple:
+    """
+    The scoring data of a sector with their lengths, and today's date.
+
+    Fingerprints compare equal cheaply while every object is the same one
+    (tuple comparison checks identity first); the objects are held, so their
+    ids cannot be reused by new ones.
+    """
+    sector_data = JobSectors[sector]
+    data = []
+    for _, keyword_lists, tables in _CATEGORIES.values():
+        data.extend(getattr(constants, table) for table in tables)
+        if keyword_lists is not None:
+            data.extend(sector_data.get(field, ()) for field in keyword_lists)
+    return (date.today(),) + tuple((item, len(item)) for item in data)
+
+
+def _data_versions(sector: str) -> dict:
+    """Hash the scoring data each category reads, for one sector."""
+    sector_data = JobSectors[sector]
+    versions = {}
+    for category, (_, keyword_lists, tables) in _CATEGORIES.items():
+        data = [getattr(constants, table) for table in tables]
+        if keyword_lists is not None:
+            data.extend(sector_data.get(field, ()) for field in keyword_lists)
+        if category == "work_experience":
+            data.append(date.today().isoformat())  # Ongoing jobs
+        digest = hashlib.blake2b(repr(data).encode("utf-8"), digest_size=16)
+        versions[category] = digest.digest()
+    return versions
@@ -0,0 +1,265 @@
+"""
+Compiled trait lexicon for MBTI word scoring.
+
+A CV token scores a trait when one of the trait's words is a substring of
+the lowercased token (an exact match being the simplest case). A
+TraitLexicon is built once from the Domains data:
+
+- an exact-match table from each lexicon word to every trait that word, as
+  a token, would score, so tokens that are lexicon words cost one lookup;
+- a KeywordMatcher over all lexicon words for the substring rule, which
+  finds every word contained in any other token in one scan.
+
+Lookups are cached per token, so a token seen before is a single dictionary
+hit. The traits of a token come back in Domains order, the order the nested
+loops used to visit them, and each trait at most once per token.
+
+Hobbies are scored by a HobbyMatcher: a hobby scores the trait of the first
+Hobbies word it contains or is contained in, and sports add a bonus. The
+matcher finds contained words with one KeywordMatcher scan, and words that
+contain the hobby with one search of all hobby words joined together.
+
+Lexicons and hobby matchers are cached on the word lists, so editing Domains
+or Hobbies simply compiles a new one on the next call.
+"""
+
+from bisect import bisect_right
+from functools import lru_cache
+
+from ..data.personality import Domains, Hobbies
+from .keyword_matcher import KeywordMatcher
+
+
+# Distinct tokens (or hobbies) remembered per lexicon
+TOKEN_CACHE_SIZE = 65536
+
+# Points of a hobby matched to a trait, and the traits a sport adds to
+HOBBY_POINTS = 1
+SPORTS_POINTS = 0.5
+SPORTS_TRAITS = (("E", "energetic"), ("S", "practical"))
+
+
+class TraitLexicon:
+    """Map CV tokens to the (domain, trait) pairs they score."""
+
+    __slots__ = ("traits", "exact", "_matcher", "_word_traits", "lookup")
+
+    def __init__(self, traits: tuple):
+        """
+        Compile a lexicon.
+
+        Args:
+            traits: ((domain, trait, words), ...) in scoring order
+        """
+        self.traits = tuple((domain, trait) for domain, trait, _ in traits)
+
+        # Position of every trait each (lowercased) word belongs to
+        word_traits = {}
+        for position, (_, _, words) in enumerate(traits):
+            for word in words:
+                positions = word_traits.setdefault(word.lower(), [])
+                if position not in positions:
+                    positions.append(position)
+        self._word_traits = word_traits
+        self._matcher = KeywordMatcher(word_traits)
+
+        self.exact = {word: self._match(word) for word in word_traits if word}
+        self.lookup = lru_cache(maxsize=TOKEN_CACHE_SIZE)(self._lookup)
+
+    def _lookup(self, token: str) -> tuple:
+        """
+        Find the traits a token scores.
+
+        Args:
+            token: Lowercased, stripped token
+
+        Returns:
+            Tuple of (domain, trait) pairs, in scoring order
+        """
+        if not token:
+            return ()
+        matched = self.exact.get(token)
+        if matched is None:
+            matched = self._match(token)
+        return matched
+
+    def _match(self, token: str) -> tuple:
+        """Scan a token for lexicon words and collect their traits."""
+        positions = set()
+        for word in self._matcher.find(token):
+            positions.update(self._word_traits[word])
+        return tuple(self.traits[position] for position in sorted(positions))
+
+    def __len__(self) -> int:
+        return len(self._word_traits)
+
+
+@lru_cache(maxsize=16)
+def compile_lexicon(traits: tuple) -> TraitLexicon:
+    """
+    Get a cached lexicon for a trait tuple.
+
+    Args:
+        traits: ((domain, trait, words), ...) with words as tuples
+
+    Returns:
+        Compiled TraitLexicon
+    """
+    return TraitLexicon(traits)
+
+
+def trait_lexicon(domains: dict = None) -> TraitLexicon:
+    """
+    Get the compiled lexicon for a domains dictionary.
+
+    Args:
+        domains: Domains-shaped dictionary (default: Domains)
+
+    Returns:
+        Compiled TraitLexicon
+    """
+    domains = Domains if domains is None else domains
+    return compile_lexicon(
+        tuple(
+            (domain_key, trait_key, tuple(trait_data.get("words", ())))
+            for domain_key, domain_data in domains.items()
+            for trait_key, trait_data in domain_data.items()
+            if trait_key != "SCORE" and isinstance(trait_data, dict)
+        )
+    )
+
+
+class HobbyMatcher:
+    """Map hobbies to the (domain, trait) points they score."""
+
+    __slots__ = (
+        "words",
+        "traits",
+        "_first",
+        "_matcher",
+        "_sports",
+        "_joined",
+        "_starts",
+        "lookup",
+    )
+
+    def __init__(self, words: tuple, traits: tuple, sports: tuple):
+        """
+        Compile a hobby matcher.
+
+        Args:
+            words: Hobby words, in matching order
+            traits: (domain, trait) of each word (None if it has none)
+            sports: Sport words
+        """
+        self.words = tuple(word.lower() for word in words)
+        self.traits = traits
+
+        # First position of each word, for hobbies that contain it
+        first = {}
+        for position, word in enumerate(self.words):
+            first.setdefault(word, position)
+        self._first = first
+        self._matcher = KeywordMatcher(first)
+        self._sports = KeywordMatcher(sports)
+
+        # All words on one line each, for hobbies contained in a word
+        self._joined = "\n".join(self.words)
+        starts = []
+        offset = 0
+        for word in self.words:
+            starts.append(offset)
+            offset += len(word) + 1
+        self._starts = starts
+
+        self.lookup = lru_cache(maxsize=TOKEN_CACHE_SIZE)(self._lookup)
+
+    def hits(self, hobbies: list) -> list:
+        """
+        Find the points scored by a list of hobbies.
+
+        Args:
+            hobbies: Hobby strings (stripped and lowercased here)
+
+        Returns:
+            List of ((domain, trait), points), hobby by hobby
+        """
+        lookup = self.lookup
+        return [hit for hobby in hobbies for hit in lookup(hobby.strip().lower())]
+
+    def _lookup(self, hobby: str) -> tuple:
+        """
+        Find the points one hobby scores.
+
+        Args:
+            hobby: Stripped, lowercased hobby
+
+        Returns:
+            Tuple of ((domain, trait), points)
+        """
+        hits = []
+        if hobby:
+            position = self._first_match(hobby)
+            if position is not None and self.traits[position] is not None:
+                hits.append((self.traits[position], HOBBY_POINTS))
+        if self._sports.find(hobby):
+            hits.extend((trait, SPORTS_POINTS) for trait in SPORTS_TRAITS)
+        return tuple(hits)
+
+    def _first_match(self, hobby: str):
+        """Position of the first word contained in, or containing, the hobby."""
+        positions = [self._first[word] for word in self._matcher.find(hobby)]
+        if "\n" in hobby:
+            positions.extend(
+                position
+                for position, word in enumerate(self.words)
+                if hobby in word
+            )
+        else:
+            index = self._joined.find(hobby)
+            if index >= 0:
+                positions.append(bisect_right(self._starts, index) - 1)
+        return min(positions, default=None)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+@lru_cache(maxsize=16)
+def compile_hobbies(words: tuple, traits: tuple, sports: tuple) -> HobbyMatcher:
+    """
+    Get a cached hobby matcher.
+
+    Args:
+        words: Hobby words, in matching order
+        traits: (domain, trait) of each word (None if it has none)
+        sports: Sport words
+
+    Returns:
+        Compiled HobbyMatcher
+    """
+    return HobbyMatcher(words, traits, sports)
+
+
+def hobby_matcher(hobbies: dict = None) -> HobbyMatcher:
+    """
+    Get the compiled matcher for a hobbies dictionary.
+
+    Args:
+        hobbies: Hobbies-shaped dictionary (default: Hobbies)
+
+    Returns:
+        Compiled HobbyMatcher
+    """
+    hobbies = Hobbies if hobbies is None else hobbies
+    words = tuple(hobbies.get("words", ()))
+    domains = hobbies.get("domain", [])
+    traits = hobbies.get("trait", [])
+    return compile_hobbies(
+        words,
+        tuple(
+            (domains[i], traits[i]) if i < len(domains) and i < len(traits) else None
+            for i in range(len(words))
+        ),
+        tuple(hobbies.get("sports", ())),
+    )
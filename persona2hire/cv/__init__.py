@@ -1,13 +1,49 @@
 """CV file operations - parsing and writing."""
 
-from .parser import read_cv_file, validate_cv_data, get_cv_summary
-from .writer import write_cv_file, create_empty_cv, cv_to_string
+from .bundle import CVBundle, CVBundleWriter, pack_cv_files
+from .cache import CVCache
+from .columnar import ColumnarCorpus, write_columnar
+from .dates import parse_date, parse_date_range, tenure_years
+from .parser import (
+    read_cv_file,
+    parse_cv_text,
+    iter_cv_files,
+    iter_cv_directory,
+    validate_cv_data,
+    get_cv_summary,
+)
+from .validation import ValidationReport, validate_many
+from .writer import (
+    write_cv_file,
+    write_cv_files,
+    write_cv_to_stream,
+    render_cv_text,
+    create_empty_cv,
+    cv_to_string,
+)
 
 __all__ = [
     "read_cv_file",
+    "parse_cv_text",
+    "iter_cv_files",
+    "iter_cv_directory",
     "validate_cv_data",
+    "validate_many",
+    "ValidationReport",
     "get_cv_summary",
     "write_cv_file",
+    "write_cv_files",
+    "write_cv_to_stream",
+    "render_cv_text",
     "create_empty_cv",
     "cv_to_string",
+    "CVCache",
+    "CVBundle",
+    "CVBundleWriter",
+    "pack_cv_files",
+    "ColumnarCorpus",
+    "write_columnar",
+    "parse_date",
+    "parse_date_range",
+    "tenure_years",
 ]
@@ -0,0 +1,350 @@
+"""
+CV bundles: many CV files packed into one memory-mapped file.
+
+A bundle holds the text of each CV (UTF-8, as in a CV file) back to back,
+followed by an index, so thousands of CVs are one file to open, list and
+back up. Layout (little-endian):
+
+    header   magic (8 bytes), version (u16), reserved (u16), count (u32),
+             index offset (u64), ids offset (u64), ids length (u64)
+    records  the CV texts
+    index    count x (record offset (u64), record length (u64))
+    ids      JSON list of the candidate ids, in record order
+
+CVBundle maps the file with mmap. Looking up a candidate id is a dictionary
+access, a record is a memoryview slice of the mapping (no copy), and only the
+records that are read are paged in. read() gives the same dictionary as
+read_cv_file on the original file.
+"""
+
+import json
+import mmap
+import os
+import struct
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from .parser import _read_cv_text, parse_cv_text
+from .writer import render_cv_text
+
+
+BUNDLE_MAGIC = b"P2HCVBDL"
+BUNDLE_VERSION = 1
+BUNDLE_SUFFIX = ".cvbundle"
+
+_HEADER = struct.Struct("<8sHHIQQQ")
+_INDEX_ENTRY = struct.Struct("<QQ")
+
+
+class CVBundleWriter:
+    """Write CVs to a new bundle file, one record at a time."""
+
+    def __init__(self, path: str):
+        """
+        Start a bundle.
+
+        The bundle is written to a temporary file next to path and only
+        replaces path when close() succeeds.
+
+        Args:
+            path: Bundle file to create
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._temp_path = f"{path}.tmp"
+        self._file: Optional[BinaryIO] = open(self._temp_path, "wb")
+        self._file.write(b"\0" * _HEADER.size)  # Filled in by close()
+        self._offset = _HEADER.size
+        self._entries = []
+        self._ids = []
+        self._seen = set()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def add_text(self, candidate_id: str, text: str):
+        """
+        Add the text of a CV file.
+
+        Args:
+            candidate_id: Unique id of the CV within the bundle
+            text: CV file contents
+
+        Raises:
+            ValueError: If the id is already in the bundle
+        """
+        if candidate_id in self._seen:
+            raise ValueError(f"Duplicate candidate id: {candidate_id}")
+        data = text.encode("utf-8")
+        self._file.write(data)
+        self._entries.append((self._offset, len(data)))
+        self._offset += len(data)
+        self._ids.append(candidate_id)
+        self._seen.add(candidate_id)
+
+    def add_cv(self, candidate_id: str, person: dict):
+        """
+        Add a CV dictionary, rendered as write_cv_file would write it.
+
+        Args:
+            candidate_id: Unique id of the CV within the bundle
+            person: Dictionary containing CV data
+        """
+        self.add_text(candidate_id, render_cv_text(person))
+
+    def close(self):
+        """Write the index and header and move the bundle into place."""
+        if self._file is None:
+            return
+        index_offset = self._offset
+        for offset, length in self._entries:
+            self._file.write(_INDEX_ENTRY.pack(offset, length))
+        ids = json.dumps(self._ids).encode("utf-8")
+        ids_offset = index_offset + len(self._entries) * _INDEX_ENTRY.size
+        self._file.write(ids)
+
+        self._file.seek(0)
+        self._file.write(
+            _HEADER.pack(
+                BUNDLE_MAGIC,
+                BUNDLE_VERSION,
+                0,
+                len(self._entries),
+                index_offset,
+                ids_offset,
+                len(ids),
+            )
+        )
+        self._file.close()
+        self._file = None
+        os.replace(self._temp_path, self.path)
+
+    def abort(self):
+        """Discard the partly written bundle."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        try:
+            os.remove(self._temp_path)
+        except OSError:
+            pass
+
+
+class CVBundle:
+    """Read-only, memory-mapped access to the CVs in a bundle."""
+
+    def __init__(self, path: str):
+        """
+        Open a bundle.
+
+        Args:
+            path: Bundle file
+
+        Raises:
+            ValueError: If the file is not a readable bundle
+            OSError: If the file cannot be opened
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"Not a CV bundle: {path}")
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._map)
+
+        try:
+            self._read_header(size)
+        except Exception:
+            self._buffer.release()
+            self._map.close()
+            raise
+
+    def _read_header(self, size: int):
+        """Check the header and load the index and candidate ids."""
+        (
+            magic,
+            version,
+            _,
+            count,
+            index_offset,
+            ids_offset,
+            ids_length,
+        ) = _HEADER.unpack_from(self._map, 0)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError(f"Not a CV bundle: {self.path}")
+        if version != BUNDLE_VERSION:
+            raise ValueError(f"Unsupported CV bundle version {version}: {self.path}")
+        if (
+            index_offset + count * _INDEX_ENTRY.size != ids_offset
+            or ids_offset + ids_length > size
+        ):
+            raise ValueError(f"Truncated CV bundle: {self.path}")
+
+        self._count = count
+        self._index_offset = index_offset
+        ids = self._buffer[ids_offset : ids_offset + ids_length]
+        with ids:
+            self._ids = json.loads(str(ids, "utf-8"))
+        self._positions = {
+            candidate_id: position for position, candidate_id in enumerate(self._ids)
+        }
+        if len(self._ids) != count or len(self._positions) != count:
+            raise ValueError(f"Corrupt CV bundle index: {self.path}")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, candidate_id) -> bool:
+        return candidate_id in self._positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __getitem__(self, candidate_id: str) -> dict:
+        return self.read(candidate_id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def ids(self) -> list:
+        """Candidate ids, in bundle order."""
+        return list(self._ids)
+
+    def record(self, candidate_id: str) -> memoryview:
+        """
+        Get the raw bytes of one CV without copying them.
+
+        The view points into the mapped file: release it before closing the
+        bundle.
+
+        Args:
+            candidate_id: Id of the CV
+
+        Returns:
+            Read-only memoryview of the UTF-8 CV text
+
+        Raises:
+            KeyError: If the id is not in the bundle
+        """
+        return self._record_at(self._positions[candidate_id])
+
+    def text(self, candidate_id: str) -> str:
+        """
+        Get the text of one CV.
+
+        Args:
+            candidate_id: Id of the CV
+
+        Returns:
+            CV file contents
+
+        Raises:
+            KeyError: If the id is not in the bundle
+        """
+        with self.record(candidate_id) as record:
+            return _decode(record)
+
+    def read(self, candidate_id: str) -> dict:
+        """
+        Parse one CV, as read_cv_file would parse the original file.
+
+        Args:
+            candidate_id: Id of the CV
+
+        Returns:
+            Dictionary containing all CV data fields
+
+        Raises:
+            KeyError: If the id is not in the bundle
+        """
+        return parse_cv_text(self.text(candidate_id))
+
+    def iter_cvs(self) -> Iterator[tuple[str, dict]]:
+        """
+        Parse every CV in bundle order.
+
+        Yields:
+            (candidate_id, cv_data) tuples
+        """
+        for position, candidate_id in enumerate(self._ids):
+            with self._record_at(position) as record:
+                text = _decode(record)
+            yield candidate_id, parse_cv_text(text)
+
+    def close(self):
+        """Unmap the bundle."""
+        if self._map.closed:
+            return
+        self._buffer.release()
+        try:
+            self._map.close()
+        except BufferError:
+            # A record view is still held; the mapping is freed with it
+            pass
+
+    def _record_at(self, position: int) -> memoryview:
+        """Slice the record at an index position out of the mapping."""
+        offset, length = _INDEX_ENTRY.unpack_from(
+            self._map, self._index_offset + position * _INDEX_ENTRY.size
+        )
+        return self._buffer[offset : offset + length]
+
+
+def pack_cv_files(
+    filepaths: Iterable[str],
+    bundle_path: str,
+    ids: Optional[Iterable[str]] = None,
+) -> int:
+    """
+    Pack CV files into a bundle.
+
+    Files are read as read_cv_file reads them (UTF-8, falling back to
+    Latin-1) and stored as UTF-8.
+
+    Args:
+        filepaths: Paths of CV files
+        bundle_path: Bundle file to create
+        ids: Candidate ids, one per file (default: file names without
+            extension)
+
+    Returns:
+        Number of CVs packed
+
+    Raises:
+        ValueError: If two files get the same candidate id, or ids and
+            filepaths differ in length
+        OSError: If a file cannot be read or the bundle cannot be written
+    """
+    filepaths = list(filepaths)
+    if ids is None:
+        ids = [os.path.splitext(os.path.basename(path))[0] for path in filepaths]
+    else:
+        ids = list(ids)
+        if len(ids) != len(filepaths):
+            raise ValueError(f"Got {len(ids)} candidate ids for {len(filepaths)} files")
+
+    with CVBundleWriter(bundle_path) as writer:
+        for candidate_id, filepath in zip(ids, filepaths):
+            writer.add_text(candidate_id, _read_cv_text(filepath))
+        return len(writer)
+
+
+def _decode(record: memoryview) -> str:
+    """Decode a record (UTF-8, falling back to Latin-1 as for files)."""
+    try:
+        return str(record, "utf-8")
+    except UnicodeDecodeError:
+        return str(record, "latin-1")
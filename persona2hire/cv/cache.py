@@ -0,0 +1,265 @@
+"""
+Persistent cache of parsed CV files.
+
+Stores the output of read_cv_file and the validation error names of
+validate_many (field -> name, see ValidationReport.errors) in a SQLite
+database, keyed by absolute path. Messages are not stored: format_errors
+turns the names into messages when a CV's errors are actually shown.
+
+An entry is only used while the file's modification time and size, and the
+parser version, are unchanged; otherwise the file is parsed again and the
+entry replaced. Re-opening a folder of unchanged CVs is then one stat per
+file plus a bulk lookup.
+
+A CVCache can be handed between threads but must not be used by two threads
+at the same time.
+"""
+
+import json
+import os
+import sqlite3
+from typing import Iterable, Iterator, Optional
+
+from .parser import DEFAULT_IO_WORKERS, PARSER_VERSION, iter_cv_files
+from .validation import validate_many
+
+
+DEFAULT_CACHE_PATH = "data/cache/cv_cache.sqlite3"
+
+# Paths per lookup query (SQLite limits the number of bound parameters)
+_LOOKUP_CHUNK = 500
+
+# Files looked up, parsed and stored together by iter_cv_files
+_BATCH_SIZE = 512
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cv_cache (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    parser_version INTEGER NOT NULL,
+    cv TEXT NOT NULL,
+    is_valid INTEGER NOT NULL,
+    errors TEXT NOT NULL
+)
+"""
+
+
+class CVCache:
+    """SQLite-backed cache of parsed and validated CV files."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        """
+        Open (or create) a cache database.
+
+        Args:
+            path: Database file (":memory:" for a cache that is not saved)
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def __len__(self) -> int:
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM cv_cache").fetchone()
+        return count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the database."""
+        self._connection.close()
+
+    def get_many(self, filepaths: Iterable[str]) -> dict:
+        """
+        Look up the cached results of many files.
+
+        Args:
+            filepaths: Paths of CV files
+
+        Returns:
+            Dictionary of filepath -> (cv_data, is_valid, errors) for the files
+            with an up-to-date entry; errors maps fields to error names
+        """
+        stats = {}
+        for filepath in filepaths:
+            stat = _stat(filepath)
+            if stat is not None:
+                stats[filepath] = stat
+        return self._lookup(stats)
+
+    def put_many(self, records: Iterable[tuple[str, dict, bool, dict]]):
+        """
+        Store the results of many files.
+
+        Args:
+            records: (filepath, cv_data, is_valid, errors) tuples for files
+                that have just been read, errors mapping fields to error names
+        """
+        rows = []
+        for filepath, cv_data, is_valid, errors in records:
+            stat = _stat(filepath)
+            if stat is not None:
+                rows.append((filepath, stat, cv_data, is_valid, errors))
+        self._store(rows)
+
+    def invalidate(self, filepaths: Optional[Iterable[str]] = None) -> int:
+        """
+        Remove cache entries.
+
+        Args:
+            filepaths: Files to forget (default: all entries)
+
+        Returns:
+            Number of entries removed
+        """
+        with self._connection:
+            if filepaths is None:
+                return self._connection.execute("DELETE FROM cv_cache").rowcount
+            return self._connection.executemany(
+                "DELETE FROM cv_cache WHERE path = ?",
+                ((os.path.abspath(filepath),) for filepath in filepaths),
+            ).rowcount
+
+    def prune(self) -> int:
+        """
+        Remove entries for files that have changed, moved or been deleted.
+
+        Returns:
+            Number of entries removed
+        """
+        rows = self._connection.execute(
+            "SELECT path, mtime_ns, size, parser_version FROM cv_cache"
+        ).fetchall()
+        stale = [
+            path
+            for path, mtime_ns, size, version in rows
+            if version != PARSER_VERSION or _stat(path) != (mtime_ns, size)
+        ]
+        return self.invalidate(stale)
+
+    def iter_cv_files(
+        self, filepaths: Iterable[str], workers: int = DEFAULT_IO_WORKERS
+    ) -> Iterator[tuple[str, dict | Exception, Optional[tuple[bool, dict]]]]:
+        """
+        Read, parse and validate many CV files, using the cache.
+
+        Files without an up-to-date entry are read with parser.iter_cv_files
+        and stored. Files are handled in batches, so any number can be
+        streamed.
+
+        Args:
+            filepaths: Paths of CV files
+            workers: Number of files read concurrently
+
+        Yields:
+            (filepath, result, validation) tuples in input order; result is
+            the CV dictionary or the exception raised while reading, and
+            validation is (is_valid, errors), or None for unreadable files;
+            errors maps fields to error names (see format_errors)
+        """
+        batch = []
+        for filepath in filepaths:
+            batch.append(filepath)
+            if len(batch) == _BATCH_SIZE:
+                yield from self._load_batch(batch, workers)
+                batch = []
+        if batch:
+            yield from self._load_batch(batch, workers)
+
+    def _load_batch(self, filepaths: list, workers: int) -> Iterator[tuple]:
+        """Load one batch of files, reading only those not in the cache."""
+        stats = {}
+        for filepath in filepaths:
+            stat = _stat(filepath)
+            if stat is not None:
+                stats[filepath] = stat
+        cached = self._lookup(stats)
+
+        # Stats are taken before reading, so a file changed mid-read is
+        # simply parsed again next time
+        missing = [filepath for filepath in filepaths if filepath not in cached]
+        loaded = {}
+        if missing:
+            parsed = []
+            for filepath, cv_data in iter_cv_files(missing, workers):
+                if isinstance(cv_data, Exception):
+                    loaded[filepath] = (cv_data, None)
+                else:
+                    parsed.append((filepath, cv_data))
+
+            # One validation pass over the batch; only error names are kept
+            report = validate_many([cv_data for _, cv_data in parsed])
+            rows = []
+            for index, (filepath, cv_data) in enumerate(parsed):
+                errors = report.errors(index)
+                is_valid = not errors
+                loaded[filepath] = (cv_data, (is_valid, errors))
+                if filepath in stats:
+                    stat = stats[filepath]
+                    rows.append((filepath, stat, cv_data, is_valid, errors))
+            self._store(rows)
+
+        for filepath in filepaths:
+            if filepath in cached:
+                cv_data, is_valid, errors = cached[filepath]
+                yield filepath, cv_data, (is_valid, errors)
+            else:
+                cv_data, validation = loaded[filepath]
+                yield filepath, cv_data, validation
+
+    def _lookup(self, stats: dict) -> dict:
+        """Find up-to-date entries: filepath -> (cv_data, is_valid, errors)."""
+        by_path = {os.path.abspath(filepath): filepath for filepath in stats}
+        paths = list(by_path)
+        found = {}
+        for start in range(0, len(paths), _LOOKUP_CHUNK):
+            chunk = paths[start : start + _LOOKUP_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self._connection.execute(
+                "SELECT path, mtime_ns, size, parser_version, cv, is_valid, errors "
+                f"FROM cv_cache WHERE path IN ({placeholders})",
+                chunk,
+            )
+            for path, mtime_ns, size, version, cv, is_valid, errors in rows:
+                filepath = by_path[path]
+                if (mtime_ns, size) != stats[filepath] or version != PARSER_VERSION:
+                    continue  # Stale: the file changed or the parser did
+                found[filepath] = (json.loads(cv), bool(is_valid), json.loads(errors))
+        return found
+
+    def _store(self, rows: list):
+        """Insert or replace entries: (filepath, stat, cv, is_valid, errors)."""
+        if not rows:
+            return
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO cv_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        os.path.abspath(filepath),
+                        mtime_ns,
+                        size,
+                        PARSER_VERSION,
+                        json.dumps(cv_data),
+                        int(is_valid),
+                        json.dumps(errors),
+                    )
+                    for filepath, (mtime_ns, size), cv_data, is_valid, errors in rows
+                ),
+            )
+
+
+def _stat(filepath: str) -> Optional[tuple[int, int]]:
+    """Get (mtime in ns, size) of a file, or None if it cannot be read."""
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
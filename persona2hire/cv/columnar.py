@@ -0,0 +1,321 @@
+"""
+Columnar storage of a parsed CV corpus.
+
+A corpus is saved as a directory with one set of numpy arrays per CV field
+and a meta.json file listing them:
+
+- categorical fields (nationality, sex, languages and levels, driving
+  license) are dictionary-encoded: <field>.codes.npy holds an int32 code per
+  CV and <field>.categories.json the distinct values (JSON rather than a
+  fixed-width string array, which would drop trailing NUL characters);
+- every other field is offset-encoded text: <field>.data.npy holds the UTF-8
+  bytes of all values back to back and <field>.offsets.npy (int64, one more
+  than the number of CVs) where each value starts and ends.
+
+ColumnarCorpus loads nothing up front. A column's arrays are memory-mapped
+the first time it is used, so a filter or score that reads three fields
+touches three columns and never builds the per-candidate dictionaries.
+row() rebuilds one CV dictionary when it is needed.
+
+The Score field is not stored (rows have the default 0). Requires numpy.
+"""
+
+import json
+import os
+from typing import Callable, Iterable, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+from .parser import CV_FIELDS, _initialize_empty_cv
+
+
+COLUMNAR_FORMAT = "persona2hire-columnar"
+COLUMNAR_VERSION = 2
+
+# Fields with few distinct values, stored dictionary-encoded
+CATEGORICAL_FIELDS = (
+    "Nationality",
+    "Sex",
+    "MotherLanguage",
+    "ModernLanguage1",
+    "Level1",
+    "ModernLanguage2",
+    "Level2",
+    "DrivingLicense",
+)
+
+# Fields stored (all CV fields except Score)
+COLUMNS = tuple(field for field in CV_FIELDS if field != "Score")
+
+_META_FILE = "meta.json"
+
+
+def write_columnar(persons: Iterable[dict], directory: str) -> int:
+    """
+    Save CVs as a columnar corpus.
+
+    Args:
+        persons: Person dictionaries (e.g. from read_cv_file)
+        directory: Directory to write (created if needed; existing column
+            files are replaced)
+
+    Returns:
+        Number of CVs saved
+    """
+    _require_numpy()
+    os.makedirs(directory, exist_ok=True)
+
+    category_codes = {field: {} for field in CATEGORICAL_FIELDS}
+    codes = {field: [] for field in CATEGORICAL_FIELDS}
+    data = {field: bytearray() for field in COLUMNS if field not in codes}
+    offsets = {field: [0] for field in data}
+    count = 0
+
+    for person in persons:
+        count += 1
+        for field in COLUMNS:
+            value = _column_value(person.get(field))
+            if field in codes:
+                known = category_codes[field]
+                codes[field].append(known.setdefault(value, len(known)))
+            else:
+                buffer = data[field]
+                buffer += value.encode("utf-8")
+                offsets[field].append(len(buffer))
+
+    columns = {}
+    for field in COLUMNS:
+        stem = _file_stem(field)
+        path = os.path.join(directory, stem)
+        if field in codes:
+            np.save(f"{path}.codes.npy", np.array(codes[field], dtype=np.int32))
+            categories = list(category_codes[field])
+            with open(f"{path}.categories.json", "w", encoding="utf-8") as f:
+                json.dump(categories, f)
+            columns[field] = {"kind": "categorical", "file": stem}
+        else:
+            np.save(f"{path}.data.npy", np.frombuffer(data[field], dtype=np.uint8))
+            np.save(f"{path}.offsets.npy", np.array(offsets[field], dtype=np.int64))
+            columns[field] = {"kind": "text", "file": stem}
+
+    meta = {
+        "format": COLUMNAR_FORMAT,
+        "version": COLUMNAR_VERSION,
+        "count": count,
+        "columns": columns,
+    }
+    with open(os.path.join(directory, _META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    return count
+
+
+class CategoricalColumn:
+    """A dictionary-encoded column: a code per CV and the distinct values."""
+
+    def __init__(self, codes: "np.ndarray", categories: list):
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> str:
+        return self.categories[self.codes[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_list())
+
+    def to_list(self) -> list:
+        """Decode every value."""
+        categories = self.categories
+        return [categories[code] for code in self.codes.tolist()]
+
+    def map(self, function: Callable, dtype=None) -> "np.ndarray":
+        """
+        Apply a function to every value, calling it once per distinct value.
+
+        Args:
+            function: Function of a value
+            dtype: Result dtype (default: inferred from the results)
+
+        Returns:
+            Array with function(value) for each CV
+        """
+        if not self.categories:
+            return np.zeros(len(self.codes), dtype=dtype or bool)
+        mapped = np.array([function(value) for value in self.categories], dtype=dtype)
+        return mapped[self.codes]
+
+    def mask(self, predicate: Callable[[str], bool]) -> "np.ndarray":
+        """
+        Test every value, calling the predicate once per distinct value.
+
+        Args:
+            predicate: Function of a value returning a boolean
+
+        Returns:
+            Boolean array, True for the CVs whose value passes
+        """
+        return self.map(predicate, dtype=bool)
+
+
+class TextColumn:
+    """An offset-encoded text column."""
+
+    def __init__(self, data: "np.ndarray", offsets: "np.ndarray"):
+        self.data = data
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.data[start:end].tobytes().decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_list())
+
+    def to_list(self) -> list:
+        """Decode every value."""
+        data = self.data.tobytes()
+        offsets = self.offsets.tolist()
+        return [
+            data[start:end].decode("utf-8")
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+
+
+class ColumnarCorpus:
+    """A columnar corpus on disk, loaded one column at a time."""
+
+    def __init__(self, directory: str):
+        """
+        Open a corpus written by write_columnar.
+
+        Args:
+            directory: Corpus directory
+
+        Raises:
+            ValueError: If the directory does not hold a columnar corpus
+            OSError: If the metadata cannot be read
+        """
+        _require_numpy()
+        with open(os.path.join(directory, _META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != COLUMNAR_FORMAT:
+            raise ValueError(f"Not a columnar CV corpus: {directory}")
+        if meta.get("version") != COLUMNAR_VERSION:
+            raise ValueError(
+                f"Unsupported columnar corpus version {meta.get('version')}: "
+                f"{directory}"
+            )
+        self.directory = directory
+        self._count = meta["count"]
+        self._specs = meta["columns"]
+        self._columns = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, field: str):
+        return self.column(field)
+
+    @property
+    def columns(self) -> tuple:
+        """Names of the stored fields."""
+        return tuple(self._specs)
+
+    @property
+    def loaded_columns(self) -> tuple:
+        """Names of the fields loaded so far."""
+        return tuple(self._columns)
+
+    def column(self, field: str):
+        """
+        Get one column, loading it on first use.
+
+        Args:
+            field: CV field name
+
+        Returns:
+            CategoricalColumn or TextColumn
+
+        Raises:
+            KeyError: If the field is not stored
+        """
+        column = self._columns.get(field)
+        if column is None:
+            spec = self._specs[field]
+            path = os.path.join(self.directory, spec["file"])
+            if spec["kind"] == "categorical":
+                with open(f"{path}.categories.json", encoding="utf-8") as f:
+                    categories = json.load(f)
+                column = CategoricalColumn(_load_array(f"{path}.codes.npy"), categories)
+            else:
+                column = TextColumn(
+                    _load_array(f"{path}.data.npy"),
+                    _load_array(f"{path}.offsets.npy"),
+                )
+            self._columns[field] = column
+        return column
+
+    def row(self, index: int) -> dict:
+        """
+        Rebuild the dictionary of one CV (loads every column).
+
+        Args:
+            index: Position of the CV
+
+        Returns:
+            Dictionary containing all CV data fields
+        """
+        cv_data = _initialize_empty_cv()
+        for field in self._specs:
+            cv_data[field] = self.column(field)[index]
+        return cv_data
+
+    def iter_rows(self) -> Iterator[dict]:
+        """
+        Rebuild every CV dictionary, in order.
+
+        Yields:
+            Dictionaries containing all CV data fields
+        """
+        values = {field: self.column(field).to_list() for field in self._specs}
+        for index in range(self._count):
+            cv_data = _initialize_empty_cv()
+            for field, column_values in values.items():
+                cv_data[field] = column_values[index]
+            yield cv_data
+
+
+def _column_value(value) -> str:
+    """Convert a field value to the stored string."""
+    if value is None:
+        return ""
+    return str(value)
+
+
+def _file_stem(field: str) -> str:
+    """File name prefix of a field's arrays."""
+    return field.replace("/", "_")
+
+
+def _load_array(path: str) -> "np.ndarray":
+    """Memory-map an array file (empty arrays cannot be mapped)."""
+    try:
+        return np.load(path, mmap_mode="r")
+    except ValueError:
+        return np.load(path)
+
+
+def _require_numpy():
+    """Raise ImportError if numpy is missing."""
+    if np is None:
+        raise ImportError("Columnar CV corpora require numpy (pip install numpy)")
@@ -0,0 +1,305 @@
+"""
+Date and date-range parsing for CV fields.
+
+Shared by the job analyzer, the normalized CV view and the ML feature
+extractor. Common formats are recognized by precompiled patterns; anything
+else goes through the general fallback parser. Results are cached (CV
+corpora repeat the same date strings constantly), and ranges are cached
+without resolving "current" to today's date, so cached entries never go
+stale.
+
+Supported date formats: DD.MM.YYYY, MM/DD/YYYY (DD/MM/YYYY when the first
+number is over 12), YYYY-MM-DD, Month YYYY, YYYY.
+Date ranges: "01.01.2020 - 31.12.2023" or "01.01.2020 - current".
+
+The batch helpers return numpy datetime64 arrays and require numpy.
+"""
+
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+# Range ends that mean "still ongoing"
+OPEN_ENDS = frozenset(["current", "present", "now", "ongoing", ""])
+
+_MONTHS = {
+    "january": 1,
+    "jan": 1,
+    "february": 2,
+    "feb": 2,
+    "march": 3,
+    "mar": 3,
+    "april": 4,
+    "apr": 4,
+    "may": 5,
+    "june": 6,
+    "jun": 6,
+    "july": 7,
+    "jul": 7,
+    "august": 8,
+    "aug": 8,
+    "september": 9,
+    "sep": 9,
+    "sept": 9,
+    "october": 10,
+    "oct": 10,
+    "november": 11,
+    "nov": 11,
+    "december": 12,
+    "dec": 12,
+}
+
+# Fast paths for the common formats (fullmatch on the stripped string)
+_DOTTED_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+_SLASHED_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_ISO_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_MONTH_YEAR_RE = re.compile(r"([A-Za-z]+)\s+(\d{4})")
+_YEAR_RE = re.compile(r"\d{4}")
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date_str: str) -> Optional[date]:
+    """
+    Parse a date string in various formats.
+
+    Args:
+        date_str: Date text
+
+    Returns:
+        Parsed date, or None if the text is not a supported date
+    """
+    if not date_str:
+        return None
+
+    date_str = date_str.strip()
+
+    try:
+        match = _DOTTED_RE.fullmatch(date_str)
+        if match:
+            day, month, year = map(int, match.groups())
+            return date(year, month, day)
+
+        match = _SLASHED_RE.fullmatch(date_str)
+        if match:
+            first, second, year = map(int, match.groups())
+            # Assume MM/DD/YYYY if first <= 12, else DD/MM/YYYY
+            if first <= 12:
+                return date(year, first, second)
+            return date(year, second, first)
+
+        match = _ISO_RE.fullmatch(date_str)
+        if match:
+            year, month, day = map(int, match.groups())
+            return date(year, month, day)
+
+        match = _MONTH_YEAR_RE.fullmatch(date_str)
+        if match:
+            month = _MONTHS.get(match.group(1).lower())
+            return date(int(match.group(2)), month, 1) if month else None
+    except ValueError:
+        # Well-formed but impossible (e.g. 31.02.2020)
+        return None
+
+    if _YEAR_RE.fullmatch(date_str):
+        year = int(date_str)
+        return date(year, 1, 1) if 1900 <= year <= 2100 else None
+
+    return _parse_date_fallback(date_str)
+
+
+@lru_cache(maxsize=4096)
+def parse_date_range(dates_str: str) -> Optional[tuple[date, Optional[date]]]:
+    """
+    Parse a "start - end" date range.
+
+    Args:
+        dates_str: Date range text
+
+    Returns:
+        (start, end) tuple, or None if there is no parseable start date.
+        end is None for ongoing ranges ("current", "present", ...) and for
+        unparseable ends; both mean "until today".
+    """
+    if not dates_str or "-" not in dates_str:
+        return None
+
+    parts = dates_str.split("-")
+    if len(parts) != 2:
+        return None
+
+    start = parse_date(parts[0].strip())
+    if not start:
+        return None
+
+    date_finish = parts[1].strip()
+    if date_finish.lower() in OPEN_ENDS:
+        return start, None
+    return start, parse_date(date_finish)
+
+
+def is_ongoing(dates_str: str) -> bool:
+    """
+    Check whether a date range ends in an open-end keyword ("current", ...).
+
+    Blank and unparseable ends do not count, and neither does the start, so
+    "garbage - current" is ongoing while "01.01.2020 - " is not.
+
+    Args:
+        dates_str: Date range text
+
+    Returns:
+        True if the text after the last "-" is an open-end keyword
+    """
+    if not dates_str or "-" not in dates_str:
+        return False
+    date_finish = dates_str.rsplit("-", 1)[1].strip().lower()
+    return bool(date_finish) and date_finish in OPEN_ENDS
+
+
+def tenure_years(dates_str: str, today: Optional[date] = None) -> float:
+    """
+    Calculate years worked from a date range string.
+
+    Args:
+        dates_str: Date range text
+        today: Reference date for ongoing ranges (default: today)
+
+    Returns:
+        Years between start and end (0.0 if unparseable or negative)
+    """
+    date_range = parse_date_range(dates_str)
+    if date_range is None:
+        return 0.0
+
+    start, end = date_range
+    if end is None:
+        end = today or date.today()
+    return max(0.0, (end - start).days / 365.25)
+
+
+def parse_date_ranges(
+    dates: Iterable[str], today: Optional[date] = None
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Parse many date ranges at once.
+
+    Args:
+        dates: Date range strings
+        today: Reference date for ongoing ranges (default: today)
+
+    Returns:
+        (starts, ends) datetime64[D] arrays; NaT where a range has no
+        parseable start, today where it is ongoing
+    """
+    if np is None:
+        raise ImportError("parse_date_ranges requires numpy (pip install numpy)")
+
+    today = np.datetime64(today or date.today(), "D")
+    starts = []
+    ends = []
+    for dates_str in dates:
+        date_range = parse_date_range(dates_str)
+        if date_range is None:
+            starts.append(None)
+            ends.append(None)
+        else:
+            starts.append(date_range[0])
+            ends.append(date_range[1] or today)
+
+    return (
+        np.array(starts, dtype="datetime64[D]"),
+        np.array(ends, dtype="datetime64[D]"),
+    )
+
+
+def tenure_years_array(
+    dates: Iterable[str], today: Optional[date] = None
+) -> "np.ndarray":
+    """
+    Calculate years worked for many date range strings at once.
+
+    Args:
+        dates: Date range strings
+        today: Reference date for ongoing ranges (default: today)
+
+    Returns:
+        float64 array with the same values as tenure_years for each string
+    """
+    starts, ends = parse_date_ranges(dates, today)
+    days = (ends - starts).astype("int64")
+    years = np.maximum(0.0, days / 365.25)
+    years[np.isnat(starts)] = 0.0
+    return years
+
+
+def _parse_date_fallback(date_str: str) -> Optional[date]:
+    """
+    Try every supported format the lenient way (split and int).
+
+    Handles the unusual spellings the fast paths do not, such as short
+    years, padded parts or extra trailing components.
+    """
+    # Try DD.MM.YYYY
+    try:
+        parts = date_str.split(".")
+        if len(parts) >= 3:
+            day = int(parts[0])
+            month = int(parts[1])
+            year = int(parts[2])
+            return date(year, month, day)
+    except (ValueError, IndexError):
+        pass
+
+    # Try MM/DD/YYYY or DD/MM/YYYY
+    try:
+        parts = date_str.split("/")
+        if len(parts) >= 3:
+            first = int(parts[0])
+            second = int(parts[1])
+            year = int(parts[2])
+            # Assume MM/DD/YYYY if first <= 12, else DD/MM/YYYY
+            if first <= 12:
+                return date(year, first, second)
+            else:
+                return date(year, second, first)
+    except (ValueError, IndexError):
+        pass
+
+    # Try YYYY-MM-DD (ISO format)
+    try:
+        parts = date_str.split("-")
+        if len(parts) >= 3 and len(parts[0]) == 4:
+            year = int(parts[0])
+            month = int(parts[1])
+            day = int(parts[2])
+            return date(year, month, day)
+    except (ValueError, IndexError):
+        pass
+
+    # Try "Month YYYY" format
+    try:
+        words = date_str.lower().split()
+        if len(words) >= 2:
+            month_name = words[0]
+            year = int(words[-1])
+            if month_name in _MONTHS:
+                return date(year, _MONTHS[month_name], 1)
+    except (ValueError, IndexError):
+        pass
+
+    # Try year only
+    try:
+        year = int(date_str)
+        if 1900 <= year <= 2100:
+            return date(year, 1, 1)
+    except ValueError:
+        pass
+
+    return None
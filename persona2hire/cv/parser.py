@@ -16,8 +16,15 @@ Limitations: Requires template structure (no free-form CVs), English labels
 only, max 3 work entries, no PDF/Word support.
 """
 
+import os
 import re
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from functools import partial
+from typing import Iterable, Iterator, Optional
+
+from .validation import _error_messages
 
 
 # Field mappings: (label in file, key in dict)
@@ -127,72 +134,277 @@ CV_FIELDS = [
     "Score",
 ]
 
+# Version of the parser output; bump it whenever parsing results (or the
+# validation results stored with them) change so cached results
+# (cv/cache.py) are not reused
+PARSER_VERSION = 2
+
+# Files read concurrently by the bulk readers (reads are I/O bound)
+DEFAULT_IO_WORKERS = 8
+
+# Every label, regular fields first, then work subfields (list order = priority)
+_LABELS = FIELD_MAPPINGS + WORK_FIELDS
+_WORK_FIELDS_START = len(FIELD_MAPPINGS)
 
-def read_cv_file(filepath: str) -> dict:
+# Lowercased labels bucketed by last character: (index, length, label)
+_LABELS_BY_LAST_CHAR = {}
+for _index, (_label, _) in enumerate(_LABELS):
+    _LABELS_BY_LAST_CHAR.setdefault(_label[-1].lower(), []).append(
+        (_index, len(_label), _label.lower())
+    )
+_LABEL_LENGTHS = sorted({len(label) for label, _ in _LABELS})
+_MAX_LABEL_LENGTH = _LABEL_LENGTHS[-1]
+
+# Fields that have a label in CV files
+_PARSED_FIELDS = frozenset(
+    [key for _, key in FIELD_MAPPINGS]
+    + [f"{key}{i}" for _, key in WORK_FIELDS for i in range(1, 4)]
+)
+
+# Case-insensitive match of any single label, for text that is not plain
+# ASCII (re also folds characters such as the Kelvin sign or long s)
+_LABEL_RE = re.compile(
+    "|".join(
+        f"(?P<label{i}>{re.escape(label)})" for i, (label, _) in enumerate(_LABELS)
+    ),
+    re.IGNORECASE,
+)
+
+
+def read_cv_file(filepath: str, fields: Optional[Iterable[str]] = None) -> dict:
     """
     Read and parse a CV from a structured text file.
 
     This parser is robust against formatting variations by searching for
     field labels rather than relying on fixed line positions.
 
+    With fields, only those fields are parsed, and the file is read line by
+    line only until each of them has been found (see parse_cv_text).
+
     Args:
         filepath: Path to the CV text file
+        fields: CV field keys to parse (default: all fields)
 
     Returns:
-        Dictionary containing all CV data fields
+        Dictionary containing all CV data fields, or only the requested ones
 
     Raises:
         FileNotFoundError: If the file doesn't exist
         UnicodeDecodeError: If the file encoding is unsupported
+        ValueError: If a requested field is not a CV field
     """
+    if fields is None:
+        return parse_cv_text(_read_cv_text(filepath))
+
+    fields = _check_fields(fields)
     try:
         with open(filepath, "rt", encoding="utf-8") as file:
-            content = file.read()
+            return _parse_lines(file, fields)
     except UnicodeDecodeError:
         # Fallback to latin-1 for older files
         with open(filepath, "rt", encoding="latin-1") as file:
-            content = file.read()
+            return _parse_lines(file, fields)
+
+
+def parse_cv_text(content: str, fields: Optional[Iterable[str]] = None) -> dict:
+    """
+    Parse the text of a CV file.
+
+    With fields, only those fields are parsed and parsing stops as soon as
+    each of them has a value. A field given twice in a file then keeps its
+    first value (a full parse keeps the last); fields a file leaves empty
+    make it parse to the end.
+
+    Args:
+        content: CV file contents
+        fields: CV field keys to parse (default: all fields)
+
+    Returns:
+        Dictionary containing all CV data fields, or only the requested ones
+
+    Raises:
+        ValueError: If a requested field is not a CV field
+    """
+    if fields is not None:
+        fields = _check_fields(fields)
+    return _parse_lines(content.split("\n"), fields)
+
 
-    lines = content.split("\n")
+def _parse_lines(lines: Iterable[str], fields: Optional[frozenset] = None) -> dict:
+    """
+    Parse CV lines into a dictionary.
+
+    Args:
+        lines: Lines of a CV file (with or without line endings)
+        fields: Checked field keys to parse and stop after (default: all)
+
+    Returns:
+        Dictionary of all fields, or of the requested fields
+    """
     cv_data = _initialize_empty_cv()
+    remaining = None
+    if fields is not None:
+        cv_data = {field: cv_data[field] for field in fields}
+        # Fields without a label in the file can never be found
+        remaining = set(fields & _PARSED_FIELDS)
+        if not remaining:
+            return cv_data
 
     # Track current workplace for associating dates/occupation/activities
     current_workplace = 0
 
-    for i, line in enumerate(lines):
+    for line in lines:
         # Skip empty lines
         if not line.strip():
             continue
 
+        # Values found on this line: (key, value)
+        found = []
+
         # Check for workplace markers
         for wp_num in [1, 2, 3]:
             if f"Workplace {wp_num}" in line:
                 current_workplace = wp_num
                 value = _extract_value(line)
                 if value:
-                    cv_data[f"Workplace{wp_num}"] = value
+                    found.append((f"Workplace{wp_num}", value))
                 break
         else:
-            # Check for work experience subfields
+            labels = _find_labels(line)
+            if not labels:
+                continue
+
+            # Work experience subfields (the first one listed wins)
             if current_workplace > 0:
-                for label, key_base in WORK_FIELDS:
-                    if _line_contains_label(line, label):
-                        value = _extract_value(line)
-                        if value:
-                            cv_data[f"{key_base}{current_workplace}"] = value
-                        break
-
-            # Check for regular field mappings
-            for label, key in FIELD_MAPPINGS:
-                if _line_contains_label(line, label):
+                work_labels = [i for i in labels if i >= _WORK_FIELDS_START]
+                if work_labels:
                     value = _extract_value(line)
                     if value:
-                        cv_data[key] = value
-                    break
+                        key_base = _LABELS[min(work_labels)][1]
+                        found.append((f"{key_base}{current_workplace}", value))
+
+            # Regular field mappings (the first one listed wins)
+            field_labels = [i for i in labels if i < _WORK_FIELDS_START]
+            if field_labels:
+                value = _extract_value(line)
+                if value:
+                    found.append((_LABELS[min(field_labels)][1], value))
+
+        for key, value in found:
+            if key in cv_data:
+                cv_data[key] = value
+                if remaining is not None:
+                    remaining.discard(key)
+        if remaining is not None and not remaining:
+            break  # Every requested field has a value
 
     return cv_data
 
 
+def _check_fields(fields: Iterable[str]) -> frozenset:
+    """Validate requested field keys."""
+    fields = frozenset(fields)
+    unknown = fields.difference(CV_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown CV fields: {', '.join(sorted(unknown))}")
+    return fields
+
+
+def iter_cv_files(
+    filepaths: Iterable[str],
+    workers: int = DEFAULT_IO_WORKERS,
+    fields: Optional[Iterable[str]] = None,
+) -> Iterator[tuple[str, dict | Exception]]:
+    """
+    Read and parse many CV files, reading several files at a time.
+
+    Files are read on a thread pool and parsed as they arrive. At most
+    2 * workers files are held in memory, so any number of files can be
+    streamed.
+
+    Args:
+        filepaths: Paths of the CV files
+        workers: Number of files read concurrently
+        fields: CV field keys to parse (default: all fields); each file is
+            then read only until they are found, as in read_cv_file
+
+    Yields:
+        (filepath, result) tuples in input order; result is the CV dictionary,
+        or the exception raised while reading the file
+
+    Raises:
+        ValueError: If a requested field is not a CV field
+    """
+    if fields is None:
+        read, parse = _read_cv_text, parse_cv_text
+    else:
+        # Reading and parsing are one step: parsing decides when to stop
+        fields = _check_fields(fields)
+        read, parse = partial(read_cv_file, fields=fields), None
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = deque()
+    try:
+        for filepath in filepaths:
+            pending.append((filepath, executor.submit(read, filepath)))
+            if len(pending) >= 2 * workers:
+                yield _parse_read(*pending.popleft(), parse)
+        while pending:
+            yield _parse_read(*pending.popleft(), parse)
+    finally:
+        # Also reached when the caller stops iterating early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_cv_directory(
+    path: str,
+    pattern: str = "*.txt",
+    workers: int = DEFAULT_IO_WORKERS,
+    fields: Optional[Iterable[str]] = None,
+) -> Iterator[tuple[str, dict | Exception]]:
+    """
+    Read and parse the CV files of a directory.
+
+    Args:
+        path: Directory to read (not recursive)
+        pattern: Shell-style pattern for file names
+        workers: Number of files read concurrently
+        fields: CV field keys to parse (default: all fields)
+
+    Yields:
+        (filepath, result) tuples sorted by file name, as for iter_cv_files
+    """
+    with os.scandir(path) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.is_file() and fnmatch(entry.name, pattern)
+        )
+    yield from iter_cv_files(
+        (os.path.join(path, name) for name in names), workers, fields
+    )
+
+
+def _read_cv_text(filepath: str) -> str:
+    """Read a CV file as text (UTF-8, falling back to Latin-1)."""
+    try:
+        with open(filepath, "rt", encoding="utf-8") as file:
+            return file.read()
+    except UnicodeDecodeError:
+        # Fallback to latin-1 for older files
+        with open(filepath, "rt", encoding="latin-1") as file:
+            return file.read()
+
+
+def _parse_read(filepath: str, future, parse) -> tuple[str, dict | Exception]:
+    """Parse the result of a pending read (if parse is given), or return its error."""
+    try:
+        result = future.result()
+        return filepath, result if parse is None else parse(result)
+    except Exception as e:
+        return filepath, e
+
+
 def _initialize_empty_cv() -> dict:
     """Create an empty CV dictionary with all fields initialized."""
     cv_data = {field: "" for field in CV_FIELDS}
@@ -202,16 +414,35 @@ def _initialize_empty_cv() -> dict:
     return cv_data
 
 
-def _line_contains_label(line: str, label: str) -> bool:
+def _find_labels(line: str) -> list:
     """
-    Check if a line contains a field label.
+    Find every known label in a line.
 
-    Handles variations like:
-    - "First-Name :" vs "First-Name:" vs "First-Name  :"
+    A label counts when it is followed by optional whitespace and a colon
+    (case-insensitively, as re.search(label + r"\s*:") with IGNORECASE), so
+    each colon is checked once against the labels that end its text.
+
+    Returns:
+        Indices into _LABELS of the labels found
     """
-    # Create a pattern that matches the label followed by optional whitespace and colon
-    pattern = re.escape(label) + r"\s*:"
-    return bool(re.search(pattern, line, re.IGNORECASE))
+    labels = []
+    colon = line.find(":")
+    while colon != -1:
+        head = line[:colon].rstrip()
+        tail = head[-_MAX_LABEL_LENGTH:]
+        if tail.isascii():
+            for index, length, label in _LABELS_BY_LAST_CHAR.get(tail[-1:].lower(), ()):
+                if tail[-length:].lower() == label:
+                    labels.append(index)
+        else:
+            for length in _LABEL_LENGTHS:
+                if length > len(tail):
+                    break
+                match = _LABEL_RE.fullmatch(tail[-length:])
+                if match:
+                    labels.append(int(match.lastgroup[len("label") :]))
+        colon = line.find(":", colon + 1)
+    return labels
 
 
 def _extract_value(line: str) -> str:
@@ -239,49 +470,13 @@ def validate_cv_data(cv_data: dict) -> tuple[bool, list[str]]:
 
     Returns:
         Tuple of (is_valid, list of error messages)
-    """
-    errors = []
-
-    # Required fields
-    required_fields = ["FirstName", "LastName"]
-    for field in required_fields:
-        if not cv_data.get(field, "").strip():
-            errors.append(f"Missing required field: {field}")
-
-    # Validate email format if provided
-    email = cv_data.get("EmailAddress", "")
-    if email and not _is_valid_email(email):
-        errors.append(f"Invalid email format: {email}")
-
-    # Validate years studied is numeric if provided
-    years = cv_data.get("YearsStudied", "")
-    if years and not years.isdigit():
-        # Try to extract number
-        try:
-            int(years)
-        except ValueError:
-            errors.append(f"Years studied should be a number: {years}")
-
-    # Validate date format for DateOfBirth if provided
-    dob = cv_data.get("DateOfBirth", "")
-    if dob and not _is_valid_date_format(dob):
-        errors.append(f"Date of birth should be in DD.MM.YYYY format: {dob}")
 
+    See validation.validate_many for validating many CVs at once.
+    """
+    errors = _error_messages(cv_data)
     return len(errors) == 0, errors
 
 
-def _is_valid_email(email: str) -> bool:
-    """Check if email has a valid format."""
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
-
-
-def _is_valid_date_format(date_str: str) -> bool:
-    """Check if date matches DD.MM.YYYY format."""
-    pattern = r"^\d{1,2}\.\d{1,2}\.\d{4}$"
-    return bool(re.match(pattern, date_str))
-
-
 def get_cv_summary(cv_data: dict) -> str:
     """
     Generate a brief summary of CV data.
@@ -1,8 +1,15 @@
 """CV file writing functionality."""
 
+import io
 import os
 import re
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional, TextIO
+
+from .parser import DEFAULT_IO_WORKERS
+
+# Numbered names tried per base name before giving up (as write_cv_file)
+_MAX_NAME_SUFFIX = 999
 
 
 def write_cv_file(
@@ -46,6 +53,140 @@ def write_cv_file(
     return file_path
 
 
+def write_cv_files(
+    persons: Iterable[dict],
+    output_dir: Optional[str] = None,
+    overwrite: bool = False,
+    workers: int = DEFAULT_IO_WORKERS,
+    bundle_path: Optional[str] = None,
+    return_exceptions: bool = False,
+) -> list:
+    """
+    Write many CVs, as repeated write_cv_file calls would.
+
+    The output directory is listed once and file names are chosen from an
+    in-memory index, so common names cost no extra file system probes. Names
+    are compared ignoring case, so no CV replaces a file that differs only
+    in case on a case-insensitive file system. Each CV is rendered to one
+    string and written with a single call, from a small thread pool. All
+    names are checked before anything is written.
+
+    With overwrite, CVs that get the same file name are written once, with
+    the last of them (as repeated write_cv_file calls would leave it).
+
+    Args:
+        persons: Dictionaries containing CV data
+        output_dir: Directory to save the CV files (default: ./CVs)
+        overwrite: If True, overwrite existing files; if False, append numbers
+        workers: Number of files written concurrently
+        bundle_path: If given, write all CVs into this bundle file (see
+            bundle.py) instead of separate files
+        return_exceptions: If True, a CV that cannot be named or written
+            gets the exception in place of its path and the others are
+            still written
+
+    Returns:
+        Paths of the created files, in input order; with bundle_path, the
+        candidate ids in the bundle (the file names without extension)
+
+    Raises:
+        ValueError: If a CV has neither a first nor a last name
+        OSError: If a file cannot be written
+    """
+    persons = list(persons)
+    if bundle_path is not None:
+        return _write_bundle(persons, bundle_path)
+
+    if output_dir is None:
+        output_dir = os.path.join(os.getcwd(), "CVs")
+    os.makedirs(output_dir, exist_ok=True)
+
+    names = _FileNameIndex(os.listdir(output_dir), overwrite)
+    results = []
+    for person in persons:
+        try:
+            results.append(os.path.join(output_dir, f"{names.claim(person)}.txt"))
+        except (ValueError, OSError) as e:
+            if not return_exceptions:
+                raise
+            results.append(e)
+
+    # CVs sharing a file (with overwrite): only the last one is written
+    sharing = {}
+    for index, path in enumerate(results):
+        if not isinstance(path, Exception):
+            sharing.setdefault(_name_key(path), []).append(index)
+    writes = [indices[-1] for indices in sharing.values()]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_write_cv_content, results[index], persons[index])
+            for index in writes
+        ]
+        # Wait for every write so errors are raised (or recorded) here
+        for indices, future in zip(sharing.values(), futures):
+            try:
+                future.result()
+            except OSError as e:
+                if not return_exceptions:
+                    raise
+                for index in indices:
+                    results[index] = e
+
+    return results
+
+
+def _write_bundle(persons: list, bundle_path: str) -> list:
+    """Write CVs into a new bundle, named as write_cv_files names files."""
+    from .bundle import CVBundleWriter
+
+    names = _FileNameIndex((), overwrite=False)
+    ids = [names.claim(person) for person in persons]
+    with CVBundleWriter(bundle_path) as writer:
+        for candidate_id, person in zip(ids, persons):
+            writer.add_cv(candidate_id, person)
+    return ids
+
+
+class _FileNameIndex:
+    """Unique CV file names, chosen without probing the file system."""
+
+    def __init__(self, existing: Iterable[str], overwrite: bool):
+        self._taken = {_name_key(name) for name in existing}
+        self._next_suffix = {}
+        self._overwrite = overwrite
+
+    def claim(self, person: dict) -> str:
+        """Reserve a name (without extension) for a CV, as write_cv_file does."""
+        first_name = _sanitize_text(person.get("FirstName", ""))
+        last_name = _sanitize_text(person.get("LastName", ""))
+        if not first_name and not last_name:
+            raise ValueError("CV must have at least a first name or last name")
+
+        safe_first = _sanitize_filename(first_name) or "Unknown"
+        safe_last = _sanitize_filename(last_name) or "Person"
+        base_name = f"{safe_first}_{safe_last}"
+
+        name = base_name
+        if not self._overwrite and _name_key(f"{name}.txt") in self._taken:
+            # Numbers below the last one handed out are known to be taken
+            counter = self._next_suffix.get(base_name, 1)
+            while _name_key(f"{base_name}_{counter}.txt") in self._taken:
+                counter += 1
+            if counter > _MAX_NAME_SUFFIX:
+                raise OSError(f"Too many CV files for {base_name}")
+            self._next_suffix[base_name] = counter + 1
+            name = f"{base_name}_{counter}"
+
+        self._taken.add(_name_key(f"{name}.txt"))
+        return name
+
+
+def _name_key(name: str) -> str:
+    """Compare file names as a case-insensitive file system would."""
+    return os.path.normcase(name).casefold()
+
+
 def _sanitize_filename(name: str) -> str:
     """
     Sanitize a string to be safe for use in filenames.
@@ -101,8 +242,36 @@ def _generate_unique_filepath(
     return file_path
 
 
+def render_cv_text(person: dict) -> str:
+    """
+    Render a CV in the standard text format, without writing a file.
+
+    Args:
+        person: Dictionary containing CV data
+
+    Returns:
+        The text write_cv_file would write
+    """
+    stream = io.StringIO()
+    write_cv_to_stream(person, stream)
+    return stream.getvalue()
+
+
 def _write_cv_content(file_path: str, person: dict) -> None:
     """Write the CV content to a file in the standard format."""
+    text = render_cv_text(person)
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write(text)
+
+
+def write_cv_to_stream(person: dict, file: TextIO) -> None:
+    """
+    Write a CV in the standard text format to an open text stream.
+
+    Args:
+        person: Dictionary containing CV data
+        file: Writable text stream (file, StringIO, ...)
+    """
 
     def get_field(key: str, default: str = "") -> str:
         """Safely get a field value."""
@@ -111,84 +280,83 @@ def _write_cv_content(file_path: str, person: dict) -> None:
             return default
         return str(value).strip()
 
-    with open(file_path, "w", encoding="utf-8") as file:
-        # Header
-        file.write("Curriculum Vitae\n")
-        file.write("       \n")
-
-        # Personal Information
-        file.write(f"First-Name : {get_field('FirstName')}\n")
-        file.write(f"Last-Name : {get_field('LastName')}\n")
-        file.write("Address :\n")
-        file.write(f"    Street Name : {get_field('StreetName')}\n")
-        file.write(f"    House Number : {get_field('HouseNumber')}\n")
-        file.write(f"    City : {get_field('City')}\n")
-        file.write(f"    Country : {get_field('Country')}\n")
-        file.write(f"Telephone Number : {get_field('TelephoneNumber')}\n")
-        file.write(f"E-mail Address : {get_field('EmailAddress')}\n")
-        file.write("\n")
-
-        file.write(f"Sex : {get_field('Sex')}\n")
-        file.write(f"Date of Birth : {get_field('DateOfBirth')}\n")
-        file.write(f"Nationality : {get_field('Nationality')}\n")
-        file.write("\n")
-
-        # Work Experience
-        file.write("Work Experience :\n")
-        for i in [1, 2, 3]:
-            file.write(f"\tWorkplace {i} : {get_field(f'Workplace{i}')}\n")
-            file.write(f"\t    Dates : {get_field(f'Dates{i}')}\n")
-            file.write(f"\t    Occupation : {get_field(f'Occupation{i}')}\n")
-            file.write(f"        Main activities : {get_field(f'MainActivities{i}')}\n")
-        file.write("\n")
-
-        # Education
-        file.write("Education and Training :\n")
-        file.write(f"\tHigh school : {get_field('HighSchool')}\n")
-        file.write(f"\tCollege/University : {get_field('College/University')}\n")
-        file.write(f"\t    Subjects studied : {get_field('SubjectsStudied')}\n")
-        file.write(f"\t    Years studied : {get_field('YearsStudied')}\n")
-        file.write(f"\tQualifications awarded : {get_field('QualificationsAwarded')}\n")
-        file.write(f"\tMaster 1 : {get_field('Master1')}\n")
-        file.write(f"\tMaster 2 : {get_field('Master2')}\n")
-        file.write("\n")
-
-        # Skills
-        file.write("Personal Skills :\n")
-        file.write(f"\tCommunication skills : {get_field('CommunicationSkills')}\n")
-        file.write(
-            f"\tOrganizational / managerial skills : {get_field('OrganizationalManagerialSkills')}\n"
-        )
-        file.write(f"\tJob-related skills : {get_field('JobRelatedSkills')}\n")
-        file.write(f"\tComputer skills : {get_field('ComputerSkills')}\n")
-        file.write(f"\tOther skills : {get_field('OtherSkills')}\n")
-        file.write(f"\tDriving license : {get_field('DrivingLicense')}\n")
-        file.write("\n")
-
-        # Languages
-        file.write("Languages :\n")
-        file.write(f"\tMother Language : {get_field('MotherLanguage')}\n")
-        file.write("\tOther Languages :\n")
-        file.write(f"\t    Modern Language 1 : {get_field('ModernLanguage1')}\n")
-        file.write(f"\t        Level1 : {get_field('Level1')}\n")
-        file.write(f"\t    Modern Language 2 : {get_field('ModernLanguage2')}\n")
-        file.write(f"\t        Level2 : {get_field('Level2')}\n")
-        file.write("\n")
-
-        # Additional Information
-        file.write("Additional Information:\n")
-        file.write(f"    Publications : {get_field('Publications')}\n")
-        file.write(f"    Presentations : {get_field('Presentations')}\n")
-        file.write(f"    Projects : {get_field('Projects')}\n")
-        file.write(f"    Conferences : {get_field('Conferences')}\n")
-        file.write(f"    Honours and awards : {get_field('HonoursAndAwards')}\n")
-        file.write(f"    Memberships : {get_field('Memberships')}\n")
-        file.write("\n")
-
-        # Description and Hobbies
-        file.write(f"Short Description : {get_field('ShortDescription')}\n")
-        file.write("\n")
-        file.write(f"Hobbies : {get_field('Hobbies')}\n")
+    # Header
+    file.write("Curriculum Vitae\n")
+    file.write("       \n")
+
+    # Personal Information
+    file.write(f"First-Name : {get_field('FirstName')}\n")
+    file.write(f"Last-Name : {get_field('LastName')}\n")
+    file.write("Address :\n")
+    file.write(f"    Street Name : {get_field('StreetName')}\n")
+    file.write(f"    House Number : {get_field('HouseNumber')}\n")
+    file.write(f"    City : {get_field('City')}\n")
+    file.write(f"    Country : {get_field('Country')}\n")
+    file.write(f"Telephone Number : {get_field('TelephoneNumber')}\n")
+    file.write(f"E-mail Address : {get_field('EmailAddress')}\n")
+    file.write("\n")
+
+    file.write(f"Sex : {get_field('Sex')}\n")
+    file.write(f"Date of Birth : {get_field('DateOfBirth')}\n")
+    file.write(f"Nationality : {get_field('Nationality')}\n")
+    file.write("\n")
+
+    # Work Experience
+    file.write("Work Experience :\n")
+    for i in [1, 2, 3]:
+        file.write(f"\tWorkplace {i} : {get_field(f'Workplace{i}')}\n")
+        file.write(f"\t    Dates : {get_field(f'Dates{i}')}\n")
+        file.write(f"\t    Occupation : {get_field(f'Occupation{i}')}\n")
+        file.write(f"        Main activities : {get_field(f'MainActivities{i}')}\n")
+    file.write("\n")
+
+    # Education
+    file.write("Education and Training :\n")
+    file.write(f"\tHigh school : {get_field('HighSchool')}\n")
+    file.write(f"\tCollege/University : {get_field('College/University')}\n")
+    file.write(f"\t    Subjects studied : {get_field('SubjectsStudied')}\n")
+    file.write(f"\t    Years studied : {get_field('YearsStudied')}\n")
+    file.write(f"\tQualifications awarded : {get_field('QualificationsAwarded')}\n")
+    file.write(f"\tMaster 1 : {get_field('Master1')}\n")
+    file.write(f"\tMaster 2 : {get_field('Master2')}\n")
+    file.write("\n")
+
+    # Skills
+    file.write("Personal Skills :\n")
+    file.write(f"\tCommunication skills : {get_field('CommunicationSkills')}\n")
+    file.write(
+        f"\tOrganizational / managerial skills : {get_field('OrganizationalManagerialSkills')}\n"
+    )
+    file.write(f"\tJob-related skills : {get_field('JobRelatedSkills')}\n")
+    file.write(f"\tComputer skills : {get_field('ComputerSkills')}\n")
+    file.write(f"\tOther skills : {get_field('OtherSkills')}\n")
+    file.write(f"\tDriving license : {get_field('DrivingLicense')}\n")
+    file.write("\n")
+
+    # Languages
+    file.write("Languages :\n")
+    file.write(f"\tMother Language : {get_field('MotherLanguage')}\n")
+    file.write("\tOther Languages :\n")
+    file.write(f"\t    Modern Language 1 : {get_field('ModernLanguage1')}\n")
+    file.write(f"\t        Level1 : {get_field('Level1')}\n")
+    file.write(f"\t    Modern Language 2 : {get_field('ModernLanguage2')}\n")
+    file.write(f"\t        Level2 : {get_field('Level2')}\n")
+    file.write("\n")
+
+    # Additional Information
+    file.write("Additional Information:\n")
+    file.write(f"    Publications : {get_field('Publications')}\n")
+    file.write(f"    Presentations : {get_field('Presentations')}\n")
+    file.write(f"    Projects : {get_field('Projects')}\n")
+    file.write(f"    Conferences : {get_field('Conferences')}\n")
+    file.write(f"    Honours and awards : {get_field('HonoursAndAwards')}\n")
+    file.write(f"    Memberships : {get_field('Memberships')}\n")
+    file.write("\n")
+
+    # Description and Hobbies
+    file.write(f"Short Description : {get_field('ShortDescription')}\n")
+    file.write("\n")
+    file.write(f"Hobbies : {get_field('Hobbies')}\n")
 
 
 def create_empty_cv() -> dict:
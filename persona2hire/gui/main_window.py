@@ -2,18 +2,35 @@
 
 import csv
 import os
+import queue
+import sqlite3
+import threading
+from typing import Optional
 from tkinter import *
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 from tkinter.filedialog import askopenfilename, askopenfilenames, asksaveasfilename
 
 from ..data.job_sectors import JobSectors
-from ..cv.parser import read_cv_file, validate_cv_data, get_cv_summary
-from ..analysis.job_analyzer import filter_candidates
+from ..cv.cache import CVCache
+from ..cv.parser import get_cv_summary
+from ..cv.validation import format_errors
+from ..analysis.candidate_pool import CandidatePool
+from ..analysis.personality_cache import (
+    DEFAULT_PERSONALITY_CACHE_PATH,
+    PersonalityCache,
+)
 from .cv_form import create_cv_form
 from .dialogs import select_data_dialog
 from .results import show_results, show_jobs, show_personality
 
 
+# Background loading: the worker hands CVs to the Tk thread in batches, and
+# each poll handles a few batches so the event loop keeps turning
+_LOAD_BATCH_SIZE = 100
+_LOAD_POLL_MS = 50
+_LOAD_BATCHES_PER_POLL = 4
+
+
 class ToolTip:
     """Simple tooltip class for Tkinter widgets."""
 
@@ -71,6 +88,13 @@ class MainWindow:
         self.persons = []
         self.file_paths = []  # Keep track of file paths
         self.filter_criteria = {}
+        self._pool = None  # Filter indexes, rebuilt when the CV list changes
+        self._parsed_cvs = None  # Parsed-CV cache, opened on first load
+        self._personalities = None  # Personality cache, loaded on first use
+        self._loading = None  # Cancel event of the running background load
+        self._load_queue = queue.Queue()
+        self._load_errors = []
+        self._loaded_count = 0
         self.job_var = StringVar()
 
         self._setup_ui()
@@ -282,6 +306,31 @@ class MainWindow:
         )
         self.status_label.pack(anchor="w", pady=(10, 0))
 
+        # Loading progress (shown while files load in the background)
+        self.progress_frame = Frame(frame, bg="#2a2a3e")
+        self.progress_bar = ttk.Progressbar(
+            self.progress_frame, orient="horizontal", mode="determinate"
+        )
+        self.progress_bar.pack(side=LEFT, fill=X, expand=True)
+        self.progress_label = Label(
+            self.progress_frame,
+            text="",
+            bg="#2a2a3e",
+            fg="#c3c3c3",
+            font=("calibre", 10),
+        )
+        self.progress_label.pack(side=LEFT, padx=10)
+        Button(
+            self.progress_frame,
+            text="Cancel",
+            command=self._cancel_loading,
+            bg="#636e72",
+            fg="white",
+            activebackground="#b2bec3",
+            activeforeground="black",
+            font=("calibre", 10),
+        ).pack(side=RIGHT)
+
     def _create_action_buttons(self):
         """Create bottom action buttons."""
         button_frame = Frame(self.window, bg="#1a1a2e")
@@ -400,10 +449,15 @@ class MainWindow:
     def _on_cv_created(self, cv_data: dict, file_path: str):
         """Callback when a new CV is created."""
         self.file_paths.append(file_path)
+        self._pool = None
         self._update_status()
 
     def _open_file(self):
-        """Open a file dialog to select CV file(s)."""
+        """Open a file dialog to select CV file(s) and load them."""
+        if self._loading is not None:
+            messagebox.showinfo("Loading", "CV files are still being loaded.")
+            return
+
         filepaths = askopenfilenames(
             title="Select CV File(s)",
             filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")],
@@ -412,45 +466,100 @@ class MainWindow:
         if not filepaths:
             return
 
-        loaded_count = 0
-        errors = []
-
-        for filepath in filepaths:
+        # Files are read and parsed on a worker thread; the Tk thread only
+        # inserts the results (see _poll_loading)
+        cache = self._cv_cache()
+        self._loading = threading.Event()
+        self._load_queue = queue.Queue()
+        self._load_errors = []
+        self._loaded_count = 0
+        self._show_progress(len(filepaths))
+
+        threading.Thread(
+            target=_load_cv_files,
+            args=(cache, filepaths, self._load_queue, self._loading),
+            daemon=True,
+        ).start()
+        self.window.after(_LOAD_POLL_MS, self._poll_loading)
+
+    def _poll_loading(self):
+        """Add the CVs loaded so far, then check again later."""
+        for _ in range(_LOAD_BATCHES_PER_POLL):
             try:
-                person = read_cv_file(filepath)
-
-                # Validate the CV data
-                is_valid, validation_errors = validate_cv_data(person)
-                if not is_valid:
-                    errors.append(f"{filepath}: {', '.join(validation_errors)}")
-                    continue
-
-                self.persons.append(person)
-                self.file_paths.append(filepath)
-
-                # Show summary in listbox
-                summary = get_cv_summary(person)
-                self.listbox.insert(END, summary)
-                loaded_count += 1
+                batch = self._load_queue.get_nowait()
+            except queue.Empty:
+                break
+            if batch is None:  # Worker finished
+                self._finish_loading()
+                return
+            self._add_loaded(batch)
+        self.window.after(_LOAD_POLL_MS, self._poll_loading)
+
+    def _add_loaded(self, batch: list):
+        """Add one batch of loaded CVs, inserting their rows at once."""
+        summaries = []
+        for filepath, person, summary, error in batch:
+            if error:
+                self._load_errors.append((filepath, error))
+                continue
+            self.persons.append(person)
+            self.file_paths.append(filepath)
+            summaries.append(summary)
+
+        if summaries:
+            self.listbox.insert(END, *summaries)
+            self._loaded_count += len(summaries)
+            self._pool = None
+            self._update_status()
 
-            except FileNotFoundError:
-                errors.append(f"{filepath}: File not found")
-            except UnicodeDecodeError:
-                errors.append(f"{filepath}: Unable to read file encoding")
-            except Exception as e:
-                errors.append(f"{filepath}: {str(e)}")
+        self.progress_bar.step(len(batch))
+        done = int(self.progress_bar["value"])
+        total = int(self.progress_bar["maximum"])
+        self.progress_label.config(text=f"{done} / {total} files")
 
+    def _finish_loading(self):
+        """Hide the progress bar and report files that could not be loaded."""
+        cancelled = self._loading.is_set()
+        self._loading = None
+        self.progress_frame.pack_forget()
         self._update_status()
 
+        errors = self._load_errors
         if errors:
-            error_msg = "\n".join(errors[:5])  # Show max 5 errors
+            # Only the errors shown are formatted
+            error_msg = "\n".join(
+                _format_load_error(filepath, error) for filepath, error in errors[:5]
+            )
             if len(errors) > 5:
                 error_msg += f"\n... and {len(errors) - 5} more errors"
             messagebox.showwarning(
                 "Some Files Could Not Be Loaded",
-                f"Loaded {loaded_count} file(s).\n\nErrors:\n{error_msg}",
+                f"Loaded {self._loaded_count} file(s)"
+                f"{' before cancelling' if cancelled else ''}."
+                f"\n\nErrors:\n{error_msg}",
             )
 
+    def _cancel_loading(self):
+        """Stop the running load (CVs already loaded are kept)."""
+        if self._loading is not None:
+            self._loading.set()
+            self.progress_label.config(text="Cancelling...")
+
+    def _show_progress(self, total: int):
+        """Show the progress bar for a load of total files."""
+        self.progress_bar.config(maximum=max(total, 1), value=0)
+        self.progress_label.config(text=f"0 / {total} files")
+        self.progress_frame.pack(fill=X, pady=(5, 0))
+
+    def _cv_cache(self) -> CVCache:
+        """Get the parsed-CV cache (in memory if the cache file is unusable)."""
+        if self._parsed_cvs is None:
+            try:
+                self._parsed_cvs = CVCache()
+            except (OSError, sqlite3.Error):
+                self._parsed_cvs = CVCache(":memory:")
+        return self._parsed_cvs
+
     def _remove_file(self):
         """Remove selected file(s) from the list."""
         selection = self.listbox.curselection()
@@ -465,6 +574,7 @@ class MainWindow:
                 self.file_paths.pop(index)
                 self.listbox.delete(index)
 
+        self._pool = None
         self._update_status()
 
     def _clear_all(self):
@@ -476,6 +586,7 @@ class MainWindow:
             self.persons.clear()
             self.file_paths.clear()
             self.listbox.delete(0, END)
+            self._pool = None
             self._update_status()
 
     def _analyze_data(self):
@@ -506,7 +617,7 @@ class MainWindow:
         # Apply filter criteria if set
         persons_to_analyze = self.persons
         if self.filter_criteria:
-            persons_to_analyze = filter_candidates(self.persons, self.filter_criteria)
+            persons_to_analyze = self._candidate_pool().filter(self.filter_criteria)
             if not persons_to_analyze:
                 messagebox.showinfo(
                     "No Matches",
@@ -521,7 +632,28 @@ class MainWindow:
                     "candidates that match your filter criteria.",
                 )
 
-        show_results(self.window, persons_to_analyze, sector)
+        personalities = self._personality_cache()
+        show_results(self.window, persons_to_analyze, sector, personalities)
+        self._save_personality_cache()
+
+    def _personality_cache(self) -> PersonalityCache:
+        """Get the personality type cache, loading the saved types if needed."""
+        if self._personalities is None:
+            self._personalities = PersonalityCache(DEFAULT_PERSONALITY_CACHE_PATH)
+        return self._personalities
+
+    def _save_personality_cache(self):
+        """Save the personality cache (it stays usable in memory on failure)."""
+        try:
+            self._personality_cache().save()
+        except OSError:
+            pass
+
+    def _candidate_pool(self) -> CandidatePool:
+        """Get the filter indexes for the loaded CVs, building them if needed."""
+        if self._pool is None:
+            self._pool = CandidatePool(self.persons)
+        return self._pool
 
     def _show_jobs(self):
         """Show suitable jobs for the selected person."""
@@ -532,7 +664,7 @@ class MainWindow:
 
         index = selection[0]
         if 0 <= index < len(self.persons):
-            show_jobs(self.window, self.persons[index])
+            show_jobs(self.window, self.persons[index], self._personality_cache())
 
     def _show_personality(self):
         """Show personality analysis for the selected person."""
@@ -543,7 +675,9 @@ class MainWindow:
 
         index = selection[0]
         if 0 <= index < len(self.persons):
-            show_personality(self.window, self.persons[index])
+            show_personality(
+                self.window, self.persons[index], self._personality_cache()
+            )
 
     def _update_status(self):
         """Update the status label."""
@@ -557,8 +691,7 @@ class MainWindow:
 
     def _export_results(self):
         """Export analysis results to a CSV file."""
-        from ..analysis.job_analyzer import analyze_job, get_score_breakdown
-        from ..analysis.personality_analyzer import analyze_personality
+        from ..analysis.job_analyzer import score_detailed
 
         if not self.persons:
             messagebox.showinfo("No CVs", "Please load some CV files first.")
@@ -607,38 +740,42 @@ class MainWindow:
                     ]
                 )
 
+                # Personality types first, so scores include the same
+                # personality bonus as the results view
+                cache = self._personality_cache()
+                personalities = cache.personality_types(self.persons)
+
                 # Calculate scores and sort
                 results = []
-                for person in self.persons:
-                    score = analyze_job(person, sector)
-                    personality = analyze_personality(person)
-                    breakdown = get_score_breakdown(person, sector)
-                    results.append((person, score, personality, breakdown))
+                for person, personality in zip(self.persons, personalities):
+                    person["PersonalityTypeMB"] = personality
+                    result = score_detailed(person, sector)
+                    results.append((person, result, personality))
 
-                results.sort(key=lambda x: x[1], reverse=True)
+                results.sort(key=lambda x: x[1].total, reverse=True)
 
                 # Write data rows
-                for rank, (person, score, personality, breakdown) in enumerate(
-                    results, 1
-                ):
+                for rank, (person, result, personality) in enumerate(results, 1):
                     writer.writerow(
                         [
                             rank,
                             person.get("FirstName", ""),
                             person.get("LastName", ""),
                             person.get("EmailAddress", ""),
-                            f"{score:.1f}",
-                            f"{breakdown.get('education', 0):.1f}",
-                            f"{breakdown.get('work_experience', 0):.1f}",
-                            f"{breakdown.get('skills', 0):.1f}",
-                            f"{breakdown.get('languages', 0):.1f}",
-                            f"{breakdown.get('soft_skills', 0):.1f}",
-                            f"{breakdown.get('additional', 0):.1f}",
+                            f"{result.total:.1f}",
+                            f"{result.education:.1f}",
+                            f"{result.work_experience:.1f}",
+                            f"{result.skills:.1f}",
+                            f"{result.languages:.1f}",
+                            f"{result.soft_skills:.1f}",
+                            f"{result.additional:.1f}",
                             personality,
                             person.get("Nationality", ""),
                         ]
                     )
 
+            self._save_personality_cache()
+
             messagebox.showinfo(
                 "Export Complete",
                 f"Results exported successfully!\n\nFile: {filepath}",
@@ -654,6 +791,71 @@ class MainWindow:
         self.window.mainloop()
 
 
+def _load_cv_files(
+    cache: CVCache, filepaths: list, results: queue.Queue, cancel: threading.Event
+):
+    """
+    Load CV files on a worker thread (no Tk calls allowed here).
+
+    Args:
+        cache: Parsed-CV cache, used only by this thread while it runs
+        filepaths: Paths of CV files
+        results: Queue receiving lists of (filepath, person, summary, error)
+            tuples (see _loaded_record), then None when the worker stops
+        cancel: Set to stop loading
+    """
+    batch = []
+    records = cache.iter_cv_files(filepaths)
+    try:
+        for filepath, person, validation in records:
+            if cancel.is_set():
+                break
+            batch.append(_loaded_record(filepath, person, validation))
+            if len(batch) == _LOAD_BATCH_SIZE:
+                results.put(batch)
+                batch = []
+    except Exception as e:
+        batch.append((None, None, None, f"Loading stopped: {str(e)}"))
+    finally:
+        records.close()
+        if batch:
+            results.put(batch)
+        results.put(None)
+
+
+def _loaded_record(filepath: str, person, validation) -> tuple:
+    """
+    Turn a cache record into (filepath, person, summary, error).
+
+    error is None for a loaded CV, a message for an unreadable file, or
+    (errors, person) for an invalid CV, errors mapping fields to error names;
+    the messages are only formatted if shown (see _format_load_error).
+    """
+    if isinstance(person, FileNotFoundError):
+        return filepath, None, None, "File not found"
+    if isinstance(person, UnicodeDecodeError):
+        return filepath, None, None, "Unable to read file encoding"
+    if isinstance(person, Exception):
+        return filepath, None, None, str(person)
+
+    try:
+        # Validation results come with the (possibly cached) CV data
+        is_valid, validation_errors = validation
+        if not is_valid:
+            return filepath, None, None, (validation_errors, person)
+        return filepath, person, get_cv_summary(person), None
+    except Exception as e:
+        return filepath, None, None, str(e)
+
+
+def _format_load_error(filepath: Optional[str], error) -> str:
+    """Format an error from _loaded_record for display."""
+    if not isinstance(error, str):
+        validation_errors, person = error
+        error = ", ".join(format_errors(validation_errors, person))
+    return f"{filepath}: {error}" if filepath else error
+
+
 def create_main_window():
     """Create and return the main application window."""
     return MainWindow()
@@ -4,17 +4,16 @@ from tkinter import *
 from tkinter import ttk
 import webbrowser
 
-from ..analysis.job_analyzer import analyze_jobs, get_score_breakdown, get_skill_gaps
-from ..analysis.personality_analyzer import (
-    analyze_personality,
-    get_personality_percentages,
-    get_big_five_profile,
-    get_career_suggestions,
-)
+from ..analysis.job_analyzer import score_detailed
+from ..analysis.ranking import rank_candidates, top_sectors
+from ..analysis.personality_analyzer import personality_report
+from ..analysis.personality_cache import PersonalityCache
 from ..data.personality import PersonalityTypes
 
 
-def show_results(parent, persons_list: list, selected_sector: str):
+def show_results(
+    parent, persons_list: list, selected_sector: str, personality_cache=None
+):
     """
     Show ranked list of candidates for a job sector.
 
@@ -22,9 +21,9 @@ def show_results(parent, persons_list: list, selected_sector: str):
         parent: Parent Tkinter window
         persons_list: List of person dictionaries
         selected_sector: Job sector to analyze for
+        personality_cache: PersonalityCache for the MBTI types (default: a new
+            one in memory)
     """
-    from ..analysis.job_analyzer import analyze_job
-
     if not persons_list:
         _show_message(parent, "No Candidates", "Please load some CV files first.")
         return
@@ -38,13 +37,22 @@ def show_results(parent, persons_list: list, selected_sector: str):
     results_window.configure(bg="dimgray")
     results_window.state("zoomed")
 
-    # Calculate scores for each person
-    for person in persons_list:
-        person["PersonalityTypeMB"] = analyze_personality(person)
-        person["Score"] = analyze_job(person, selected_sector)
+    # Every candidate gets a type (cached, and analyzed in batches), so
+    # PersonalityTypeMB never holds a value left over from an earlier run
+    # and the ranking knows each exact personality bonus
+    if personality_cache is None:
+        personality_cache = PersonalityCache()
+    types = personality_cache.personality_types(persons_list)
+    for person, personality_type in zip(persons_list, types):
+        person["PersonalityTypeMB"] = personality_type
+
+    ranked = rank_candidates(persons_list, selected_sector, k=10)
 
-    # Sort by score
-    sorted_list = sorted(persons_list, key=lambda x: x.get("Score", 0), reverse=True)
+    # Only the top 10 are scored; the others keep whatever Score they had
+    sorted_list = []
+    for person, score in ranked:
+        person["Score"] = score
+        sorted_list.append(person)
 
     # Title
     Label(
@@ -81,7 +89,7 @@ def show_results(parent, persons_list: list, selected_sector: str):
     treeview.column("personality", anchor=CENTER, width=150, stretch=NO)
 
     # Populate treeview (show top 10)
-    for i, person in enumerate(sorted_list[:10], 1):
+    for i, person in enumerate(sorted_list, 1):
         name = f"{person.get('FirstName', '')} {person.get('LastName', '')}".strip()
         if not name:
             name = "Unknown"
@@ -114,8 +122,9 @@ def show_results(parent, persons_list: list, selected_sector: str):
 
 def _show_score_breakdown(parent, person: dict, sector: str):
     """Show detailed score breakdown with progress bars and skill gap analysis."""
-    breakdown = get_score_breakdown(person, sector)
-    skill_gaps = get_skill_gaps(person, sector)
+    result = score_detailed(person, sector)
+    breakdown = result.as_breakdown()
+    skill_gaps = result.skill_gaps()
 
     name = f"{person.get('FirstName', '')} {person.get('LastName', '')}".strip()
 
@@ -319,20 +328,26 @@ def _show_score_breakdown(parent, person: dict, sector: str):
     ).pack()
 
 
-def show_jobs(parent, person: dict):
+def show_jobs(parent, person: dict, personality_cache=None):
     """
     Show suitable jobs for a person.
 
     Args:
         parent: Parent Tkinter window
         person: Person dictionary to analyze
+        personality_cache: PersonalityCache for the MBTI type (default: a new
+            one in memory)
     """
     jobs_window = Toplevel(parent)
     jobs_window.title("Suitable Jobs")
     jobs_window.configure(bg="dimgray")
     jobs_window.state("zoomed")
 
-    job_list = analyze_jobs(person)
+    # Same type (and personality bonus) as the results view and the export
+    if personality_cache is None:
+        personality_cache = PersonalityCache()
+    person["PersonalityTypeMB"] = personality_cache.personality_type(person)
+    job_list = top_sectors(person, k=10)
     name = f"{person.get('FirstName', '')} {person.get('LastName', '')}".strip()
 
     # Title
@@ -376,17 +391,19 @@ def show_jobs(parent, person: dict):
     treeview.column("score", anchor=CENTER, width=150, stretch=NO)
 
     # Populate treeview (show top 10)
-    for i, (sector, score) in enumerate(job_list[:10], 1):
+    for i, (sector, score) in enumerate(job_list, 1):
         treeview.insert("", END, values=(i, sector, f"{score:.1f}/100"))
 
 
-def show_personality(parent, person: dict):
+def show_personality(parent, person: dict, personality_cache=None):
     """
     Show personality analysis for a person.
 
     Args:
         parent: Parent Tkinter window
         person: Person dictionary to analyze
+        personality_cache: PersonalityCache that receives the MBTI type
+            (default: a new one in memory)
     """
     personality_window = Toplevel(parent)
     personality_window.title("Personality Analysis")
@@ -395,15 +412,15 @@ def show_personality(parent, person: dict):
 
     name = f"{person.get('FirstName', '')} {person.get('LastName', '')}".strip()
 
-    # Analyze personality
-    type_mb = analyze_personality(person)
+    # Analyze personality (type, MBTI percentages and Big Five profile)
+    if personality_cache is None:
+        personality_cache = PersonalityCache()
+    report = personality_report(person)
+    type_mb = report.mbti_type
+    personality_cache.put(person, type_mb)
     person["PersonalityTypeMB"] = type_mb
-
-    # Get MBTI percentages
-    percentages = get_personality_percentages(person)
-
-    # Get Big Five profile
-    big_five = get_big_five_profile(person)
+    percentages = report.percentages
+    big_five = report.big_five
 
     # Get personality info
     if type_mb in PersonalityTypes:
@@ -413,7 +430,7 @@ def show_personality(parent, person: dict):
         website = personality_info["WebSite"]
         strengths_list = personality_info.get("Strengths", [])
         weaknesses_list = personality_info.get("Weaknesses", [])
-        careers = personality_info.get("Careers", [])
+        careers = report.careers
     else:
         type_name = ""
         description = "Personality type could not be determined."
@@ -16,7 +16,8 @@ StandardScaler applies further normalization during training.
 
 import re
 from typing import Optional
-from datetime import date
+
+from ..analysis.normalized_cv import NormalizedCV, normalize_cv
 
 
 class FeatureExtractor:
@@ -73,17 +74,20 @@ class FeatureExtractor:
         """
         self.sector_data = sector_data or {}
 
-    def extract(self, cv_data: dict, sector: str = "") -> list[float]:
+    def extract(
+        self, cv_data: dict | NormalizedCV, sector: str = ""
+    ) -> list[float]:
         """
         Extract all features from CV data.
 
         Args:
-            cv_data: Dictionary containing CV data
+            cv_data: Dictionary containing CV data (or a NormalizedCV)
             sector: Target job sector for field matching
 
         Returns:
             List of numerical features
         """
+        cv_data = normalize_cv(cv_data)
         features = []
 
         # Education features
@@ -109,12 +113,14 @@ class FeatureExtractor:
 
         return features
 
-    def _extract_education_features(self, cv_data: dict, sector: str) -> list[float]:
+    def _extract_education_features(
+        self, cv_data: NormalizedCV, sector: str
+    ) -> list[float]:
         """Extract education-related features."""
         features = []
 
         # Education level (0-6)
-        qual_text = self._safe_lower(cv_data.get("QualificationsAwarded", ""))
+        qual_text = cv_data.text("QualificationsAwarded")
         education_level = self._get_education_level(qual_text)
 
         # Boost for master's
@@ -127,13 +133,13 @@ class FeatureExtractor:
         features.append(float(education_level))
 
         # Field match ratio
-        subjects = self._safe_lower(cv_data.get("SubjectsStudied", ""))
+        subjects = cv_data.text("SubjectsStudied")
         field_keywords = self._get_sector_keywords(sector, "School/College")
         field_match = self._calculate_match_ratio(subjects, field_keywords)
         features.append(field_match)
 
         # University prestige
-        college = self._safe_lower(cv_data.get("College/University", ""))
+        college = cv_data.text("College/University")
         prestige = self._get_university_prestige(college)
         features.append(float(prestige))
 
@@ -150,52 +156,36 @@ class FeatureExtractor:
 
         return features
 
-    def _extract_work_features(self, cv_data: dict, sector: str) -> list[float]:
+    def _extract_work_features(self, cv_data: NormalizedCV, sector: str) -> list[float]:
         """Extract work experience features."""
         features = []
 
-        total_years = 0.0
-        num_positions = 0
         max_seniority = 0
         is_current = False
         tenures = []
 
         work_keywords = self._get_sector_keywords(sector, "WorkExperience")
-        work_text = ""
-
-        for i in range(1, 4):
-            workplace = cv_data.get(f"Workplace{i}", "")
-            if not workplace:
-                continue
-
-            num_positions += 1
-            dates = cv_data.get(f"Dates{i}", "")
-            occupation = cv_data.get(f"Occupation{i}", "")
-            activities = cv_data.get(f"MainActivities{i}", "")
 
-            # Work text for matching
-            work_text += f" {workplace} {occupation} {activities}"
+        for entry in cv_data.work:
+            if entry.years > 0:
+                tenures.append(entry.years)
 
-            # Calculate tenure
-            tenure = self._calculate_tenure(dates)
-            if tenure > 0:
-                tenures.append(tenure)
-                total_years += tenure
-
-            # Check if current
-            if "current" in dates.lower() or "present" in dates.lower():
+            # Ranges ending in "current", "present", ...
+            if entry.ongoing:
                 is_current = True
 
-            # Seniority
-            seniority = self._get_seniority(occupation)
-            max_seniority = max(max_seniority, seniority)
+            max_seniority = max(max_seniority, self._get_seniority(entry.occupation))
+
+        total_years = cv_data.tenure_years
+        num_positions = len(cv_data.work)
+        work_text = "".join(f" {entry.text}" for entry in cv_data.work)
 
         features.append(min(total_years, 20.0))  # Cap at 20 years
         features.append(float(num_positions))
         features.append(float(max_seniority))
 
         # Work field match
-        field_match = self._calculate_match_ratio(work_text.lower(), work_keywords)
+        field_match = self._calculate_match_ratio(work_text, work_keywords)
         features.append(field_match)
 
         features.append(1.0 if is_current else 0.0)
@@ -206,7 +196,9 @@ class FeatureExtractor:
 
         return features
 
-    def _extract_skills_features(self, cv_data: dict, sector: str) -> list[float]:
+    def _extract_skills_features(
+        self, cv_data: NormalizedCV, sector: str
+    ) -> list[float]:
         """Extract skills-related features."""
         features = []
 
@@ -219,7 +211,7 @@ class FeatureExtractor:
             "CommunicationSkills",
             "OrganizationalManagerialSkills",
         ]:
-            skills_text += " " + self._safe_lower(cv_data.get(field, ""))
+            skills_text += " " + cv_data.text(field)
 
         # Required skills match
         required_skills = self._get_sector_keywords(sector, "Skills")
@@ -249,7 +241,7 @@ class FeatureExtractor:
 
         return features
 
-    def _extract_language_features(self, cv_data: dict) -> list[float]:
+    def _extract_language_features(self, cv_data: NormalizedCV) -> list[float]:
         """Extract language-related features."""
         features = []
 
@@ -285,7 +277,7 @@ class FeatureExtractor:
 
         return features
 
-    def _extract_soft_skills_features(self, cv_data: dict) -> list[float]:
+    def _extract_soft_skills_features(self, cv_data: NormalizedCV) -> list[float]:
         """Extract soft skills features."""
         features = []
 
@@ -295,7 +287,7 @@ class FeatureExtractor:
             "CommunicationSkills",
             "OrganizationalManagerialSkills",
         ]:
-            text += " " + self._safe_lower(cv_data.get(field, ""))
+            text += " " + cv_data.text(field)
 
         # Soft skills categories matched
         categories = {
@@ -324,7 +316,7 @@ class FeatureExtractor:
 
         return features
 
-    def _extract_additional_features(self, cv_data: dict) -> list[float]:
+    def _extract_additional_features(self, cv_data: NormalizedCV) -> list[float]:
         """Extract additional information features."""
         features = []
 
@@ -352,7 +344,9 @@ class FeatureExtractor:
 
         return features
 
-    def _extract_personality_features(self, cv_data: dict, sector: str) -> list[float]:
+    def _extract_personality_features(
+        self, cv_data: NormalizedCV, sector: str
+    ) -> list[float]:
         """Extract personality-related features."""
         features = []
 
@@ -388,12 +382,6 @@ class FeatureExtractor:
 
     # Helper methods
 
-    def _safe_lower(self, value) -> str:
-        """Safely convert to lowercase string."""
-        if value is None:
-            return ""
-        return str(value).lower().strip()
-
     def _get_sector_keywords(self, sector: str, field: str) -> list[str]:
         """Get keywords for a sector field."""
         if not sector or not self.sector_data:
@@ -443,58 +431,6 @@ class FeatureExtractor:
 
         return 0
 
-    def _calculate_tenure(self, dates: str) -> float:
-        """Calculate tenure in years from date string."""
-        if not dates or "-" not in dates:
-            return 0.0
-
-        try:
-            parts = dates.split("-")
-            if len(parts) != 2:
-                return 0.0
-
-            start_str = parts[0].strip()
-            end_str = parts[1].strip()
-
-            start = self._parse_date(start_str)
-            if not start:
-                return 0.0
-
-            if end_str.lower() in ["current", "present", "now", ""]:
-                end = date.today()
-            else:
-                end = self._parse_date(end_str)
-                if not end:
-                    end = date.today()
-
-            years = (end - start).days / 365.25
-            return max(0.0, years)
-        except Exception:
-            return 0.0
-
-    def _parse_date(self, date_str: str) -> Optional[date]:
-        """Parse date from string."""
-        if not date_str:
-            return None
-
-        # Try DD.MM.YYYY
-        try:
-            parts = date_str.strip().split(".")
-            if len(parts) >= 3:
-                return date(int(parts[2]), int(parts[1]), int(parts[0]))
-        except Exception:
-            pass
-
-        # Try year only
-        try:
-            year = int(date_str.strip())
-            if 1900 <= year <= 2100:
-                return date(year, 1, 1)
-        except Exception:
-            pass
-
-        return None
-
     def _get_seniority(self, occupation: str) -> int:
         """Get seniority level from occupation (0-6)."""
         occ_lower = occupation.lower()
@@ -551,13 +487,13 @@ class FeatureExtractor:
 
 
 def extract_features(
-    cv_data: dict, sector: str = "", sector_data: dict = None
+    cv_data: dict | NormalizedCV, sector: str = "", sector_data: dict = None
 ) -> list[float]:
     """
     Convenience function to extract features from CV data.
 
     Args:
-        cv_data: Dictionary containing CV data
+        cv_data: Dictionary containing CV data (or a NormalizedCV)
         sector: Target job sector
         sector_data: Job sectors dictionary
 
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Benchmark CV parsing, validation and writing over synthetic corpora.
+
+Usage:
+    python -m scripts.benchmark_io [options]
+
+Options:
+    --sizes N,N,...   Corpus sizes (default: 1000,10000,100000)
+    --variants V,...  Corpus variants: clean, noisy (default: both)
+    --workdir DIR     Keep the generated corpora here (default: a temp dir)
+    --output FILE     Write the JSON results to FILE (default: stdout)
+    --no-memory       Skip the peak memory measurements
+    --compare FILE    Print the speed-up against an earlier results file
+
+Corpora are built with generate_synthetic_cv. The noisy variant shuffles
+the CV sections, pads labels and values with extra whitespace and blank
+lines, and stores a third of the files as Latin-1. Each operation is timed
+once without tracing and, unless --no-memory is given, run again under
+tracemalloc to record its peak memory.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from persona2hire.cv.parser import (
+    get_cv_summary,
+    iter_cv_files,
+    read_cv_file,
+    validate_cv_data,
+)
+from persona2hire.cv.validation import validate_many
+from persona2hire.cv.writer import render_cv_text, write_cv_file, write_cv_files
+from persona2hire.ml.data_generator import generate_synthetic_cv
+
+
+DEFAULT_SIZES = "1000,10000,100000"
+VARIANTS = ("clean", "noisy")
+
+# Accented values for the Latin-1 files (not valid UTF-8 once encoded)
+_LATIN1_CITIES = ["Zürich", "Málaga", "Besançon", "Göteborg", "Kraków"]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark CV parsing, validation and writing"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=str,
+        default=DEFAULT_SIZES,
+        help="Comma-separated corpus sizes",
+    )
+    parser.add_argument(
+        "--variants",
+        type=str,
+        default=",".join(VARIANTS),
+        help="Comma-separated corpus variants (clean, noisy)",
+    )
+    parser.add_argument(
+        "--workdir",
+        type=str,
+        help="Keep the generated corpora in this directory",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="Write the JSON results to this file",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip the peak memory measurements",
+    )
+    parser.add_argument(
+        "--compare",
+        type=str,
+        metavar="FILE",
+        help="Print the speed-up against an earlier results file",
+    )
+
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    variants = [v.strip() for v in args.variants.split(",") if v.strip()]
+    for variant in variants:
+        if variant not in VARIANTS:
+            parser.error(f"unknown variant: {variant}")
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="p2h_bench_")
+    results = []
+    try:
+        for size in sizes:
+            persons = [generate_synthetic_cv(seed=i) for i in range(size)]
+            for variant in variants:
+                directory = os.path.join(workdir, f"{variant}_{size}")
+                results.extend(
+                    run_benchmarks(persons, variant, directory, not args.no_memory)
+                )
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        log(f"\nResults saved to {args.output}")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f)["results"], results)
+
+
+def run_benchmarks(persons: list, variant: str, directory: str, memory: bool):
+    """Write one corpus variant, then time every operation on it."""
+    size = len(persons)
+    log(f"\n{variant} corpus, {size} CVs ({directory})")
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+
+    results = []
+
+    def record(operation, function):
+        result = measure(function, memory)
+        result.update(size=size, variant=variant, operation=operation)
+        result["per_second"] = round(size / max(result["seconds"], 1e-9), 1)
+        results.append(result)
+        peak = result["peak_mb"]
+        log(
+            f"  {operation:<18} {result['seconds']:8.3f} s"
+            f"  {result['per_second']:10.0f} CVs/s"
+            + (f"  {peak:8.1f} MB peak" if peak is not None else "")
+        )
+
+    if variant == "clean":
+        # Writers are timed on the clean corpus only; each run gets a fresh
+        # directory so name collisions are the same every time
+        scratch = os.path.join(directory, "scratch")
+
+        def run_write_cv_file():
+            fresh_directory(scratch)
+            for person in persons:
+                write_cv_file(person, scratch)
+
+        def run_write_cv_files():
+            fresh_directory(scratch)
+            write_cv_files(persons, scratch)
+
+        record("write_cv_file", run_write_cv_file)
+        record("write_cv_files", run_write_cv_files)
+        shutil.rmtree(scratch)
+        filepaths = write_cv_files(persons, directory)
+    else:
+        filepaths = write_noisy_corpus(persons, directory)
+
+    parsed = []
+
+    def run_read_cv_file():
+        parsed[:] = [read_cv_file(filepath) for filepath in filepaths]
+
+    def run_iter_cv_files():
+        for _, cv_data in iter_cv_files(filepaths):
+            if isinstance(cv_data, Exception):
+                raise cv_data
+
+    record("read_cv_file", run_read_cv_file)
+    record("iter_cv_files", run_iter_cv_files)
+    record("validate_cv_data", lambda: [validate_cv_data(cv) for cv in parsed])
+    record("validate_many", lambda: validate_many(parsed).totals())
+    record("get_cv_summary", lambda: [get_cv_summary(cv) for cv in parsed])
+    return results
+
+
+def measure(function, memory: bool) -> dict:
+    """Time one run of function and, optionally, its peak traced memory."""
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+
+    peak_mb = None
+    if memory:
+        tracemalloc.start()
+        try:
+            function()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peak_mb = round(peak / (1024 * 1024), 3)
+
+    return {"seconds": seconds, "peak_mb": peak_mb}
+
+
+def write_noisy_corpus(persons: list, directory: str) -> list:
+    """Write CVs with shuffled sections, extra whitespace and Latin-1 files."""
+    rng = random.Random(0)
+    filepaths = []
+    for i, person in enumerate(persons):
+        encoding = "utf-8"
+        if i % 3 == 0:
+            person = dict(person, City=rng.choice(_LATIN1_CITIES))
+            encoding = "latin-1"
+        text = add_noise(render_cv_text(person), rng)
+        filepath = os.path.join(directory, f"cv_{i:06d}.txt")
+        with open(filepath, "w", encoding=encoding) as f:
+            f.write(text)
+        filepaths.append(filepath)
+    return filepaths
+
+
+def add_noise(text: str, rng: random.Random) -> str:
+    """Shuffle the sections of a CV and pad it with whitespace."""
+    sections = [section for section in text.split("\n\n") if section.strip()]
+    header, sections = sections[0], sections[1:]
+    rng.shuffle(sections)
+
+    lines = []
+    for line in "\n\n".join([header] + sections).split("\n"):
+        if " : " in line:
+            label, value = line.split(" : ", 1)
+            line = f"{label}{' ' * rng.randint(1, 4)}:{' ' * rng.randint(1, 4)}{value}"
+        lines.append(line + " " * rng.randint(0, 3))
+        if rng.random() < 0.1:
+            lines.append(" " * rng.randint(0, 8))
+    return "\n".join(lines)
+
+
+def fresh_directory(directory: str):
+    """Empty a directory (creating it if needed)."""
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+
+
+def compare(old_results: list, new_results: list):
+    """Print how much faster each operation got since an earlier run."""
+    old = {(r["size"], r["variant"], r["operation"]): r for r in old_results}
+    log("\nSpeed-up against the earlier run:")
+    for result in new_results:
+        key = (result["size"], result["variant"], result["operation"])
+        if key in old and result["seconds"] > 0:
+            speedup = old[key]["seconds"] / result["seconds"]
+            log(f"  {key[1]:<6} {key[0]:>7} {key[2]:<18} {speedup:6.2f}x")
+
+
+def log(message: str):
+    """Print progress to stderr, keeping stdout for the JSON results."""
+    print(message, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,19 +9,22 @@ Options:
     --count N       Number of CVs to generate (default: 10)
     --sector NAME   Generate CVs for specific sector
     --output DIR    Output directory (default: samples/generated)
-    --format FMT    Output format: json, txt, both (default: both)
+    --format FMT    Output format: json, txt, both, bundle (default: both);
+                    bundle packs all CVs into one samples.cvbundle file
 """
 
 import argparse
 import json
 import os
 import sys
+from contextlib import nullcontext
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from persona2hire.ml.data_generator import generate_synthetic_cv, SECTOR_PROFILES
-from persona2hire.cv.writer import write_cv_file
+from persona2hire.cv.bundle import BUNDLE_SUFFIX, CVBundleWriter
+from persona2hire.cv.writer import write_cv_files
 
 
 def main():
@@ -48,7 +51,7 @@ def main():
     parser.add_argument(
         "--format",
         type=str,
-        choices=["json", "txt", "both"],
+        choices=["json", "txt", "both", "bundle"],
         default="both",
         help="Output format",
     )
@@ -76,44 +79,67 @@ def main():
     print(f"Output: {args.output}\n")
 
     generated = []
-
-    for i in range(args.count):
-        # Cycle through sectors
-        sector = sectors[i % len(sectors)]
-
-        # Generate CV
-        cv = generate_synthetic_cv(target_sector=sector, seed=i)
-
-        # Determine quality based on index
-        quality = ["low", "medium", "high"][i % 3]
-
-        info = {
-            "index": i,
-            "sector": sector,
-            "quality": quality,
-            "name": f"{cv['FirstName']} {cv['LastName']}",
-        }
-        generated.append(info)
-
-        # Save in requested format(s)
-        basename = f"cv_{i:04d}_{sector}_{cv['LastName'].lower()}"
-
-        if args.format in ["json", "both"]:
-            json_path = os.path.join(args.output, f"{basename}.json")
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(cv, f, indent=2)
-
-        if args.format in ["txt", "both"]:
+    txt_cvs = []  # (basename, cv), written together after generation
+    bundle_path = None
+    if args.format == "bundle":
+        bundle_path = os.path.join(args.output, f"samples{BUNDLE_SUFFIX}")
+
+    # The bundle only replaces an existing one if every CV was added
+    bundle_writer = CVBundleWriter(bundle_path) if bundle_path else nullcontext()
+    with bundle_writer as bundle:
+        for i in range(args.count):
+            # Cycle through sectors
+            sector = sectors[i % len(sectors)]
+
+            # Generate CV
+            cv = generate_synthetic_cv(target_sector=sector, seed=i)
+
+            # Determine quality based on index
+            quality = ["low", "medium", "high"][i % 3]
+
+            info = {
+                "index": i,
+                "sector": sector,
+                "quality": quality,
+                "name": f"{cv['FirstName']} {cv['LastName']}",
+            }
+            generated.append(info)
+
+            # Save in requested format(s)
+            basename = f"cv_{i:04d}_{sector}_{cv['LastName'].lower()}"
+
+            if args.format in ["json", "both"]:
+                json_path = os.path.join(args.output, f"{basename}.json")
+                with open(json_path, "w", encoding="utf-8") as f:
+                    json.dump(cv, f, indent=2)
+
+            if args.format in ["txt", "both"]:
+                txt_cvs.append((basename, cv))
+
+            if bundle is not None:
+                bundle.add_cv(basename, cv)
+
+            print(f"  [{i+1}/{args.count}] {info['name']} ({sector}, {quality})")
+
+    if bundle_path is not None:
+        print(f"\nBundle saved to {bundle_path}")
+
+    if txt_cvs:
+        # A CV that cannot be written gets its exception instead of a path
+        txt_paths = write_cv_files(
+            [cv for _, cv in txt_cvs], args.output, return_exceptions=True
+        )
+        for (basename, cv), txt_path in zip(txt_cvs, txt_paths):
             try:
-                txt_path = write_cv_file(cv, output_dir=args.output)
+                if isinstance(txt_path, Exception):
+                    raise txt_path
                 # Rename to match naming scheme
                 new_path = os.path.join(args.output, f"{basename}.txt")
                 if txt_path != new_path:
                     os.rename(txt_path, new_path)
             except Exception as e:
-                print(f"Warning: Could not write txt for {info['name']}: {e}")
-
-        print(f"  [{i+1}/{args.count}] {info['name']} ({sector}, {quality})")
+                name = f"{cv['FirstName']} {cv['LastName']}"
+                print(f"Warning: Could not write txt for {name}: {e}")
 
     # Save manifest
     manifest = {
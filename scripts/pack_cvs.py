@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Pack CV text files into a single bundle file.
+
+Usage:
+    python -m scripts.pack_cvs [options] PATH [PATH ...]
+
+Each PATH is a CV file or a directory of CV files. Candidate ids are the
+file names without extension.
+
+Options:
+    --output FILE   Bundle file to create (default: CVs.cvbundle)
+    --pattern GLOB  File pattern used in directories (default: *.txt)
+    --list FILE     List the candidate ids in an existing bundle
+"""
+
+import argparse
+import fnmatch
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from persona2hire.cv.bundle import BUNDLE_SUFFIX, CVBundle, pack_cv_files
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pack CV text files into a single bundle file"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        help="CV files or directories of CV files",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=f"CVs{BUNDLE_SUFFIX}",
+        help="Bundle file to create",
+    )
+    parser.add_argument(
+        "--pattern",
+        type=str,
+        default="*.txt",
+        help="File pattern used in directories",
+    )
+    parser.add_argument(
+        "--list",
+        type=str,
+        metavar="FILE",
+        help="List the candidate ids in an existing bundle",
+    )
+
+    args = parser.parse_args()
+
+    if args.list:
+        with CVBundle(args.list) as bundle:
+            for candidate_id in bundle:
+                print(candidate_id)
+            print(f"\n{len(bundle)} CVs in {args.list}")
+        return
+
+    if not args.paths:
+        parser.error("no CV files or directories given")
+
+    filepaths = []
+    for path in args.paths:
+        if os.path.isdir(path):
+            names = sorted(
+                name
+                for name in os.listdir(path)
+                if fnmatch.fnmatch(name, args.pattern)
+            )
+            filepaths.extend(os.path.join(path, name) for name in names)
+        else:
+            filepaths.append(path)
+
+    try:
+        count = pack_cv_files(filepaths, args.output)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print(f"Packed {count} CVs into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Tests for memory-mapped CV bundles."""
+
+import os
+
+import pytest
+from persona2hire.cv.bundle import CVBundle, CVBundleWriter, pack_cv_files
+from persona2hire.cv.parser import read_cv_file
+from persona2hire.cv.writer import write_cv_file
+
+
+@pytest.fixture
+def cv_files(sample_cv_data, minimal_cv_data, temp_dir):
+    """CV files written by write_cv_file, plus a Latin-1 file."""
+    paths = [
+        write_cv_file(sample_cv_data, output_dir=temp_dir),
+        write_cv_file(minimal_cv_data, output_dir=temp_dir),
+    ]
+    latin_path = os.path.join(temp_dir, "latin.txt")
+    with open(latin_path, "w", encoding="latin-1") as f:
+        f.write("First-Name : Zoë\nLast-Name : Müller\n")
+    paths.append(latin_path)
+    return paths
+
+
+class TestCVBundle:
+    """Tests for CVBundle and pack_cv_files."""
+
+    def test_packed_cvs_match_files(self, cv_files, temp_dir):
+        """Test that every packed CV parses as read_cv_file parses the file."""
+        bundle_path = os.path.join(temp_dir, "cvs.cvbundle")
+        assert pack_cv_files(cv_files, bundle_path) == len(cv_files)
+
+        ids = [os.path.splitext(os.path.basename(path))[0] for path in cv_files]
+        with CVBundle(bundle_path) as bundle:
+            assert len(bundle) == len(cv_files)
+            assert bundle.ids() == ids
+            for candidate_id, path in zip(ids, cv_files):
+                assert candidate_id in bundle
+                assert bundle.read(candidate_id) == read_cv_file(path)
+            assert list(bundle.iter_cvs()) == [
+                (candidate_id, read_cv_file(path))
+                for candidate_id, path in zip(ids, cv_files)
+            ]
+
+    def test_random_access_by_id(self, sample_cv_data, minimal_cv_data, temp_dir):
+        """Test looking up CVs by id, in any order."""
+        bundle_path = os.path.join(temp_dir, "cvs.cvbundle")
+        with CVBundleWriter(bundle_path) as writer:
+            writer.add_cv("first", sample_cv_data)
+            writer.add_cv("second", minimal_cv_data)
+
+        with CVBundle(bundle_path) as bundle:
+            assert bundle["second"]["FirstName"] == "Jane"
+            assert bundle["first"]["FirstName"] == sample_cv_data["FirstName"]
+            assert "third" not in bundle
+            with pytest.raises(KeyError):
+                bundle.read("third")
+
+    def test_record_is_a_view_of_the_mapping(self, sample_cv_data, temp_dir):
+        """Test that records are memoryview slices, not copies."""
+        bundle_path = os.path.join(temp_dir, "cvs.cvbundle")
+        with CVBundleWriter(bundle_path) as writer:
+            writer.add_text("cv", "First-Name : Ann\n")
+
+        bundle = CVBundle(bundle_path)
+        record = bundle.record("cv")
+        assert isinstance(record, memoryview)
+        assert record.readonly
+        assert record.tobytes() == b"First-Name : Ann\n"
+        record.release()
+        bundle.close()
+
+    def test_empty_bundle(self, temp_dir):
+        """Test a bundle without any CVs."""
+        bundle_path = os.path.join(temp_dir, "empty.cvbundle")
+        assert pack_cv_files([], bundle_path) == 0
+        with CVBundle(bundle_path) as bundle:
+            assert len(bundle) == 0
+            assert list(bundle.iter_cvs()) == []
+
+    def test_duplicate_id_raises_error(self, temp_dir):
+        """Test that ids must be unique and nothing is left behind."""
+        bundle_path = os.path.join(temp_dir, "cvs.cvbundle")
+        with pytest.raises(ValueError):
+            with CVBundleWriter(bundle_path) as writer:
+                writer.add_text("cv", "First-Name : Ann\n")
+                writer.add_text("cv", "First-Name : Bob\n")
+        assert os.listdir(temp_dir) == []
+
+    def test_ids_must_match_files(self, cv_files, temp_dir):
+        """Test that packing with too few or too many ids raises an error."""
+        bundle_path = os.path.join(temp_dir, "cvs.cvbundle")
+        with pytest.raises(ValueError):
+            pack_cv_files(cv_files, bundle_path, ids=iter(["only-one"]))
+        with pytest.raises(ValueError):
+            pack_cv_files(cv_files[:1], bundle_path, ids=["a", "b"])
+        assert not os.path.exists(bundle_path)
+
+    def test_rejects_other_files(self, sample_cv_file):
+        """Test that a file that is not a bundle is rejected."""
+        with pytest.raises(ValueError):
+            CVBundle(sample_cv_file)
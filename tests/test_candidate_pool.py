@@ -0,0 +1,68 @@
+"""Tests for the indexed candidate pool."""
+
+import pytest
+from persona2hire.analysis.candidate_pool import CandidatePool
+from persona2hire.analysis.job_analyzer import filter_candidates
+
+
+@pytest.fixture
+def persons(sample_cv_data, minimal_cv_data, empty_cv_data):
+    """Candidates with varied nationalities, ages, skills and experience."""
+    german = dict(sample_cv_data, Nationality="German", Sex="M")
+    british = dict(
+        minimal_cv_data, Nationality="British", Sex="F", DateOfBirth="15.03.2000"
+    )
+    analyst = dict(
+        sample_cv_data,
+        Nationality="Austrian-German",
+        Sex="F",
+        DateOfBirth="unknown",
+        ComputerSkills="Machine learning, JavaScript",
+        ModernLanguage1="German",
+    )
+    return [german, british, dict(empty_cv_data), analyst]
+
+
+CRITERIA = [
+    {},
+    {"nationality": "german"},
+    {"nationality": "  "},
+    {"sex": "f"},
+    {"age_min": "20", "age_max": "30"},
+    {"age_min": "abc", "age_max": "30"},
+    {"experience_years": "2"},
+    {"experience_years": "not a number"},
+    {"skills": "python"},
+    {"skills": "java"},
+    {"skills": "machine learning, script"},
+    {"skills": "learning machine"},
+    {"languages": "english, german"},
+    {"languages": "japanese"},
+    {"nationality": "german", "sex": "F", "skills": "python"},
+]
+
+
+class TestCandidatePool:
+    """Tests for CandidatePool.filter."""
+
+    @pytest.mark.parametrize("criteria", CRITERIA)
+    def test_matches_filter_candidates(self, persons, criteria):
+        """Test that the indexed filter selects the same candidates in order."""
+        expected = filter_candidates(persons, criteria)
+        result = CandidatePool(persons).filter(criteria)
+        assert [id(p) for p in result] == [id(p) for p in expected]
+
+    def test_substring_matches_inside_tokens(self, persons):
+        """Test that skills match inside longer words, as in filter_candidates."""
+        result = CandidatePool(persons).filter({"skills": "avascri"})
+        assert [id(p) for p in result] == [id(persons[0]), id(persons[3])]
+
+    def test_missing_birth_date_passes_age_filter(self, persons):
+        """Test that candidates with no parseable birth date are kept."""
+        result = CandidatePool(persons).filter({"age_min": "90"})
+        assert persons[3] in result
+        assert persons[0] not in result
+
+    def test_len(self, persons):
+        """Test that the pool reports its size."""
+        assert len(CandidatePool(persons)) == len(persons)
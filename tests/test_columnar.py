@@ -0,0 +1,116 @@
+"""Tests for the columnar CV corpus format."""
+
+import os
+from datetime import date
+
+import pytest
+from persona2hire.analysis.job_analyzer import filter_candidates, get_score_breakdown
+from persona2hire.cv.parser import read_cv_file
+
+np = pytest.importorskip("numpy")
+
+from persona2hire.analysis.columnar import (  # noqa: E402
+    filter_indices,
+    language_scores,
+)
+from persona2hire.cv.columnar import ColumnarCorpus, write_columnar  # noqa: E402
+
+
+@pytest.fixture
+def persons(sample_cv_file, minimal_cv_data, empty_cv_data):
+    """A parsed CV, a minimal CV and an empty CV."""
+    return [read_cv_file(sample_cv_file), minimal_cv_data, empty_cv_data]
+
+
+@pytest.fixture
+def corpus(persons, temp_dir):
+    """The persons saved as a columnar corpus."""
+    directory = os.path.join(temp_dir, "corpus")
+    write_columnar(persons, directory)
+    return ColumnarCorpus(directory)
+
+
+class TestColumnarCorpus:
+    """Tests for write_columnar and ColumnarCorpus."""
+
+    def test_rows_round_trip(self, persons, corpus):
+        """Test that a parsed CV is rebuilt exactly."""
+        assert len(corpus) == len(persons)
+        assert corpus.row(0) == persons[0]
+        assert list(corpus.iter_rows())[0] == persons[0]
+
+    def test_missing_fields_are_empty(self, corpus):
+        """Test that fields a CV does not have are stored as empty strings."""
+        assert corpus.row(2)["FirstName"] == ""
+        assert corpus.row(1)["Hobbies"] == ""
+
+    def test_categorical_columns_are_dictionary_encoded(self, persons, corpus):
+        """Test that categorical columns store each distinct value once."""
+        sex = corpus.column("Sex")
+        assert sorted(sex.categories) == sorted(
+            {person.get("Sex", "") for person in persons}
+        )
+        assert sex.to_list() == [person.get("Sex", "") for person in persons]
+
+    def test_categories_round_trip_exactly(self, minimal_cv_data, temp_dir):
+        """Test that categories with trailing NULs or spaces are kept as is."""
+        values = ["German\0", "German", "", "  x  ", "Very long nationality"]
+        persons = [dict(minimal_cv_data, Nationality=value) for value in values]
+        directory = os.path.join(temp_dir, "corpus")
+        write_columnar(persons, directory)
+
+        nationality = ColumnarCorpus(directory).column("Nationality")
+        assert nationality.categories == values
+        assert nationality.to_list() == values
+
+    def test_columns_load_lazily(self, corpus):
+        """Test that only the columns used are loaded."""
+        assert corpus.loaded_columns == ()
+        corpus.column("Nationality")
+        assert corpus.loaded_columns == ("Nationality",)
+
+    def test_empty_corpus(self, temp_dir):
+        """Test a corpus without any CVs."""
+        directory = os.path.join(temp_dir, "empty")
+        assert write_columnar([], directory) == 0
+        corpus = ColumnarCorpus(directory)
+        assert len(corpus) == 0
+        assert list(corpus.iter_rows()) == []
+
+
+class TestColumnarAnalysis:
+    """Tests for filters and scores over a columnar corpus."""
+
+    @pytest.mark.parametrize(
+        "criteria",
+        [
+            {"nationality": "germ"},
+            {"sex": "m"},
+            {"age_min": "30", "age_max": "50"},
+            {"experience_years": "3"},
+            {"skills": "python, sql"},
+            {"languages": "english"},
+            {"nationality": "german", "skills": "docker"},
+        ],
+    )
+    def test_filters_match_filter_candidates(self, persons, corpus, criteria):
+        """Test that filter results equal filter_candidates."""
+        expected = [
+            i
+            for i, person in enumerate(persons)
+            if any(person is kept for kept in filter_candidates(persons, criteria))
+        ]
+        assert filter_indices(corpus, criteria).tolist() == expected
+
+    def test_filter_reads_only_needed_columns(self, corpus):
+        """Test that an age filter loads just the birth date column."""
+        filter_indices(corpus, {"age_min": "18"}, today=date(2024, 1, 1))
+        assert corpus.loaded_columns == ("DateOfBirth",)
+
+    def test_language_scores_match_breakdown(self, persons, corpus):
+        """Test that language scores equal get_score_breakdown."""
+        expected = [
+            get_score_breakdown(person, "Computers_ICT")["languages"]
+            for person in persons
+        ]
+        assert language_scores(corpus).tolist() == expected
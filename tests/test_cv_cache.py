@@ -0,0 +1,116 @@
+"""Tests for the parsed-CV cache."""
+
+import os
+
+import pytest
+from persona2hire.cv import cache as cache_module
+from persona2hire.cv.cache import CVCache
+from persona2hire.cv.parser import read_cv_file, validate_cv_data
+from persona2hire.cv.validation import format_errors, validate_many
+
+
+@pytest.fixture
+def cv_files(temp_dir):
+    """A few CV files, one of them invalid."""
+    paths = []
+    for i, first_name in enumerate(["Ann", "Bob", ""]):
+        path = os.path.join(temp_dir, f"cv_{i}.txt")
+        with open(path, "w") as f:
+            f.write(f"First-Name : {first_name}\nLast-Name : Test{i}\n")
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def cv_cache(temp_dir):
+    """Cache stored in the temporary directory."""
+    with CVCache(os.path.join(temp_dir, "cache", "cvs.sqlite3")) as cv_cache:
+        yield cv_cache
+
+
+def _touch(path, text):
+    """Rewrite a file so its size and modification time change."""
+    stat = os.stat(path)
+    with open(path, "w") as f:
+        f.write(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestCVCache:
+    """Tests for CVCache."""
+
+    def test_results_match_parser(self, cv_cache, cv_files):
+        """Test that loaded results equal read_cv_file and validate_cv_data."""
+        for _ in range(2):  # First read the files, then use the cache
+            records = list(cv_cache.iter_cv_files(cv_files))
+            assert [path for path, _, _ in records] == cv_files
+            for path, cv_data, (is_valid, errors) in records:
+                assert cv_data == read_cv_file(path)
+                expected = validate_cv_data(cv_data)
+                assert (is_valid, format_errors(errors, cv_data)) == expected
+        assert records[2][2] == (False, {"FirstName": "missing"})
+        assert len(cv_cache) == len(cv_files)
+
+    def test_unchanged_files_are_not_read(self, cv_cache, cv_files, monkeypatch):
+        """Test that cached files skip parsing entirely."""
+        list(cv_cache.iter_cv_files(cv_files))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file was parsed")
+
+        monkeypatch.setattr(cache_module, "iter_cv_files", fail)
+        assert len(list(cv_cache.iter_cv_files(cv_files))) == len(cv_files)
+
+    def test_changed_file_is_parsed_again(self, cv_cache, cv_files):
+        """Test that a new modification time or size invalidates an entry."""
+        list(cv_cache.iter_cv_files(cv_files))
+        _touch(cv_files[0], "First-Name : Changed\nLast-Name : Person\n")
+
+        assert set(cv_cache.get_many(cv_files)) == set(cv_files[1:])
+        records = list(cv_cache.iter_cv_files(cv_files))
+        assert records[0][1]["FirstName"] == "Changed"
+
+    def test_parser_version_invalidates(self, cv_cache, cv_files, monkeypatch):
+        """Test that entries from another parser version are ignored."""
+        list(cv_cache.iter_cv_files(cv_files))
+        monkeypatch.setattr(cache_module, "PARSER_VERSION", -1)
+        assert cv_cache.get_many(cv_files) == {}
+        assert cv_cache.prune() == len(cv_files)
+
+    def test_put_many_and_invalidate(self, cv_cache, cv_files):
+        """Test bulk storing and bulk removal."""
+        cvs = [read_cv_file(path) for path in cv_files]
+        report = validate_many(cvs)
+        cv_cache.put_many(
+            (path, cv_data, report.is_valid(index), report.errors(index))
+            for index, (path, cv_data) in enumerate(zip(cv_files, cvs))
+        )
+        assert set(cv_cache.get_many(cv_files)) == set(cv_files)
+
+        assert cv_cache.invalidate(cv_files[:2]) == 2
+        assert set(cv_cache.get_many(cv_files)) == {cv_files[2]}
+        assert cv_cache.invalidate() == 1
+        assert len(cv_cache) == 0
+
+    def test_prune_removes_deleted_files(self, cv_cache, cv_files):
+        """Test that entries of deleted files are pruned."""
+        list(cv_cache.iter_cv_files(cv_files))
+        os.remove(cv_files[1])
+        assert cv_cache.prune() == 1
+        assert len(cv_cache) == len(cv_files) - 1
+
+    def test_unreadable_files(self, cv_cache, temp_dir):
+        """Test that missing files are reported and not stored."""
+        missing = os.path.join(temp_dir, "missing.txt")
+        [(path, error, validation)] = cv_cache.iter_cv_files([missing])
+        assert isinstance(error, FileNotFoundError)
+        assert validation is None
+        assert len(cv_cache) == 0
+
+    def test_persists_between_sessions(self, temp_dir, cv_files):
+        """Test that a reopened cache still holds the entries."""
+        path = os.path.join(temp_dir, "cvs.sqlite3")
+        with CVCache(path) as cv_cache:
+            list(cv_cache.iter_cv_files(cv_files))
+        with CVCache(path) as cv_cache:
+            assert set(cv_cache.get_many(cv_files)) == set(cv_files)
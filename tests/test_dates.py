@@ -0,0 +1,95 @@
+"""Tests for CV date parsing."""
+
+import pytest
+from datetime import date
+from persona2hire.cv.dates import (
+    is_ongoing,
+    parse_date,
+    parse_date_range,
+    tenure_years,
+)
+
+
+class TestParseDate:
+    """Tests for parse_date."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("15.03.2020", date(2020, 3, 15)),
+            ("03/15/2020", date(2020, 3, 15)),
+            ("15/03/2020", date(2020, 3, 15)),
+            ("2020-03-15", date(2020, 3, 15)),
+            ("March 2020", date(2020, 3, 1)),
+            ("2020", date(2020, 1, 1)),
+            (" 1.2.20 ", date(20, 2, 1)),  # Lenient fallback
+        ],
+    )
+    def test_supported_formats(self, text, expected):
+        """Test every supported format."""
+        assert parse_date(text) == expected
+
+    @pytest.mark.parametrize("text", ["", "31.02.2020", "Foo 2020", "1800", "soon"])
+    def test_invalid_dates(self, text):
+        """Test that invalid or unsupported dates give None."""
+        assert parse_date(text) is None
+
+
+class TestDateRanges:
+    """Tests for date range parsing and tenure."""
+
+    def test_closed_range(self):
+        """Test a range with both ends."""
+        assert parse_date_range("01.01.2018 - 31.12.2020") == (
+            date(2018, 1, 1),
+            date(2020, 12, 31),
+        )
+
+    def test_open_range_is_not_resolved(self):
+        """Test that ongoing ranges keep an open end (cache-safe)."""
+        assert parse_date_range("01.01.2020 - current") == (date(2020, 1, 1), None)
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("01.01.2020 - current", True),
+            ("01.01.2020 - Present ", True),
+            ("garbage - current", True),
+            ("01.01.2020 - ", False),
+            ("01.01.2020 - xyz", False),
+            ("01.01.2020 - 31.12.2020", False),
+            ("current", False),
+            ("", False),
+        ],
+    )
+    def test_is_ongoing(self, text, expected):
+        """Test that only an open-end keyword after the dash means ongoing."""
+        assert is_ongoing(text) is expected
+
+    def test_tenure_uses_reference_date(self):
+        """Test that ongoing ranges run until the given date."""
+        years = tenure_years("01.01.2020 - present", today=date(2022, 1, 1))
+        assert years == pytest.approx(2.0, abs=0.01)
+
+    def test_invalid_ranges(self):
+        """Test ranges without a parseable start."""
+        assert parse_date_range("2019-01-01 - 2020-01-01") is None
+        assert tenure_years("invalid - dates") == 0.0
+        assert tenure_years(None) == 0.0
+
+    def test_tenure_array_matches_scalar(self):
+        """Test that the batch API gives the same tenures."""
+        np = pytest.importorskip("numpy")
+        from persona2hire.cv.dates import tenure_years_array
+
+        today = date(2024, 6, 1)
+        texts = [
+            "01.01.2018 - 31.12.2020",
+            "01.01.2020 - current",
+            "garbage",
+            "31.12.2020 - 01.01.2018",
+            "March 2019 - 2021",
+        ]
+        expected = [tenure_years(text, today) for text in texts]
+        assert tenure_years_array(texts, today).tolist() == expected
+        assert tenure_years_array([], today).shape == (0,)
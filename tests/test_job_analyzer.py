@@ -1,5 +1,7 @@
 """Tests for job analyzer functionality."""
 
+import dataclasses
+
 import pytest
 from datetime import date
 from persona2hire.analysis.job_analyzer import (
@@ -7,6 +9,7 @@ from persona2hire.analysis.job_analyzer import (
     analyze_jobs,
     get_score_breakdown,
     get_skill_gaps,
+    score_detailed,
     filter_candidates,
     _parse_date,
     _calculate_time_worked,
@@ -88,6 +91,11 @@ class TestAnalyzeJobs:
 
         assert sectors_in_results == set(JobSectors.keys())
 
+    def test_matches_per_sector_analysis(self, sample_cv_data):
+        """Test that the single-pass scores equal analyze_job for each sector."""
+        for sector, score in analyze_jobs(sample_cv_data):
+            assert score == analyze_job(sample_cv_data, sector)
+
 
 class TestGetScoreBreakdown:
     """Tests for the get_score_breakdown function."""
@@ -158,6 +166,51 @@ class TestGetSkillGaps:
         assert gaps["matched"] == []
 
 
+class TestScoreDetailed:
+    """Tests for the score_detailed function."""
+
+    @pytest.mark.parametrize("sector", ["Computers_ICT", "Healthcare"])
+    def test_matches_separate_calls(self, sample_cv_data, sector):
+        """Test that one result equals analyze_job, breakdown and skill gaps."""
+        result = score_detailed(sample_cv_data, sector)
+        assert result.total == analyze_job(sample_cv_data, sector)
+        assert result.as_breakdown() == get_score_breakdown(sample_cv_data, sector)
+        assert result.skill_gaps() == get_skill_gaps(sample_cv_data, sector)
+        assert result.ml_adjustment == 0.0
+
+    def test_personality_type_override(self, sample_cv_data):
+        """Test that a given personality type is used for the bonus."""
+        result = score_detailed(sample_cv_data, "Computers_ICT", "INTJ")
+        assert result.total == analyze_job(sample_cv_data, "Computers_ICT", "INTJ")
+
+    def test_ml_adjustment(self, sample_cv_data, monkeypatch):
+        """Test that the ML adjustment is reported and included in the total."""
+        from persona2hire.analysis import job_analyzer
+
+        monkeypatch.setattr(job_analyzer, "is_ml_available", lambda: True)
+        monkeypatch.setattr(
+            job_analyzer, "_apply_ml_adjustment", lambda p, s, score: score * 0.8
+        )
+        result = score_detailed(sample_cv_data, "Computers_ICT", use_ml=True)
+        base = result.total - result.ml_adjustment
+        assert result.ml_adjustment < 0
+        expected = analyze_job(sample_cv_data, "Computers_ICT", use_ml=True)
+        assert result.total == expected
+        assert base == pytest.approx(
+            analyze_job(sample_cv_data, "Computers_ICT", use_ml=False), abs=0.1
+        )
+
+    def test_result_is_immutable(self, minimal_cv_data):
+        """Test that results cannot be modified."""
+        result = score_detailed(minimal_cv_data, "Computers_ICT")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.total = 100.0
+
+    def test_invalid_sector(self, sample_cv_data):
+        """Test that an unknown sector gives no result."""
+        assert score_detailed(sample_cv_data, "InvalidSector") is None
+
+
 class TestFilterCandidates:
     """Tests for the filter_candidates function."""
 
@@ -0,0 +1,77 @@
+"""Tests for compiled keyword matching."""
+
+import pytest
+from persona2hire.analysis.keyword_matcher import (
+    KeywordMatcher,
+    REGEX_THRESHOLD,
+    compile_keywords,
+    sector_matcher,
+)
+from persona2hire.data.job_sectors import JobSectors
+
+
+def _naive(keywords, text):
+    return {kw.lower() for kw in keywords if kw.lower() in text}
+
+
+class TestKeywordMatcher:
+    """Tests for the KeywordMatcher class."""
+
+    def test_small_list_matches_substrings(self):
+        """Test that keywords are matched as plain substrings."""
+        matcher = KeywordMatcher(["Python", "SQL", "java"])
+        assert matcher.find("python and javascript") == {"python", "java"}
+
+    def test_empty_text(self):
+        """Test that empty text matches nothing."""
+        assert KeywordMatcher(["python"]).find("") == frozenset()
+
+    def test_large_list_matches_overlapping_keywords(self):
+        """Test that the regex strategy recovers nested and overlapping matches."""
+        filler = [f"filler{i:03d}" for i in range(REGEX_THRESHOLD)]
+        keywords = filler + ["data", "database", "base", "sql", "data analysis"]
+        matcher = KeywordMatcher(keywords)
+        text = "database admin, data analysis with sql"
+        assert matcher.find(text) == _naive(keywords, text)
+
+    def test_regex_agrees_with_naive_scan(self):
+        """Test that all-sector keyword lists match exactly like `kw in text`."""
+        keywords = [kw for data in JobSectors.values() for kw in data["Skills"]]
+        matcher = KeywordMatcher(keywords)
+        text = (
+            " python, machine learning, project management; accounting "
+            "c++ and team leadership (first aid) - welding, sales"
+        )
+        assert len(matcher) >= REGEX_THRESHOLD
+        assert matcher.find(text) == _naive(keywords, text)
+
+    def test_count_includes_repeated_keywords(self):
+        """Test that repeated keywords are counted like the original list."""
+        matcher = KeywordMatcher(["SQL", "sql", "python"])
+        assert len(matcher) == 2
+        assert matcher.size == 3
+        assert matcher.count(matcher.find("sql only")) == 2
+
+
+class TestSectorMatcher:
+    """Tests for the cached sector matchers."""
+
+    def test_matcher_is_cached(self):
+        """Test that the same keyword list reuses one compiled matcher."""
+        assert sector_matcher("Computers_ICT", "Skills") is sector_matcher(
+            "Computers_ICT", "Skills"
+        )
+        assert compile_keywords(("a", "b")) is compile_keywords(("a", "b"))
+
+    def test_unknown_sector_is_empty(self):
+        """Test that unknown sectors give an empty matcher."""
+        matcher = sector_matcher("NonexistentSector", "Skills")
+        assert len(matcher) == 0
+        assert matcher.find("python") == frozenset()
+
+    @pytest.mark.parametrize("field", ["School/College", "WorkExperience", "Skills"])
+    def test_sector_fields_compile(self, field):
+        """Test that every sector keyword list compiles."""
+        for sector in JobSectors:
+            matcher = sector_matcher(sector, field)
+            assert len(matcher) == len({kw.lower() for kw in JobSectors[sector][field]})
@@ -37,6 +37,31 @@ class TestFeatureExtractor:
         assert len(features) == 31
         assert all(isinstance(f, (int, float)) for f in features)
 
+    def test_work_features_from_work_entries(self, sample_cv_data):
+        """Test that tenure and current employment follow the work entries."""
+        names = FeatureExtractor.FEATURE_NAMES
+        features = dict(zip(names, extract_features(sample_cv_data)))
+        assert features["total_work_years"] == pytest.approx(5.58, abs=0.01)
+        assert features["current_employment"] == 0.0
+
+        ongoing = dict(sample_cv_data, Dates1="01.01.2018 - present")
+        features = dict(zip(names, extract_features(ongoing)))
+        assert features["current_employment"] == 1.0
+
+    @pytest.mark.parametrize(
+        "dates, current",
+        [
+            ("01.01.2020 - xyz", 0.0),  # Unparseable end
+            ("01.01.2020 - ", 0.0),  # Empty end
+            ("garbage - current", 1.0),  # Open end, unparseable start
+        ],
+    )
+    def test_current_employment_needs_open_end(self, sample_cv_data, dates, current):
+        """Test that only an open-end keyword marks a job as current."""
+        cv_data = dict(sample_cv_data, Dates1=dates)
+        features = dict(zip(FeatureExtractor.FEATURE_NAMES, extract_features(cv_data)))
+        assert features["current_employment"] == current
+
 
 class TestDataGenerator:
     """Tests for the synthetic data generator."""
@@ -0,0 +1,107 @@
+"""Tests for the normalized CV view."""
+
+import pytest
+from persona2hire.analysis.job_analyzer import (
+    analyze_job,
+    analyze_jobs,
+    get_score_breakdown,
+    get_skill_gaps,
+)
+from persona2hire.analysis.normalized_cv import NormalizedCV, normalize_cv
+from persona2hire.analysis.personality_analyzer import (
+    analyze_personality,
+    get_big_five_profile,
+    get_personality_percentages,
+)
+from persona2hire.data.job_sectors import JobSectors
+from persona2hire.ml.feature_extractor import FeatureExtractor
+
+
+class TestNormalizedCV:
+    """Tests for NormalizedCV construction."""
+
+    def test_texts_are_lowercased_and_stripped(self, sample_cv_data):
+        """Test that field texts are normalized."""
+        cv = NormalizedCV(sample_cv_data)
+        assert cv.text("FirstName") == "john"
+        assert cv.text("MissingField") == ""
+
+    def test_raw_access(self, sample_cv_data):
+        """Test that the raw values stay reachable like a dict."""
+        cv = NormalizedCV(sample_cv_data)
+        assert cv["FirstName"] == "John"
+        assert cv.get("MissingField", "x") == "x"
+        assert "LastName" in cv
+
+    def test_work_entries(self, sample_cv_data):
+        """Test that only filled-in workplaces are parsed, with tenure."""
+        cv = NormalizedCV(sample_cv_data)
+        assert [entry.number for entry in cv.work] == [1, 2]
+        assert cv.work[0].start.year == 2018
+        assert 2.9 < cv.work[0].years < 3.1
+        assert cv.tenure_years == pytest.approx(sum(e.years for e in cv.work))
+        assert cv.seniority > 0
+
+    def test_master_raises_qualification_level(self, minimal_cv_data):
+        """Test that a master's degree counts as at least level 5."""
+        person = dict(minimal_cv_data, Master1="Something")
+        assert NormalizedCV(person).qualification_level >= 5
+
+    def test_tokens(self):
+        """Test description, skills and hobby tokenization."""
+        cv = NormalizedCV(
+            {
+                "ShortDescription": "Calm,  analytical person",
+                "ComputerSkills": "Python, SQL",
+                "Hobbies": "Chess, , Hiking ",
+            }
+        )
+        assert cv.description_words == ["calm", "analytical", "person"]
+        assert cv.skills_words == ["python", "sql"]
+        assert cv.hobbies == ["chess", "hiking"]
+
+    def test_none_values(self):
+        """Test that None values are treated as empty."""
+        cv = NormalizedCV({"ShortDescription": None, "Workplace1": None})
+        assert cv.description_words == []
+        assert cv.work == ()
+
+    def test_normalize_cv_is_idempotent(self, sample_cv_data):
+        """Test that normalizing twice returns the same object."""
+        cv = normalize_cv(sample_cv_data)
+        assert normalize_cv(cv) is cv
+
+
+class TestAnalyzersAcceptNormalizedCV:
+    """Tests that all analyzers give the same results for a NormalizedCV."""
+
+    @pytest.fixture(params=["sample_cv_data", "minimal_cv_data", "empty_cv_data"])
+    def person(self, request):
+        """Each of the shared CV fixtures."""
+        return request.getfixturevalue(request.param)
+
+    def test_job_analyzer(self, person):
+        """Test job scoring, breakdown and skill gaps."""
+        cv = NormalizedCV(person)
+        for sector in ["Computers_ICT", "Healthcare"]:
+            assert analyze_job(cv, sector) == analyze_job(person, sector)
+            assert get_score_breakdown(cv, sector) == get_score_breakdown(
+                person, sector
+            )
+            assert get_skill_gaps(cv, sector) == get_skill_gaps(person, sector)
+        assert analyze_jobs(cv) == analyze_jobs(person)
+
+    def test_personality_analyzer(self, person):
+        """Test MBTI type, percentages and Big Five profile."""
+        cv = NormalizedCV(person)
+        assert analyze_personality(cv) == analyze_personality(person)
+        assert get_personality_percentages(cv) == get_personality_percentages(person)
+        assert get_big_five_profile(cv) == get_big_five_profile(person)
+
+    def test_feature_extractor(self, person):
+        """Test ML feature extraction."""
+        extractor = FeatureExtractor(JobSectors)
+        cv = NormalizedCV(person)
+        assert extractor.extract(cv, "Computers_ICT") == extractor.extract(
+            person, "Computers_ICT"
+        )
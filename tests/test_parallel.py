@@ -0,0 +1,66 @@
+"""Tests for multi-process batch scoring."""
+
+import pytest
+from persona2hire.analysis import parallel
+from persona2hire.analysis.job_analyzer import analyze_job
+from persona2hire.analysis.normalized_cv import NormalizedCV
+from persona2hire.analysis.parallel import score_candidates_parallel
+from persona2hire.data.job_sectors import JobSectors
+
+
+@pytest.fixture
+def persons(sample_cv_data, minimal_cv_data, empty_cv_data):
+    """Distinct candidates in a known order."""
+    persons = []
+    for i, base in enumerate([sample_cv_data, minimal_cv_data, empty_cv_data] * 3):
+        person = dict(base, FirstName=f"P{i}")
+        if i % 2:
+            person["ComputerSkills"] = "Python, SQL, Java"
+        persons.append(person)
+    return persons
+
+
+def _expected(persons, sectors):
+    return [[analyze_job(person, sector) for sector in sectors] for person in persons]
+
+
+class TestScoreCandidatesParallel:
+    """Tests for score_candidates_parallel."""
+
+    def test_small_input_runs_in_process(self, persons):
+        """Test that small inputs match analyze_job for every sector."""
+        sectors = list(JobSectors)
+        assert score_candidates_parallel(persons) == _expected(persons, sectors)
+
+    def test_process_pool_keeps_input_order(self, persons, monkeypatch):
+        """Test that chunked pool results come back in input order."""
+        monkeypatch.setattr(parallel, "MIN_PARALLEL_CANDIDATES", 0)
+        sectors = ["Computers_ICT", "Healthcare"]
+        scores = score_candidates_parallel(persons, sectors, workers=2, chunksize=2)
+        assert scores == _expected(persons, sectors)
+
+    def test_pool_failure_falls_back(self, persons, monkeypatch):
+        """Test that a pool that cannot start falls back to in-process."""
+
+        class BrokenExecutor:
+            def __init__(self, *args, **kwargs):
+                raise OSError("no processes")
+
+        monkeypatch.setattr(parallel, "MIN_PARALLEL_CANDIDATES", 0)
+        monkeypatch.setattr(parallel, "ProcessPoolExecutor", BrokenExecutor)
+        sectors = ["Computers_ICT"]
+        scores = score_candidates_parallel(persons, sectors, workers=4)
+        assert scores == _expected(persons, sectors)
+
+    def test_unknown_sector_and_normalized_input(self, persons):
+        """Test unknown sectors score 0 and NormalizedCV input is accepted."""
+        cvs = [NormalizedCV(person) for person in persons]
+        scores = score_candidates_parallel(cvs, ["Computers_ICT", "NotASector"])
+        assert [row[1] for row in scores] == [0.0] * len(persons)
+        assert [row[0] for row in scores] == [
+            analyze_job(person, "Computers_ICT") for person in persons
+        ]
+
+    def test_empty_input(self):
+        """Test that no candidates give no results."""
+        assert score_candidates_parallel([]) == []
@@ -1,17 +1,26 @@
 """Tests for CV parser functionality."""
 
 import os
+import re
 import pytest
 from persona2hire.cv.parser import (
     read_cv_file,
+    parse_cv_text,
+    iter_cv_files,
+    iter_cv_directory,
     validate_cv_data,
     get_cv_summary,
     _extract_value,
-    _is_valid_email,
-    _is_valid_date_format,
+    _find_labels,
+    _LABELS,
 )
 
 
+def _search_label(line, label):
+    """Reference label check: the label, optional whitespace and a colon."""
+    return bool(re.search(re.escape(label) + r"\s*:", line, re.IGNORECASE))
+
+
 class TestReadCvFile:
     """Tests for the read_cv_file function."""
 
@@ -102,6 +111,118 @@ Projects : Time: 2020-2021, Budget: $50k
         assert ":" in result["Projects"]
         assert "Time" in result["Projects"]
 
+    def test_first_listed_label_wins(self, temp_dir):
+        """Test lines with several labels and labels inside other words."""
+        content = """Curriculum Vitae
+First-Name : John
+Ethnicity : Unknown
+Other skills : chess, Sex : M
+Workplace 1 : Acme
+    Dates : 2019 - current Occupation : Engineer
+"""
+        filepath = os.path.join(temp_dir, "labels.txt")
+        with open(filepath, "w") as f:
+            f.write(content)
+
+        result = read_cv_file(filepath)
+        assert result["City"] == "Unknown"
+        assert result["Sex"] == "chess, Sex : M"
+        assert result["OtherSkills"] == ""
+        assert result["Dates1"] == "2019 - current Occupation : Engineer"
+        assert result["Occupation1"] == ""
+
+
+class TestProjectedParsing:
+    """Tests for parsing only some fields."""
+
+    FIELDS = ["FirstName", "Nationality", "MotherLanguage", "Dates2", "Score"]
+
+    def test_matches_full_parse(self, sample_cv_file):
+        """Test that requested fields have the same values as a full parse."""
+        full = read_cv_file(sample_cv_file)
+        result = read_cv_file(sample_cv_file, fields=self.FIELDS)
+        assert result == {field: full[field] for field in self.FIELDS}
+
+    def test_stops_once_fields_are_found(self):
+        """Test that lines after the last requested field are not parsed."""
+        content = "First-Name : Ann\nLast-Name : Lee\nFirst-Name : Bob\n"
+        assert parse_cv_text(content, fields=["FirstName"]) == {"FirstName": "Ann"}
+        assert parse_cv_text(content)["FirstName"] == "Bob"
+
+    def test_work_fields_keep_their_workplace(self):
+        """Test that work subfields are assigned to the right workplace."""
+        content = (
+            "Workplace 1 : Acme\n    Dates : 2019 - 2020\n"
+            "Workplace 2 : Initech\n    Dates : 2020 - current\n"
+        )
+        result = parse_cv_text(content, fields=["Dates2"])
+        assert result == {"Dates2": "2020 - current"}
+
+    def test_unknown_field_raises_error(self, sample_cv_file):
+        """Test that a field that is not a CV field is rejected."""
+        with pytest.raises(ValueError):
+            read_cv_file(sample_cv_file, fields=["ShoeSize"])
+
+    def test_bulk_readers(self, sample_cv_file, temp_dir):
+        """Test that the bulk readers parse only the requested fields."""
+        results = list(iter_cv_files([sample_cv_file], fields=self.FIELDS))
+        assert results == [
+            (sample_cv_file, read_cv_file(sample_cv_file, fields=self.FIELDS))
+        ]
+        directory = os.path.dirname(sample_cv_file)
+        results = list(iter_cv_directory(directory, fields=["LastName"]))
+        assert [cv for _, cv in results] == [{"LastName": "Mitchell"}]
+
+
+class TestIterCvFiles:
+    """Tests for the bulk CV readers."""
+
+    @pytest.fixture
+    def cv_dir(self, temp_dir):
+        """Directory with a few CV files and one non-CV file."""
+        for i in range(5):
+            path = os.path.join(temp_dir, f"cv_{i}.txt")
+            with open(path, "w") as f:
+                f.write(f"First-Name : Person{i}\nLast-Name : Test\n")
+        with open(os.path.join(temp_dir, "notes.md"), "w") as f:
+            f.write("First-Name : Nobody\n")
+        return temp_dir
+
+    def test_matches_read_cv_file_in_order(self, cv_dir):
+        """Test that results equal read_cv_file and keep input order."""
+        paths = [os.path.join(cv_dir, f"cv_{i}.txt") for i in (3, 0, 4, 1, 2)]
+        results = list(iter_cv_files(paths, workers=2))
+        assert [path for path, _ in results] == paths
+        assert [cv for _, cv in results] == [read_cv_file(p) for p in paths]
+
+    def test_errors_are_yielded(self, cv_dir):
+        """Test that unreadable files produce an error record, not a raise."""
+        missing = os.path.join(cv_dir, "missing.txt")
+        results = dict(iter_cv_files([missing, os.path.join(cv_dir, "cv_0.txt")]))
+        assert isinstance(results[missing], FileNotFoundError)
+        assert len(results) == 2
+
+    def test_directory_pattern(self, cv_dir):
+        """Test that only matching files are read, sorted by name."""
+        results = list(iter_cv_directory(cv_dir))
+        assert [cv["FirstName"] for _, cv in results] == [
+            f"Person{i}" for i in range(5)
+        ]
+        results = list(iter_cv_directory(cv_dir, pattern="*.md"))
+        assert [cv["FirstName"] for _, cv in results] == ["Nobody"]
+
+    def test_stops_early(self, cv_dir):
+        """Test that the generator can be abandoned after the first result."""
+        records = iter_cv_directory(cv_dir, workers=1)
+        path, cv = next(records)
+        records.close()
+        assert cv["FirstName"] == "Person0"
+
+    def test_parse_cv_text(self, sample_cv_file):
+        """Test that parsing text equals parsing the file."""
+        with open(sample_cv_file, encoding="utf-8") as f:
+            assert parse_cv_text(f.read()) == read_cv_file(sample_cv_file)
+
 
 class TestValidateCvData:
     """Tests for the validate_cv_data function."""
@@ -216,18 +337,26 @@ class TestHelperFunctions:
         result = _extract_value("URL : http://example.com")
         assert "http://example.com" == result
 
-    def test_is_valid_email_patterns(self):
-        """Test email validation patterns."""
-        assert _is_valid_email("user@domain.com") is True
-        assert _is_valid_email("invalid") is False
-        assert _is_valid_email("@domain.com") is False
-        assert _is_valid_email("user@") is False
-        assert _is_valid_email("") is False
-
-    def test_is_valid_date_format(self):
-        """Test date format validation."""
-        assert _is_valid_date_format("15.03.1990") is True
-        assert _is_valid_date_format("1.1.2000") is True
-        assert _is_valid_date_format("1990-03-15") is False
-        assert _is_valid_date_format("March 15, 1990") is False
-        assert _is_valid_date_format("") is False
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "First-Name : John",
+            "  main ACTIVITIES\t: coding",
+            "Ethnicity: none",
+            "Other skills : x, Sex: M",
+            "Mother Language : English Level1 : C1",
+            "No label here: value",
+            "Level1",
+            "Master 1 \u00a0: MSc",
+            "Ma\u017fter 1 : MSc",
+            "Zürich Country : CH",
+        ],
+    )
+    def test_find_labels_matches_per_label_search(self, line):
+        """Test that the single-pass scan finds the same labels as re.search."""
+        expected = [
+            i
+            for i, (label, _) in enumerate(_LABELS)
+            if _search_label(line, label)
+        ]
+        assert sorted(_find_labels(line)) == expected
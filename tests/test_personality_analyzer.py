@@ -6,6 +6,8 @@ from persona2hire.analysis.personality_analyzer import (
     get_personality_percentages,
     get_big_five_profile,
     get_career_suggestions,
+    personality_report,
+    PersonalityReport,
 )
 
 
@@ -248,3 +250,34 @@ class TestPersonalityConsistency:
         # Re-analyze first person - should get same result
         result1_again = analyze_personality(sample_cv_data)
         assert result1 == result1_again
+
+
+class TestPersonalityReport:
+    """Tests for the personality_report function."""
+
+    def test_returns_report(self, sample_cv_data):
+        """Test that a PersonalityReport is returned."""
+        assert isinstance(personality_report(sample_cv_data), PersonalityReport)
+
+    def test_matches_separate_functions(self, sample_cv_data, minimal_cv_data):
+        """Test that the report equals the results of the separate functions."""
+        for person in (sample_cv_data, minimal_cv_data):
+            report = personality_report(person)
+            assert report.mbti_type == analyze_personality(person)
+            assert report.percentages == get_personality_percentages(person)
+            assert report.big_five == get_big_five_profile(person)
+            assert report.careers == get_career_suggestions(report.mbti_type)
+
+    def test_skills_count_for_type_only(self):
+        """Test that skills affect the type but not the percentages."""
+        person = {"ShortDescription": "", "Hobbies": "", "OtherSkills": "creative"}
+        report = personality_report(person)
+        assert report.mbti_type[1] == "N"
+        assert report.percentages["N"] == 0.0
+
+    def test_empty_data(self, empty_cv_data):
+        """Test that empty data gives a complete report."""
+        report = personality_report(empty_cv_data)
+        assert len(report.mbti_type) == 4
+        assert len(report.percentages) == 8
+        assert len(report.big_five) == 5
@@ -0,0 +1,85 @@
+"""Tests for vectorized personality analysis."""
+
+import pytest
+from persona2hire.analysis.normalized_cv import normalize_cv
+from persona2hire.analysis.personality_analyzer import (
+    analyze_personality,
+    get_big_five_profile,
+)
+from persona2hire.analysis.trait_lexicon import hobby_matcher, trait_lexicon
+from persona2hire.ml.data_generator import generate_synthetic_cv
+
+np = pytest.importorskip("numpy")
+
+from persona2hire.analysis import personality_batch  # noqa: E402
+from persona2hire.analysis.personality_batch import (  # noqa: E402
+    BIG_FIVE_TRAITS,
+    MBTI_LETTERS,
+    PersonalityBatch,
+    analyze_personality_batch,
+)
+
+
+class TestAnalyzePersonalityBatch:
+    """Tests for analyze_personality_batch."""
+
+    @pytest.fixture
+    def persons(self, sample_cv_data, minimal_cv_data, empty_cv_data):
+        """Fixture CVs and synthetic CVs with repeated words and hobbies."""
+        synthetic = [generate_synthetic_cv(seed=i) for i in range(40)]
+        return [sample_cv_data, minimal_cv_data, empty_cv_data] + synthetic
+
+    def test_returns_batch(self, persons):
+        """Test the result type and array shapes."""
+        batch = analyze_personality_batch(persons)
+        assert isinstance(batch, PersonalityBatch)
+        assert len(batch) == len(persons)
+        assert batch.scores.shape == (len(persons), len(MBTI_LETTERS))
+        assert batch.big_five.shape == (len(persons), len(BIG_FIVE_TRAITS))
+
+    def test_types_match_analyze_personality(self, persons):
+        """Test that every type equals the one-CV analysis."""
+        batch = analyze_personality_batch(persons)
+        assert batch.types == [analyze_personality(person) for person in persons]
+
+    def test_big_five_matches_profile(self, persons):
+        """Test that every Big Five row equals get_big_five_profile."""
+        batch = analyze_personality_batch(persons)
+        for i, person in enumerate(persons):
+            assert batch.big_five_profile(i) == get_big_five_profile(person)
+
+    def test_normalized_cvs(self, persons):
+        """Test that NormalizedCV objects give the same results as dicts."""
+        batch = analyze_personality_batch(persons)
+        normalized = analyze_personality_batch([normalize_cv(p) for p in persons])
+        assert normalized.types == batch.types
+        assert np.array_equal(normalized.big_five, batch.big_five)
+
+    def test_repeated_words_count(self):
+        """Test that a word repeated in the description is counted each time."""
+        person = {"ShortDescription": "organized organized organized"}
+        batch = analyze_personality_batch([person])
+        assert batch.scores[0, MBTI_LETTERS.index("J")] >= 3
+
+    def test_term_table_kept_across_batches(self, persons):
+        """Test that a later batch reuses the rows of terms already seen."""
+        analyze_personality_batch(persons)
+        table = personality_batch._term_table(trait_lexicon(), hobby_matcher())
+        size = len(table)
+        batch = analyze_personality_batch(persons[::-1])
+        assert len(table) == size
+        assert batch.types == [analyze_personality(p) for p in persons[::-1]]
+
+    def test_full_term_table_restarts(self, persons, monkeypatch):
+        """Test that a full term table is cleared without changing results."""
+        monkeypatch.setattr(personality_batch, "TERM_TABLE_SIZE", 0)
+        analyze_personality_batch(persons[:1])
+        batch = analyze_personality_batch(persons)
+        assert batch.types == [analyze_personality(person) for person in persons]
+
+    def test_empty_batch(self):
+        """Test that no persons give empty results."""
+        batch = analyze_personality_batch([])
+        assert batch.types == []
+        assert batch.scores.shape == (0, len(MBTI_LETTERS))
+        assert batch.big_five.shape == (0, len(BIG_FIVE_TRAITS))
@@ -0,0 +1,166 @@
+"""Tests for the personality type cache."""
+
+import json
+import os
+
+import pytest
+from persona2hire.analysis import personality_cache
+from persona2hire.analysis.personality_analyzer import analyze_personality
+from persona2hire.analysis.personality_cache import PersonalityCache
+from persona2hire.data.personality import Hobbies
+from persona2hire.ml.data_generator import generate_synthetic_cv
+
+
+@pytest.fixture
+def persons(sample_cv_data, minimal_cv_data, empty_cv_data):
+    """Copies of the shared CV fixtures, each with different personality text."""
+    return [
+        dict(sample_cv_data),
+        dict(minimal_cv_data, ShortDescription="Calm, curious and organized"),
+        dict(empty_cv_data),
+    ]
+
+
+class TestPersonalityCache:
+    """Tests for PersonalityCache."""
+
+    def test_types_match_analyze_personality(self, persons):
+        """Test that cached types equal the direct analysis."""
+        cache = PersonalityCache()
+        expected = [analyze_personality(person) for person in persons]
+        assert cache.personality_types(persons) == expected
+        assert [cache.personality_type(person) for person in persons] == expected
+
+    def test_many_misses_match(self):
+        """Test that misses analyzed as a batch give the same types."""
+        persons = [generate_synthetic_cv(seed=i) for i in range(40)]
+        cache = PersonalityCache()
+        expected = [analyze_personality(person) for person in persons]
+        assert cache.personality_types(persons) == expected
+
+    def test_hits_and_misses(self, persons):
+        """Test that a second pass over unchanged CVs is all hits."""
+        cache = PersonalityCache()
+        cache.personality_types(persons)
+        assert cache.misses == len(persons)
+        assert cache.hits == 0
+
+        cache.personality_types(persons)
+        assert cache.misses == len(persons)
+        assert cache.hits == len(persons)
+        assert cache.stats()["size"] == len(persons)
+
+    def test_keyed_by_personality_fields_only(self, sample_cv_data):
+        """Test that other fields share the entry and edits get a new one."""
+        cache = PersonalityCache()
+        cache.personality_type(sample_cv_data)
+
+        renamed = dict(sample_cv_data, FirstName="Other", Nationality="X")
+        cache.personality_type(renamed)
+        assert cache.hits == 1
+
+        edited = dict(sample_cv_data, Hobbies="chess, football")
+        assert cache.personality_type(edited) == analyze_personality(edited)
+        assert cache.misses == 2
+
+    def test_duplicates_analyzed_once(self, sample_cv_data):
+        """Test that identical contents in one batch are analyzed once."""
+        cache = PersonalityCache()
+        types = cache.personality_types([dict(sample_cv_data) for _ in range(3)])
+        assert len(set(types)) == 1
+        assert cache.misses == 1
+
+    def test_lru_bound(self, persons):
+        """Test that the least recently used entries are dropped."""
+        cache = PersonalityCache(maxsize=2)
+        cache.personality_type(persons[0])
+        cache.personality_type(persons[1])
+        cache.personality_type(persons[0])  # persons[1] is now the oldest
+        cache.personality_type(persons[2])
+        assert len(cache) == 2
+
+        cache.personality_type(persons[0])
+        assert cache.hits == 2
+        cache.personality_type(persons[1])
+        assert cache.misses == 4
+
+    def test_put(self, persons):
+        """Test that a stored type is a hit."""
+        cache = PersonalityCache()
+        cache.put(persons[0], "INTJ")
+        assert cache.personality_type(persons[0]) == "INTJ"
+        assert cache.hits == 1
+        assert cache.misses == 0
+
+    def test_lexicon_change_misses_in_memory(self, persons, monkeypatch):
+        """Test that editing the word lists makes cached types misses."""
+        cache = PersonalityCache()
+        cache.personality_types(persons)
+        version = cache.version
+
+        words = list(Hobbies["words"]) + ["origami"]
+        monkeypatch.setitem(Hobbies, "words", words)
+        cache.personality_types(persons)
+        assert cache.version != version
+        assert cache.misses == 2 * len(persons)
+
+        # An in-place edit keeping the length needs invalidate_lexicon
+        version = cache.version
+        words[-1] = "kites"
+        cache.personality_types(persons)
+        assert cache.version == version
+        cache.invalidate_lexicon()
+        cache.personality_types(persons)
+        assert cache.version != version
+        assert cache.misses == 3 * len(persons)
+
+    def test_clear(self, persons):
+        """Test that clear drops entries and counters."""
+        cache = PersonalityCache()
+        cache.personality_types(persons)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.hits == cache.misses == 0
+
+
+class TestPersonalityCachePersistence:
+    """Tests for saving and loading a PersonalityCache."""
+
+    def test_save_and_load(self, persons, temp_dir):
+        """Test that saved types are hits in a new cache."""
+        path = os.path.join(temp_dir, "cache", "personality.json")
+        cache = PersonalityCache(path)
+        expected = cache.personality_types(persons)
+        cache.save()
+
+        loaded = PersonalityCache(path)
+        assert len(loaded) == len(persons)
+        assert loaded.personality_types(persons) == expected
+        assert loaded.misses == 0
+
+    def test_memory_only_save_does_nothing(self, persons):
+        """Test that a cache without a path can be saved without effect."""
+        cache = PersonalityCache()
+        cache.personality_types(persons)
+        cache.save()
+
+    def test_other_lexicon_version_ignored(self, persons, temp_dir, monkeypatch):
+        """Test that a file saved for other word lists is not reused."""
+        path = os.path.join(temp_dir, "personality.json")
+        cache = PersonalityCache(path)
+        cache.personality_types(persons)
+        cache.save()
+
+        monkeypatch.setattr(personality_cache, "lexicon_version", lambda: "00" * 16)
+        assert len(PersonalityCache(path)) == 0
+
+    def test_unreadable_file_ignored(self, temp_dir):
+        """Test that a corrupt or foreign file gives an empty cache."""
+        path = os.path.join(temp_dir, "personality.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        assert len(PersonalityCache(path)) == 0
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"format": "something else"}, f)
+        assert len(PersonalityCache(path)) == 0
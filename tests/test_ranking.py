@@ -0,0 +1,119 @@
+"""Tests for top-K ranking."""
+
+import pytest
+from persona2hire.analysis import job_analyzer, ranking
+from persona2hire.analysis.job_analyzer import analyze_job, analyze_jobs
+from persona2hire.analysis.normalized_cv import normalize_cv
+from persona2hire.analysis.ranking import rank_candidates, top_sectors
+from persona2hire.data.job_sectors import JobSectors
+
+
+@pytest.fixture
+def pool(sample_cv_data, minimal_cv_data, empty_cv_data):
+    """Candidates with varied and tied scores."""
+    persons = []
+    for i, base in enumerate([sample_cv_data, minimal_cv_data, empty_cv_data] * 4):
+        person = dict(base, FirstName=f"P{i}")
+        if i % 4 == 1:
+            person["ComputerSkills"] = "Python, SQL, Java"
+        persons.append(person)
+    return persons
+
+
+def _full_ranking(persons, sector, k):
+    scored = [(person, analyze_job(person, sector)) for person in persons]
+    return sorted(scored, key=lambda x: x[1], reverse=True)[:k]
+
+
+class TestRankCandidates:
+    """Tests for rank_candidates."""
+
+    @pytest.mark.parametrize("k", [1, 3, 5, 100])
+    def test_matches_full_sort(self, pool, k):
+        """Test that the top K equals a stable sort, including ties."""
+        for sector in ["Computers_ICT", "Healthcare"]:
+            expected = _full_ranking(pool, sector, k)
+            ranked = rank_candidates(pool, sector, k)
+            assert [p["FirstName"] for p, _ in ranked] == [
+                p["FirstName"] for p, _ in expected
+            ]
+            assert [s for _, s in ranked] == [s for _, s in expected]
+
+    def test_personality_only_called_for_contenders(self, pool):
+        """Test that personality analysis is skipped for hopeless candidates."""
+        calls = []
+
+        def personality(person):
+            calls.append(person["FirstName"])
+            return "INTJ"
+
+        ranked = rank_candidates(pool, "Computers_ICT", k=2, personality=personality)
+        assert len(ranked) == 2
+        assert len(calls) < len(pool)
+        for person, score in ranked:
+            expected = analyze_job(person, "Computers_ICT", personality_type="INTJ")
+            assert score == expected
+
+    def test_ml_adjustment_bound(self, pool, monkeypatch):
+        """Test that ML-adjusted rankings stay exact."""
+        factors = {}
+
+        def fake_adjustment(person, sector, base_score):
+            factor = 1.3 if person.get("FirstName", "").endswith(("3", "7")) else 0.7
+            factors[person.get("FirstName")] = factor
+            return min(100.0, base_score * factor)
+
+        monkeypatch.setattr(job_analyzer, "is_ml_available", lambda: True)
+        monkeypatch.setattr(job_analyzer, "_apply_ml_adjustment", fake_adjustment)
+
+        expected = sorted(
+            ((p, analyze_job(p, "Computers_ICT", use_ml=True)) for p in pool),
+            key=lambda x: x[1],
+            reverse=True,
+        )[:3]
+        ranked = rank_candidates(pool, "Computers_ICT", k=3, use_ml=True)
+        assert [s for _, s in ranked] == [s for _, s in expected]
+
+    def test_keyword_matching_only_for_contenders(self, pool, monkeypatch):
+        """Test that sector keyword matching is skipped for hopeless candidates."""
+        calls = []
+
+        def counting_rule_score(profile, sector):
+            calls.append(profile)
+            return job_analyzer._rule_score(profile, sector)
+
+        monkeypatch.setattr(ranking, "_rule_score", counting_rule_score)
+        persons = pool + [dict(pool[1], FirstName=f"E{i}") for i in range(20)]
+        persons += [dict(pool[2], FirstName=f"X{i}") for i in range(20)]
+        ranked = rank_candidates(persons, "Computers_ICT", k=2)
+        assert [s for _, s in ranked] == [
+            s for _, s in _full_ranking(persons, "Computers_ICT", 2)
+        ]
+        assert len(calls) < len(persons)
+
+    def test_rule_bound(self, pool):
+        """Test that the keyword-free bound covers every sector's rule score."""
+        for person in pool:
+            profile = job_analyzer._build_profile(normalize_cv(person))
+            bound = ranking._rule_bound(profile)
+            for sector in JobSectors:
+                assert job_analyzer._rule_score(profile, sector) <= bound
+
+    def test_edge_cases(self, pool):
+        """Test empty input, k=0 and unknown sectors."""
+        assert rank_candidates([], "Computers_ICT") == []
+        assert rank_candidates(pool, "Computers_ICT", k=0) == []
+        assert [s for _, s in rank_candidates(pool, "Nope", k=2)] == [0.0, 0.0]
+
+
+class TestTopSectors:
+    """Tests for top_sectors."""
+
+    @pytest.mark.parametrize("k", [1, 5, len(JobSectors)])
+    def test_matches_analyze_jobs(self, sample_cv_data, k):
+        """Test that the top K sectors equal the head of analyze_jobs."""
+        assert top_sectors(sample_cv_data, k) == analyze_jobs(sample_cv_data)[:k]
+
+    def test_empty_cv(self, empty_cv_data):
+        """Test that ties on an empty CV keep sector order."""
+        assert top_sectors(empty_cv_data, 3) == analyze_jobs(empty_cv_data)[:3]
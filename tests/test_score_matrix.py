@@ -0,0 +1,66 @@
+"""Tests for the vectorized score matrix."""
+
+import pytest
+from persona2hire.analysis.job_analyzer import analyze_job, get_score_breakdown
+from persona2hire.data.job_sectors import JobSectors
+
+np = pytest.importorskip("numpy")
+
+from persona2hire.analysis.score_matrix import (  # noqa: E402
+    SCORE_CATEGORIES,
+    score_breakdown_tensor,
+    score_matrix,
+)
+
+
+class TestScoreMatrix:
+    """Tests for score_matrix and score_breakdown_tensor."""
+
+    @pytest.fixture
+    def persons(self, sample_cv_data, minimal_cv_data, empty_cv_data):
+        """A small mixed set of candidates."""
+        return [sample_cv_data, minimal_cv_data, empty_cv_data]
+
+    def test_shape(self, persons):
+        """Test that the matrix has one row per person and one column per sector."""
+        matrix = score_matrix(persons)
+        assert matrix.shape == (len(persons), len(JobSectors))
+
+    def test_matches_analyze_job(self, persons):
+        """Test that every cell equals the rule-based analyze_job score."""
+        sectors = list(JobSectors)
+        matrix = score_matrix(persons, sectors)
+
+        for i, person in enumerate(persons):
+            for j, sector in enumerate(sectors):
+                expected = analyze_job(person, sector, use_ml=False)
+                assert matrix[i, j] == pytest.approx(expected, abs=0.1)
+
+    def test_breakdown_matches_get_score_breakdown(self, sample_cv_data):
+        """Test that the tensor holds the same per-category scores."""
+        sectors = ["Computers_ICT", "Healthcare"]
+        tensor = score_breakdown_tensor([sample_cv_data], sectors)
+
+        for j, sector in enumerate(sectors):
+            breakdown = get_score_breakdown(sample_cv_data, sector)
+            for k, category in enumerate(SCORE_CATEGORIES):
+                assert tensor[0, j, k] == pytest.approx(breakdown[category])
+
+    def test_personality_types_override(self, sample_cv_data):
+        """Test that explicit personality types are used for the bonus."""
+        sector = "Computers_ICT"
+        preferred = JobSectors[sector]["Personality"][0]
+        matrix = score_matrix([sample_cv_data], [sector], personality_types=[preferred])
+
+        assert matrix[0, 0] == analyze_job(
+            sample_cv_data, sector, personality_type=preferred, use_ml=False
+        )
+
+    def test_unknown_sector_scores_zero(self, sample_cv_data):
+        """Test that unknown sectors give a zero column."""
+        matrix = score_matrix([sample_cv_data], ["NonexistentSector"])
+        assert matrix[0, 0] == 0.0
+
+    def test_empty_input(self):
+        """Test that no persons gives an empty matrix."""
+        assert score_matrix([]).shape == (0, len(JobSectors))
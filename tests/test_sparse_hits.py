@@ -0,0 +1,30 @@
+"""Tests for the sparse hit matrix."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from persona2hire.analysis.sparse_hits import SparseHits  # noqa: E402
+
+
+class TestSparseHits:
+    """Tests for SparseHits."""
+
+    def test_dot_matches_dense_product(self):
+        """Test that dot equals the dense hit matrix times the incidence."""
+        hits = SparseHits()
+        hits.add(0, [0, 2, 2], 1.0)
+        hits.add(2, [1], 0.5)
+        hits.add(0, [1], 2.0)
+        incidence = np.array([[1.0, 0.0], [0.0, 3.0], [1.0, 1.0]])
+
+        dense = np.zeros((3, 3))
+        dense[0] = [1.0, 2.0, 2.0]
+        dense[2] = [0.0, 0.5, 0.0]
+        assert np.array_equal(hits.dot(incidence, 3), dense @ incidence)
+
+    def test_empty(self):
+        """Test that no hits give a zero matrix of the requested shape."""
+        result = SparseHits().dot(np.ones((4, 2)), 3)
+        assert result.shape == (3, 2)
+        assert not result.any()
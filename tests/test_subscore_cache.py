@@ -0,0 +1,148 @@
+"""Tests for the subscore cache."""
+
+import pytest
+from persona2hire.analysis import job_analyzer, subscore_cache
+from persona2hire.analysis.job_analyzer import analyze_job, get_score_breakdown
+from persona2hire.analysis.subscore_cache import SubscoreCache
+from persona2hire.data.job_sectors import JobSectors
+
+CATEGORIES = [
+    "education",
+    "work_experience",
+    "skills",
+    "languages",
+    "soft_skills",
+    "additional",
+]
+
+
+@pytest.fixture
+def persons(sample_cv_data, minimal_cv_data, empty_cv_data):
+    """Copies of the shared CV fixtures (safe to edit)."""
+    return [dict(sample_cv_data), dict(minimal_cv_data), dict(empty_cv_data)]
+
+
+class TestSubscoreCache:
+    """Tests for SubscoreCache."""
+
+    def test_scores_match_analyze_job(self, persons):
+        """Test that cached and uncached scores are identical."""
+        cache = SubscoreCache()
+        for sector in ["Computers_ICT", "Healthcare"]:
+            expected = [analyze_job(person, sector) for person in persons]
+            assert cache.scores(persons, sector) == expected
+            assert cache.scores(persons, sector) == expected
+
+    def test_subscores_match_breakdown(self, persons):
+        """Test that subscores equal the score breakdown categories."""
+        cache = SubscoreCache()
+        for person, subscores in zip(persons, cache.subscores(persons, "Healthcare")):
+            breakdown = get_score_breakdown(person, "Healthcare")
+            assert subscores == {c: breakdown[c] for c in CATEGORIES}
+
+    def test_second_pass_is_all_hits(self, persons):
+        """Test that rescoring unchanged CVs computes nothing."""
+        cache = SubscoreCache()
+        cache.scores(persons, "Computers_ICT")
+        misses = cache.misses
+        cache.scores(persons, "Computers_ICT")
+        assert cache.misses == misses
+
+    def test_sector_independent_cells_are_shared(self, persons):
+        """Test that a new sector only computes the keyword categories."""
+        cache = SubscoreCache()
+        cache.scores(persons[:1], "Computers_ICT")
+        misses = cache.misses
+        cache.scores(persons[:1], "Healthcare")
+        assert cache.misses - misses == 3
+
+    def test_editing_a_cv_recomputes_only_its_changed_cells(self, persons):
+        """Test that an edit invalidates only the categories it touches."""
+        cache = SubscoreCache()
+        cache.scores(persons, "Computers_ICT")
+        misses = cache.misses
+        persons[0]["ModernLanguage1"] = "Japanese"
+        scores = cache.scores(persons, "Computers_ICT")
+        assert cache.misses - misses == 1
+        assert scores[0] == analyze_job(persons[0], "Computers_ICT")
+
+    def test_weight_changes_reuse_raw_values(self, persons, monkeypatch):
+        """Test that new WEIGHTS are applied without recomputing cells."""
+        cache = SubscoreCache()
+        cache.scores(persons, "Computers_ICT")
+        misses = cache.misses
+        monkeypatch.setitem(job_analyzer.WEIGHTS, "skills", 40)
+        scores = cache.scores(persons, "Computers_ICT")
+        assert cache.misses == misses
+        assert scores == [analyze_job(p, "Computers_ICT") for p in persons]
+
+    def test_custom_weights(self, persons):
+        """Test that explicit weights rescale the subscores."""
+        cache = SubscoreCache()
+        weights = dict(job_analyzer.WEIGHTS, soft_skills=0)
+        subscores = cache.subscores(persons, "Computers_ICT", weights)
+        assert all(s["soft_skills"] == 0 for s in subscores)
+
+    def test_keyword_change_invalidates_one_sector(self, persons, monkeypatch):
+        """Test that editing a keyword list recomputes only that sector."""
+        cache = SubscoreCache()
+        cache.scores(persons, "Computers_ICT")
+        cache.scores(persons, "Healthcare")
+        misses = cache.misses
+        skills = JobSectors["Computers_ICT"]["Skills"] + ["communication"]
+        monkeypatch.setitem(JobSectors["Computers_ICT"], "Skills", skills)
+        scores = cache.scores(persons, "Computers_ICT")
+        cache.scores(persons, "Healthcare")
+        # The minimal and empty CVs have the same (empty) skills fields
+        assert cache.misses - misses == 2
+        assert scores == [analyze_job(p, "Computers_ICT") for p in persons]
+
+    def test_data_hashed_once_per_sector(self, persons, monkeypatch):
+        """Test that unchanged scoring data is not hashed again."""
+        skills = list(JobSectors["Computers_ICT"]["Skills"])
+        monkeypatch.setitem(JobSectors["Computers_ICT"], "Skills", skills)
+        calls = []
+        data_versions = subscore_cache._data_versions
+        monkeypatch.setattr(
+            subscore_cache,
+            "_data_versions",
+            lambda sector: calls.append(sector) or data_versions(sector),
+        )
+        cache = SubscoreCache()
+        for _ in range(3):
+            cache.scores(persons, "Computers_ICT")
+        assert calls == ["Computers_ICT"]
+
+        # Editing a list in place without changing its length is only
+        # noticed after invalidate_data
+        skills[0] = "communication"
+        cache.scores(persons, "Computers_ICT")
+        assert len(calls) == 1
+        cache.invalidate_data()
+        scores = cache.scores(persons, "Computers_ICT")
+        assert len(calls) == 2
+        assert scores == [analyze_job(p, "Computers_ICT") for p in persons]
+
+        # A longer list is noticed
+        skills.append("python")
+        cache.scores(persons, "Computers_ICT")
+        assert len(calls) == 3
+
+    def test_lru_bound(self, persons):
+        """Test that the least recently used cells are dropped."""
+        cache = SubscoreCache(maxsize=6)
+        cache.scores(persons[:1], "Computers_ICT")
+        cache.scores(persons[1:2], "Computers_ICT")
+        assert len(cache) == 6
+
+        # The first CV's cells were dropped and are computed again
+        misses = cache.misses
+        scores = cache.scores(persons[:1], "Computers_ICT")
+        assert cache.misses - misses == 6
+        assert scores == [analyze_job(persons[0], "Computers_ICT")]
+
+    def test_unknown_sector(self, persons):
+        """Test that unknown sectors score 0."""
+        cache = SubscoreCache()
+        assert cache.scores(persons, "NotASector") == [0.0] * len(persons)
+        assert len(cache) == 0
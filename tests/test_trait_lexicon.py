@@ -0,0 +1,145 @@
+"""Tests for the compiled trait lexicon and hobby matcher."""
+
+import pytest
+
+from persona2hire.analysis.personality_analyzer import _score_from_words
+from persona2hire.analysis.trait_lexicon import (
+    SPORTS_POINTS,
+    SPORTS_TRAITS,
+    HobbyMatcher,
+    TraitLexicon,
+    compile_lexicon,
+    hobby_matcher,
+    trait_lexicon,
+)
+from persona2hire.data.personality import Domains, Hobbies
+
+
+def _naive_traits(token):
+    """Traits scored by a token, as the nested loops found them."""
+    return tuple(
+        (domain_key, trait_key)
+        for domain_key, domain_data in Domains.items()
+        for trait_key, trait_data in domain_data.items()
+        if trait_key != "SCORE" and isinstance(trait_data, dict)
+        if any(word.lower() in token for word in trait_data["words"])
+    )
+
+
+class TestTraitLexicon:
+    """Tests for the TraitLexicon class."""
+
+    def test_exact_word(self):
+        """Test that a lexicon word scores its own trait."""
+        word = Domains["I"]["calm"]["words"][0].lower()
+        assert ("I", "calm") in trait_lexicon().lookup(word)
+
+    def test_word_inside_token(self):
+        """Test that a lexicon word contained in a longer token is found."""
+        word = Domains["N"]["creative"]["words"][0].lower()
+        assert ("N", "creative") in trait_lexicon().lookup(f"un{word}ness")
+
+    def test_empty_token(self):
+        """Test that blank tokens score nothing."""
+        assert trait_lexicon().lookup("") == ()
+
+    def test_unknown_token(self):
+        """Test that a token without lexicon words scores nothing."""
+        assert trait_lexicon().lookup("zzzz") == ()
+
+    def test_agrees_with_naive_scan(self):
+        """Test that every lexicon word and some variants match like the loops."""
+        lexicon = trait_lexicon()
+        words = {
+            word.lower()
+            for domain_data in Domains.values()
+            for trait_data in domain_data.values()
+            if isinstance(trait_data, dict)
+            for word in trait_data["words"]
+        }
+        for word in words:
+            for token in (word, word[:-1], f"x{word}s", f"{word} and more"):
+                assert lexicon.lookup(token) == _naive_traits(token)
+
+    def test_each_trait_once_per_token(self):
+        """Test that a trait is reported once even if several words match."""
+        lexicon = TraitLexicon((("X", "a", ("ab", "AB", "b")), ("Y", "b", ("c",))))
+        assert lexicon.lookup("abc") == (("X", "a"), ("Y", "b"))
+        assert lexicon.lookup("b") == (("X", "a"),)
+
+    def test_empty_lexicon_word_matches_everything(self):
+        """Test that an empty word, like '' in token, matches any token."""
+        lexicon = TraitLexicon((("X", "a", ("",)),))
+        assert lexicon.lookup("anything") == (("X", "a"),)
+        assert lexicon.lookup("") == ()
+
+    def test_cached(self):
+        """Test that the same word lists give the same compiled lexicon."""
+        assert trait_lexicon() is trait_lexicon(dict(Domains))
+        traits = (("X", "a", ("b",)),)
+        assert compile_lexicon(traits) is compile_lexicon(traits)
+
+
+class TestScoreFromWords:
+    """Tests for scoring tokens through the lexicon."""
+
+    def test_weights_each_matched_trait(self):
+        """Test that every trait a token matches gets the weight."""
+        word = Domains["T"]["logical"]["words"][0]
+        lexicon = trait_lexicon()
+        scores = dict.fromkeys(lexicon.traits, 0)
+        _score_from_words(scores, [f"  {word.upper()} "], lexicon, weight=0.5)
+        assert scores[("T", "logical")] == 0.5
+
+    def test_repeated_tokens_add_up(self):
+        """Test that repeated tokens are scored every time."""
+        word = Domains["J"]["organized"]["words"][0]
+        lexicon = trait_lexicon()
+        scores = dict.fromkeys(lexicon.traits, 0)
+        _score_from_words(scores, [word, word, ""], lexicon)
+        assert scores[("J", "organized")] == 2
+
+
+class TestHobbyMatcher:
+    """Tests for the HobbyMatcher class."""
+
+    @pytest.fixture
+    def matcher(self):
+        """A small matcher with overlapping words and one sport."""
+        return HobbyMatcher(
+            ("Painting", "paint", "chess", "odd"),
+            (("N", "creative"), ("S", "practical"), ("T", "logical"), None),
+            ("tennis",),
+        )
+
+    def test_hobby_containing_word(self, matcher):
+        """Test that a hobby containing a word scores that word's trait."""
+        assert matcher.lookup("online chess") == ((("T", "logical"), 1),)
+
+    def test_hobby_inside_word(self, matcher):
+        """Test that a hobby contained in a word scores that word's trait."""
+        assert matcher.lookup("ess") == ((("T", "logical"), 1),)
+
+    def test_first_word_wins(self, matcher):
+        """Test that only the first matching word in list order scores."""
+        assert matcher.lookup("paint") == ((("N", "creative"), 1),)
+        assert matcher.lookup("oil painting") == ((("N", "creative"), 1),)
+
+    def test_word_without_trait(self, matcher):
+        """Test that a matching word without a trait scores nothing."""
+        assert matcher.lookup("odd jobs") == ()
+
+    def test_sports_bonus(self, matcher):
+        """Test that sports add points to the sports traits."""
+        hits = matcher.lookup("table tennis")
+        assert hits == tuple((trait, SPORTS_POINTS) for trait in SPORTS_TRAITS)
+
+    def test_hits_of_a_list(self, matcher):
+        """Test that hits are found hobby by hobby, blanks scoring nothing."""
+        hits = matcher.hits([" Chess ", "", "chess"])
+        assert hits == [(("T", "logical"), 1), (("T", "logical"), 1)]
+
+    def test_cached(self):
+        """Test that the same hobby lists give the same compiled matcher."""
+        assert hobby_matcher() is hobby_matcher(dict(Hobbies))
+        assert len(hobby_matcher()) == len(Hobbies["words"])
@@ -0,0 +1,92 @@
+"""Tests for bulk CV validation."""
+
+from persona2hire.cv.parser import validate_cv_data
+from persona2hire.cv.validation import (
+    DATE_RE,
+    EMAIL_RE,
+    INVALID_DATE,
+    INVALID_EMAIL,
+    MISSING,
+    OK,
+    VALIDATED_FIELDS,
+    format_errors,
+    validate_many,
+)
+
+
+def _cvs(sample_cv_data):
+    """A valid CV followed by CVs with one or more errors."""
+    return [
+        sample_cv_data,
+        dict(sample_cv_data, FirstName="  ", EmailAddress="not-an-email"),
+        dict(sample_cv_data, YearsStudied="four", DateOfBirth="1990-03-15"),
+        {"FirstName": "Ann"},
+    ]
+
+
+class TestValidateMany:
+    """Tests for validate_many and ValidationReport."""
+
+    def test_matches_validate_cv_data(self, sample_cv_data):
+        """Test that validity and messages equal validate_cv_data."""
+        cvs = _cvs(sample_cv_data)
+        report = validate_many(cvs)
+
+        assert len(report) == len(cvs)
+        for index, cv_data in enumerate(cvs):
+            is_valid, errors = validate_cv_data(cv_data)
+            assert report.is_valid(index) == is_valid
+            assert report.messages(index, cv_data) == errors
+            assert format_errors(report.errors(index), cv_data) == errors
+
+    def test_error_codes_per_field(self, sample_cv_data):
+        """Test that the report holds one code column per validated field."""
+        report = validate_many(_cvs(sample_cv_data))
+
+        assert tuple(report.codes) == VALIDATED_FIELDS
+        assert list(report.codes["FirstName"]) == [OK, MISSING, OK, OK]
+        assert list(report.codes["EmailAddress"]) == [OK, INVALID_EMAIL, OK, OK]
+        assert list(report.codes["DateOfBirth"]) == [OK, OK, INVALID_DATE, OK]
+        assert report.errors(3) == {"LastName": "missing"}
+
+    def test_totals(self, sample_cv_data):
+        """Test the error counts per type and per field."""
+        report = validate_many(_cvs(sample_cv_data))
+
+        assert report.totals() == {
+            "missing": 2,
+            "invalid_email": 1,
+            "not_a_number": 1,
+            "invalid_date": 1,
+        }
+        assert report.field_totals()["FirstName"] == {"missing": 1}
+        assert report.field_totals()["YearsStudied"] == {"not_a_number": 1}
+        assert report.invalid_indices() == [1, 2, 3]
+        assert report.valid_count() == 1
+
+    def test_empty_input(self):
+        """Test validating no CVs."""
+        report = validate_many([])
+        assert len(report) == 0
+        assert report.invalid_indices() == []
+        assert set(report.totals().values()) == {0}
+
+
+class TestPatterns:
+    """Tests for the email and date patterns."""
+
+    def test_email_patterns(self):
+        """Test email validation patterns."""
+        assert EMAIL_RE.match("user@domain.com")
+        assert not EMAIL_RE.match("invalid")
+        assert not EMAIL_RE.match("@domain.com")
+        assert not EMAIL_RE.match("user@")
+        assert not EMAIL_RE.match("")
+
+    def test_date_patterns(self):
+        """Test date format validation."""
+        assert DATE_RE.match("15.03.1990")
+        assert DATE_RE.match("1.1.2000")
+        assert not DATE_RE.match("1990-03-15")
+        assert not DATE_RE.match("March 15, 1990")
+        assert not DATE_RE.match("")
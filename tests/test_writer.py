@@ -2,10 +2,14 @@
 
 import os
 import pytest
+from persona2hire.cv import writer
+from persona2hire.cv.bundle import CVBundle
 from persona2hire.cv.writer import (
     write_cv_file,
+    write_cv_files,
     create_empty_cv,
     cv_to_string,
+    render_cv_text,
     _sanitize_filename,
     _generate_unique_filepath,
 )
@@ -105,6 +109,105 @@ class TestCreateEmptyCv:
                 assert value == "", f"Field {key} should be empty"
 
 
+class TestWriteCvFiles:
+    """Tests for the write_cv_files function."""
+
+    def test_matches_write_cv_file(self, sample_cv_data, minimal_cv_data, temp_dir):
+        """Test that names and contents equal repeated write_cv_file calls."""
+        persons = [sample_cv_data, minimal_cv_data, sample_cv_data, sample_cv_data]
+        single_dir = os.path.join(temp_dir, "single")
+        batch_dir = os.path.join(temp_dir, "batch")
+        for directory in (single_dir, batch_dir):
+            os.makedirs(directory)
+            # An existing file takes the first numbered name
+            with open(os.path.join(directory, "John_Doe_1.txt"), "w") as f:
+                f.write("existing")
+
+        expected = [write_cv_file(person, single_dir) for person in persons]
+        paths = write_cv_files(persons, batch_dir)
+
+        assert [os.path.basename(p) for p in paths] == [
+            os.path.basename(p) for p in expected
+        ]
+        for path, expected_path in zip(paths, expected):
+            with open(path) as f, open(expected_path) as g:
+                assert f.read() == g.read()
+
+    def test_overwrite_mode(self, sample_cv_data, temp_dir):
+        """Test that overwrite reuses the base name."""
+        paths = write_cv_files([sample_cv_data, sample_cv_data], temp_dir, True)
+        assert paths[0] == paths[1]
+        assert os.listdir(temp_dir) == [os.path.basename(paths[0])]
+
+    def test_names_differing_in_case_do_not_collide(self, sample_cv_data, temp_dir):
+        """Test that an existing name in another case is not overwritten."""
+        with open(os.path.join(temp_dir, "john_doe.txt"), "w") as f:
+            f.write("existing")
+
+        [path] = write_cv_files([sample_cv_data], temp_dir)
+        assert os.path.basename(path) == "John_Doe_1.txt"
+        with open(os.path.join(temp_dir, "john_doe.txt")) as f:
+            assert f.read() == "existing"
+
+    def test_overwrite_writes_last_of_duplicates(
+        self, sample_cv_data, temp_dir, monkeypatch
+    ):
+        """Test that CVs sharing a file name are written once, the last wins."""
+        written = []
+        write = writer._write_cv_content
+        monkeypatch.setattr(
+            writer,
+            "_write_cv_content",
+            lambda path, person: written.append(path) or write(path, person),
+        )
+        last = dict(sample_cv_data, Hobbies="Chess")
+        paths = write_cv_files([sample_cv_data, last], temp_dir, overwrite=True)
+
+        assert written == paths[:1]
+        with open(paths[0], encoding="utf-8") as f:
+            assert f.read() == render_cv_text(last)
+
+    def test_return_exceptions(self, sample_cv_data, minimal_cv_data, temp_dir):
+        """Test that failing CVs get their exception and the others are written."""
+        persons = [sample_cv_data, {"FirstName": ""}, minimal_cv_data]
+        results = write_cv_files(persons, temp_dir, return_exceptions=True)
+
+        assert isinstance(results[1], ValueError)
+        assert sorted(os.listdir(temp_dir)) == ["Jane_Smith.txt", "John_Doe.txt"]
+        assert [os.path.basename(results[i]) for i in (0, 2)] == [
+            "John_Doe.txt",
+            "Jane_Smith.txt",
+        ]
+
+    def test_missing_name_writes_nothing(self, sample_cv_data, temp_dir):
+        """Test that a CV without a name is rejected before any file is written."""
+        with pytest.raises(ValueError):
+            write_cv_files([sample_cv_data, {"FirstName": ""}], temp_dir)
+        assert os.listdir(temp_dir) == []
+
+    def test_writes_bundle(self, sample_cv_data, minimal_cv_data, temp_dir):
+        """Test writing all CVs into a single bundle."""
+        bundle_path = os.path.join(temp_dir, "cvs.cvbundle")
+        persons = [sample_cv_data, minimal_cv_data, sample_cv_data]
+        ids = write_cv_files(persons, bundle_path=bundle_path)
+
+        assert ids == ["John_Doe", "Jane_Smith", "John_Doe_1"]
+        assert os.listdir(temp_dir) == ["cvs.cvbundle"]
+        with CVBundle(bundle_path) as bundle:
+            assert bundle.ids() == ids
+            assert bundle.text("Jane_Smith") == render_cv_text(minimal_cv_data)
+
+
+class TestRenderCvText:
+    """Tests for the render_cv_text function."""
+
+    def test_matches_written_file(self, sample_cv_data, temp_dir):
+        """Test that the rendered text is what write_cv_file writes."""
+        file_path = write_cv_file(sample_cv_data, output_dir=temp_dir)
+        with open(file_path, encoding="utf-8") as f:
+            assert render_cv_text(sample_cv_data) == f.read()
+
+
 class TestCvToString:
     """Tests for the cv_to_string function."""
 